@@ -1,53 +1,107 @@
+import os
+import tempfile
+import threading
 import time
-from typing import MutableSequence
 from linked_list import *
+from linked_list import bench
 
 ELEMENT_COUNT = 1000
 
 
-def list_performance_check(_list: MutableSequence, _print: bool = False):
-    '''list performance check method'''
-    print(f'{_list.__class__.__name__}, element count {ELEMENT_COUNT}')
-    start = time.time()
-    for i in range(ELEMENT_COUNT):
-        _list.append(i)
-    print(f'\tappend time: {time.time() - start}')
-    if _print:
-        print(f'\t{_list}')
-    start = time.time()
-    _list.reverse()
-    print(f'\treverse time: {time.time() - start}')
-    if _print:
-        print(f'\t{_list}')
-    start = time.time()
-    _list.clear()
-    print(f'\tclear time: {time.time() - start}')
-    if _print:
-        print(f'\t{_list}')
-    tmp = [i for i in range(ELEMENT_COUNT)]
-    start = time.time()
-    _list.extend(tmp)
-    print(f'\textend time: {time.time() - start}')
-    if _print:
-        print(f'\t{_list}')
-    start = time.time()
-    for _i in _list:
-        if _print:
-            print(f'\t{_i}', end=' ')
-    if _print:
-        print()
-    print(f'\tfor time: {time.time() - start}')
+def list_performance_check(_sizes: tuple[int, ...] = (ELEMENT_COUNT, )):
+    '''list performance check method, see python -m linked_list.bench --help for the full sweep'''
+    bench.run(_sizes, repeat=1)
+
+
+list_performance_check()
+
+
+def concurrent_queue_check(_producers: int = 4, _consumers: int = 4):
+    '''concurrent queue stress check method'''
+    print(f'ConcurrentQueue, {_producers} producers, {_consumers} consumers, element count {ELEMENT_COUNT} each')
+    _queue = ConcurrentQueue(maxsize=ELEMENT_COUNT)
+    results = [[] for _ in range(_consumers)]
+
+    def produce(_n: int):
+        for i in range(ELEMENT_COUNT):
+            _queue.put((_n, i))
+
+    def consume(_result: list):
+        while True:
+            item = _queue.get(timeout=10)
+            if item is None:
+                break
+            _result.append(item)
+
+    threads = [threading.Thread(target=produce, args=(_n, )) for _n in range(_producers)]
+    threads += [threading.Thread(target=consume, args=(_r, )) for _r in results]
     start = time.time()
-    for _i in reversed(_list):
-        if _print:
-            print(f'\t{_i}', end=' ')
-    if _print:
-        print()
-    print(f'\tfor reversed time: {time.time() - start}')
-
-
-list_performance_check(list())
-list_performance_check(SinglyLinkedList())
-list_performance_check(DoublyLinkedList())
-list_performance_check(SinglyCircularlyLinkedList())
-list_performance_check(DoublyCircularlyLinkedList())
+    for _t in threads:
+        _t.start()
+    for _t in threads[:_producers]:
+        _t.join()
+    for _ in range(_consumers):
+        _queue.put(None)
+    for _t in threads[_producers:]:
+        _t.join()
+    print(f'\tput and get time: {time.time() - start}')
+    items = sorted(item for _r in results for item in _r)
+    assert items == sorted((_n, i) for _n in range(_producers) for i in range(ELEMENT_COUNT))
+    for _r in results:
+        for _n in range(_producers):
+            ordered = [i for _p, i in _r if _p == _n]
+            assert ordered == sorted(ordered)
+    assert _queue.empty()
+
+
+concurrent_queue_check()
+concurrent_queue_check(16, 16)
+
+
+def reversed_view_check(_count: int = 6):
+    '''reversed view slice check method'''
+    for _cls in (DoublyLinkedList, DoublyCircularlyLinkedList):
+        _list = _cls(range(_count))
+        view = _list.reversed_view()
+        expected = list(range(_count))[::-1]
+        for start in range(-_count - 3, _count + 4):
+            for stop in (None, *range(-_count - 3, _count + 4)):
+                for step in (None, 1, 2, 3, -1, -2):
+                    assert [_n.value for _n in view[start:stop:step]] == expected[start:stop:step], (_cls, start, stop, step)
+        assert list(view[_count:]) == [] and list(view[_count + 3:]) == []
+        del view[_count:]
+        del view[_count + 3:]
+        assert list(_list.values()) == list(range(_count))
+        del view[::2]
+        assert list(_list.values()) == [_v for _v in range(_count) if (_count - 1 - _v) % 2]
+
+
+reversed_view_check()
+
+
+def node_handle_check():
+    '''node handle stability check method, handles outside a deleted or assigned slice keep their values'''
+    for _list in (ArrayLinkedList([1, 2, 3, 4]), ArrayLinkedList([1, 2, 3, 4], typecode='q')):
+        nodes = list(_list.nodes())
+        del _list[0:1]
+        assert [_list.value(_n) for _n in nodes[1:]] == [2, 3, 4]
+        _list[1:2] = [7, 8, 9]
+        assert list(_list) == [2, 7, 8, 9, 4]
+        assert _list.value(nodes[1]) == 2 and _list.value(nodes[3]) == 4
+        del _list[::2]
+        assert list(_list) == [7, 9]
+        _list[::-1] = [5, 6]
+        assert list(_list) == [6, 5] and _list.index(5) == 1 and _list.count(6) == 1
+    with tempfile.TemporaryDirectory() as directory, MmapLinkedList(os.path.join(directory, 'list'), [1, 2, 3, 4]) as _list:
+        nodes = list(_list.nodes())
+        del _list[0:1]
+        assert [_list.value(_n) for _n in nodes[1:]] == [2, 3, 4]
+        heap_size = _list.heap_size
+        _list[1:2] = [7, 8, 9]
+        assert list(_list) == [2, 7, 8, 9, 4] and _list.heap_size - heap_size < 3 * 32
+        assert _list.value(nodes[1]) == 2 and _list.value(nodes[3]) == 4
+        del _list[::2]
+        assert list(_list) == [7, 9]
+
+
+node_handle_check()
@@ -3,6 +3,13 @@ from .singly_linked_list import List as SinglyLinkedList, Node as SinglyLinkedNo
 from .doubly_linked_list import List as DoublyLinkedList, Node as DoublyLinkedNode
 from .singly_circularly_linked_list import List as SinglyCircularlyLinkedList, Node as SinglyCircularlyLinkedNone
 from .doubly_circularly_linked_list import List as DoublyCircularlyLinkedList, Node as DoublyCircularlyLinkedNode
+from .unrolled_linked_list import List as UnrolledLinkedList, Node as UnrolledLinkedNode
+from .array_linked_list import List as ArrayLinkedList, Node as ArrayLinkedNode
+from .mmap_linked_list import List as MmapLinkedList, Node as MmapLinkedNode
+from .cache import LRUCache, LFUCache
+from .concurrent_queue import ConcurrentQueue
+from .async_queue import AsyncLinkedQueue, QueueClosed
+from .sorted_linked_list import SortedLinkedList
 
 SinglyLinkedList.__name__ = 'SinglyLinkedList'
 SinglyLinkedNone.__name__ = 'SinglyLinkedNone'
@@ -12,10 +19,23 @@ SinglyCircularlyLinkedList.__name__ = 'SinglyCircularlyLinkedList'
 SinglyCircularlyLinkedNone.__name__ = 'SinglyCircularlyLinkedNone'
 DoublyCircularlyLinkedList.__name__ = 'DoublyCircularlyLinkedList'
 DoublyCircularlyLinkedNode.__name__ = 'DoublyCircularlyLinkedNode'
+UnrolledLinkedList.__name__ = 'UnrolledLinkedList'
+UnrolledLinkedNode.__name__ = 'UnrolledLinkedNode'
+ArrayLinkedList.__name__ = 'ArrayLinkedList'
+ArrayLinkedNode.__name__ = 'ArrayLinkedNode'
+MmapLinkedList.__name__ = 'MmapLinkedList'
+MmapLinkedNode.__name__ = 'MmapLinkedNode'
 
 __all__ = [
     'SinglyLinkedList', 'SinglyLinkedNone',
     'DoublyLinkedList', 'DoublyLinkedNode',
     'SinglyCircularlyLinkedList', 'SinglyCircularlyLinkedNone',
     'DoublyCircularlyLinkedList', 'DoublyCircularlyLinkedNode',
+    'UnrolledLinkedList', 'UnrolledLinkedNode',
+    'ArrayLinkedList', 'ArrayLinkedNode',
+    'MmapLinkedList', 'MmapLinkedNode',
+    'LRUCache', 'LFUCache',
+    'ConcurrentQueue',
+    'AsyncLinkedQueue', 'QueueClosed',
+    'SortedLinkedList',
 ]
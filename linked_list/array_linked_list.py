@@ -0,0 +1,338 @@
+'''array linked list module'''
+from __future__ import annotations
+import sys
+from array import array
+from typing import Any, Callable, Generic, TypeVar, Iterable, Iterator, MutableSequence, overload, Self
+from .memory import MemoryStats, PayloadCounter
+
+_T = TypeVar('_T')
+
+
+class Node(int):
+    'array linked node class, an integer cursor naming a slot of the list arrays'
+    __slots__ = ()
+
+    def __repr__(self: Self) -> str:
+        return f'{type(self).__name__}({int(self)})'
+
+
+class List(MutableSequence[_T], Generic[_T]):
+    'array linked list class, a doubly linked list stored in parallel value, prev and next arrays'
+    __slots__ = ('typecode', '_values', '_prev', '_next', '_free', '_len', '_version', )
+    debug = False
+
+    @overload
+    def __init__(self: Self[_T], *, typecode: str | None = ...) -> None: ...
+    @overload
+    def __init__(self: Self[_T], __i: Iterable[_T], *, typecode: str | None = ...) -> None: ...
+
+    def __init__(self: Self[_T], _iterable: Iterable[_T] | None = None, *, typecode: str | None = None) -> None:
+        self.typecode = typecode
+        self._version = 0
+        self.clear()
+        if isinstance(_iterable, Iterable):
+            self.extend(_iterable)
+
+    def __reduce__(self: Self[_T]) -> tuple[Callable[..., Self[_T]], tuple[Any, ...]]:
+        return self._restore, (list(self.values()), self.typecode)
+
+    @classmethod
+    def _restore(cls: type[Self[_T]], _values: Iterable[_T], typecode: str | None) -> Self[_T]:
+        'rebuild a list from the flat value sequence written by __reduce__'
+        return cls(_values, typecode=typecode)
+
+    @property
+    def head(self: Self[_T]) -> Node:
+        '''head sentinel node, insert next to it to prepend'''
+        return Node(0)
+
+    @property
+    def tail(self: Self[_T]) -> Node:
+        '''last node, or head when the list is empty'''
+        return Node(self._prev[0])
+
+    def __repr__(self: Self[_T]) -> str:
+        return repr(list(self))
+
+    def __iter__(self: Self[_T]) -> Iterator[_T]:
+        return self.values()
+
+    def __reversed__(self: Self[_T]) -> Iterator[_T]:
+        return self.values(True)
+
+    def values(self: Self[_T], _reverse: bool = False) -> Iterator[_T]:
+        'iterate over values'
+        _values = self._values
+        for slot in self._slots(_reverse):
+            yield _values[slot]
+
+    def nodes(self: Self[_T], _reverse: bool = False) -> Iterator[Node]:
+        'iterate over node handles'
+        for slot in self._slots(_reverse):
+            yield Node(slot)
+
+    def _slots(self: Self[_T], _reverse: bool = False) -> Iterator[int]:
+        version = self._version
+        links = self._prev if _reverse else self._next
+        slot = links[0]
+        while slot:
+            yield slot
+            if self._version != version:
+                raise RuntimeError('list mutated during iteration')
+            slot = links[slot]
+
+    def __sizeof__(self: Self[_T]) -> int:
+        return sys.getsizeof(self._values) + sys.getsizeof(self._prev) + sys.getsizeof(self._next)
+
+    def memory_stats(self: Self[_T], deep: bool = False, unique: bool = True) -> MemoryStats:
+        'return live slot count, the bytes of the slot arrays including the sentinel and free slots, and payload bytes from one pass, typed arrays hold their payload inline'
+        payload = PayloadCounter(deep, unique)
+        if self.typecode is None:
+            for value in self.values():
+                payload.add(value)
+        return MemoryStats(self._len, sys.getsizeof(self._values) + sys.getsizeof(self._prev) + sys.getsizeof(self._next), 0, 0, payload.bytes)
+
+    def __len__(self: Self[_T]) -> int:
+        if self.debug and self._len != self._count():
+            raise AssertionError(f'cached length {self._len} does not match node count {self._count()}')
+        return self._len
+
+    def _count(self: Self[_T]) -> int:
+        'count nodes by walking the whole chain'
+        _len = 0
+        slot = self._next[0]
+        while slot:
+            slot = self._next[slot]
+            _len += 1
+        return _len
+
+    def _slot(self: Self[_T], _index: int) -> int:
+        'return slot at index, walking from whichever end is nearer'
+        _n = self._len
+        if _index < 0:
+            _index += _n
+        if not 0 <= _index < _n:
+            raise IndexError('list index out of range')
+        slot = 0
+        if _index < _n - _index:
+            _next = self._next
+            for _ in range(_index + 1):
+                slot = _next[slot]
+        else:
+            _prev = self._prev
+            for _ in range(_n - _index):
+                slot = _prev[slot]
+        return slot
+
+    def _valid_node(self: Self[_T], _node: Node, _head: bool = False) -> int:
+        if not isinstance(_node, Node):
+            raise TypeError(f'node must be a {Node.__name__}, not {type(_node)}')
+        if not (_head and _node == 0) and not (0 < _node < len(self._prev) and self._prev[_node] >= 0):
+            raise ValueError(f'{_node!r} is not in the list')
+        return int(_node)
+
+    def node(self: Self[_T], _index: int) -> Node:
+        'return node handle at index'
+        return Node(self._slot(_index))
+
+    def value(self: Self[_T], _node: Node) -> _T:
+        'return value held by node'
+        return self._values[self._valid_node(_node)]
+
+    def index(self: Self[_T], _value: _T, _start: int = 0, _stop: int | None = None) -> int:
+        'return first index of value'
+        start, stop, _ = slice(_start, _stop).indices(self._len)
+        _values = self._values
+        for _i, slot in enumerate(self._slots()):
+            if _i >= stop:
+                break
+            if _i >= start:
+                _v = _values[slot]
+                if _v is _value or _v == _value:
+                    return _i
+        raise ValueError(f'{_value!r} is not in list')
+
+    def count(self: Self[_T], _value: Any) -> int:
+        'return number of occurrences of value, in one walk'
+        _values = self._values
+        return sum(1 for slot in self._slots() if _values[slot] is _value or _values[slot] == _value)
+
+    @overload
+    def __getitem__(self: Self[_T], __i: int) -> _T: ...
+    @overload
+    def __getitem__(self: Self[_T], __s: slice) -> Self[_T]: ...
+
+    def __getitem__(self: Self[_T], _index: int | slice) -> _T | Self[_T]:
+        if isinstance(_index, int):
+            return self._values[self._slot(_index)]
+        elif isinstance(_index, slice):
+            return type(self)(list(self)[_index], typecode=self.typecode)
+        else:
+            raise TypeError(f'index must be integers or slices, not {type(_index)}')
+
+    @overload
+    def __setitem__(self: Self[_T], __i: int, __v: _T) -> None: ...
+    @overload
+    def __setitem__(self: Self[_T], __s: slice, __o: Iterable[_T]) -> None: ...
+
+    def __setitem__(self: Self[_T], _index: int | slice, _value: _T | Iterable[_T]) -> None:
+        if isinstance(_index, int):
+            self._values[self._slot(_index)] = _value
+        elif isinstance(_index, slice):
+            self._set_slice(_index, _value)
+        else:
+            raise TypeError(f'index must be integers or slices, not {type(_index)}')
+
+    @overload
+    def __delitem__(self: Self[_T], __i: int) -> None: ...
+    @overload
+    def __delitem__(self: Self[_T], __s: slice) -> None: ...
+
+    def __delitem__(self: Self[_T], _index: int | slice) -> None:
+        if isinstance(_index, int):
+            self._unlink(self._slot(_index))
+        elif isinstance(_index, slice):
+            for slot in self._slice_slots(range(*_index.indices(self._len))):
+                self._unlink(slot)
+        else:
+            raise TypeError(f'index must be integers or slices, not {type(_index)}')
+
+    def _slice_slots(self: Self[_T], _range: range) -> list[int]:
+        'return the slots of a range of indexes in one walk, in the order of the range'
+        if not _range:
+            return []
+        ascending = _range if 0 < _range.step else _range[::-1]
+        _next = self._next
+        slot = self._slot(ascending[0])
+        slots = [slot]
+        for _ in range(len(ascending) - 1):
+            for _ in range(ascending.step):
+                slot = _next[slot]
+            slots.append(slot)
+        if _range.step < 0:
+            slots.reverse()
+        return slots
+
+    def _set_slice(self: Self[_T], _index: slice, _value: Iterable[_T]) -> None:
+        'assign a slice in place, unlinking the replaced slots and linking the new values, so handles outside the slice keep their values'
+        if not isinstance(_value, Iterable):
+            raise TypeError('can only assign an iterable')
+        values = list(_value) if self.typecode is None else array(self.typecode, _value)
+        start, stop, step = _index.indices(self._len)
+        if step == 1:
+            prev = self._slot(start - 1) if start else 0
+            for _ in range(max(start, stop) - start):
+                self._unlink(self._next[prev])
+            for value in values:
+                prev = self._link_after(prev, value)
+            self._version += 1
+            return
+        _range = range(start, stop, step)
+        if len(values) != len(_range):
+            raise ValueError(f'attempt to assign sequence of size {len(values)} to extended slice of size {len(_range)}')
+        for slot, value in zip(self._slice_slots(_range), values):
+            self._values[slot] = value
+
+    def _unlink(self: Self[_T], _slot: int) -> None:
+        _prev, _next = self._prev, self._next
+        _next[_prev[_slot]] = _next[_slot]
+        _prev[_next[_slot]] = _prev[_slot]
+        _prev[_slot] = _next[_slot] = -1 - self._free
+        if self.typecode is None:
+            self._values[_slot] = None
+        self._free = _slot
+        self._len -= 1
+        self._version += 1
+
+    @overload
+    def insert(self: Self[_T], __i: int, __v: _T) -> None: ...
+    @overload
+    def insert(self: Self[_T], __n: Node, __v: _T) -> None: ...
+
+    def insert(self: Self[_T], _index: int | Node, _value: _T) -> None:
+        'insert value to index or next to node'
+        if isinstance(_index, Node):
+            prev = self._valid_node(_index, True)
+        elif isinstance(_index, int):
+            _index = max(_index + self._len, 0) if _index < 0 else min(_index, self._len)
+            prev = self._slot(_index - 1) if _index else 0
+        else:
+            raise IndexError('index must be integers or a node')
+        self._link_after(prev, _value)
+        self._version += 1
+
+    def _link_after(self: Self[_T], _prev: int, _value: _T) -> int:
+        'store value in a free or new slot next to prev and return the slot, leaving the version to the caller'
+        if self._free:
+            slot = self._free
+            self._values[slot] = _value
+            self._free = -1 - self._next[slot]
+        else:
+            slot = len(self._next)
+            self._values.append(_value)
+            self._prev.append(0)
+            self._next.append(0)
+        _next = self._next[_prev]
+        self._prev[slot], self._next[slot] = _prev, _next
+        self._next[_prev] = self._prev[_next] = slot
+        self._len += 1
+        return slot
+
+    def append(self: Self[_T], _value: _T) -> None:
+        'append value to the end of the sequence'
+        self.insert(Node(self._prev[0]), _value)
+
+    def extend(self: Self[_T], _values: Iterable[_T]) -> None:
+        'append every value of the iterable, linking them in bulk'
+        batch = list(_values) if self.typecode is None else array(self.typecode, _values)
+        start = len(self._next)
+        self._values.extend(batch)
+        end = len(self._values)
+        if start == end:
+            return
+        last = self._prev[0]
+        self._prev.extend(range(start - 1, end - 1))
+        self._next.extend(range(start + 1, end + 1))
+        self._prev[start] = last
+        self._next[last] = start
+        self._next[end - 1] = 0
+        self._prev[0] = end - 1
+        self._len += end - start
+        self._version += 1
+
+    @overload
+    def remove(self: Self[_T], __v: _T) -> None: ...
+    @overload
+    def remove(self: Self[_T], __n: Node) -> None: ...
+
+    def remove(self: Self[_T], _value: _T | Node) -> None:
+        'remove first occurrence of value or node'
+        if isinstance(_value, Node):
+            self._unlink(self._valid_node(_value))
+            return
+        for slot in self._slots():
+            _v = self._values[slot]
+            if _v is _value or _v == _value:
+                self._unlink(slot)
+                return
+        raise ValueError(f'{_value!r} is not in list')
+
+    def clear(self: Self[_T]) -> None:
+        'remove all values and release the slot arrays'
+        self._values: MutableSequence[Any] = [None] if self.typecode is None else array(self.typecode, [0])
+        self._prev = array('q', [0])
+        self._next = array('q', [0])
+        self._free = 0
+        self._len = 0
+        self._version += 1
+
+    def compact(self: Self[_T]) -> None:
+        'renumber live slots in list order and drop free slots, invalidating node handles'
+        values = list(self)
+        self.clear()
+        self.extend(values)
+
+    def reverse(self: Self[_T]) -> None:
+        'reverse the list'
+        self._prev, self._next = self._next, self._prev
+        self._version += 1
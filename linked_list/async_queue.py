@@ -0,0 +1,159 @@
+'''asyncio linked queue module'''
+from __future__ import annotations
+import asyncio
+from typing import AsyncIterator, Generic, TypeVar, Self
+from .doubly_linked_list import List as DoublyLinkedList
+
+_T = TypeVar('_T')
+
+
+class QueueClosed(Exception):
+    'raised by get on a closed and drained queue, and by put on a closed queue'
+
+
+class AsyncLinkedQueue(Generic[_T]):
+    'asyncio linked queue class, keeps items in a doubly linked list and waiters in hashed doubly linked lists'
+    __slots__ = ('maxsize', '_items', '_getters', '_putters', '_unfinished', '_finished', '_closed', )
+
+    def __init__(self: Self[_T], maxsize: int = 0) -> None:
+        self.maxsize = maxsize
+        self._items: DoublyLinkedList[_T] = DoublyLinkedList()
+        self._getters: DoublyLinkedList[asyncio.Future] = DoublyLinkedList(hashed=True)
+        self._putters: DoublyLinkedList[asyncio.Future] = DoublyLinkedList(hashed=True)
+        self._unfinished = 0
+        self._finished = asyncio.Event()
+        self._finished.set()
+        self._closed = False
+
+    def __repr__(self: Self[_T]) -> str:
+        return f'{type(self).__name__}(maxsize={self.maxsize}, qsize={self.qsize()})'
+
+    def __aiter__(self: Self[_T]) -> AsyncIterator[_T]:
+        return self
+
+    async def __anext__(self: Self[_T]) -> _T:
+        try:
+            return await self.get()
+        except QueueClosed:
+            raise StopAsyncIteration from None
+
+    def qsize(self: Self[_T]) -> int:
+        'return the number of queued items'
+        return len(self._items)
+
+    def empty(self: Self[_T]) -> bool:
+        'return True if the queue is empty'
+        return not self._items
+
+    def full(self: Self[_T]) -> bool:
+        'return True if the queue holds maxsize items'
+        return 0 < self.maxsize <= len(self._items)
+
+    @property
+    def closed(self: Self[_T]) -> bool:
+        '''True once close was called'''
+        return self._closed
+
+    @staticmethod
+    def _wakeup_next(_waiters: DoublyLinkedList[asyncio.Future]) -> None:
+        while _waiters:
+            waiter = _waiters.popleft().value
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    async def _wait(self: Self[_T], _waiters: DoublyLinkedList[asyncio.Future]) -> None:
+        'park the current task in waiters until it is woken'
+        waiter = asyncio.get_running_loop().create_future()
+        _waiters.append(waiter)
+        try:
+            await waiter
+        except BaseException:
+            waiter.cancel()
+            if waiter in _waiters:
+                _waiters.remove(waiter)
+            elif not waiter.cancelled():
+                self._wakeup_next(_waiters)
+            raise
+
+    async def put(self: Self[_T], _item: _T) -> None:
+        'put item into the queue, waiting while it is full'
+        while self.full() and not self._closed:
+            await self._wait(self._putters)
+        self.put_nowait(_item)
+
+    def put_nowait(self: Self[_T], _item: _T) -> None:
+        'put item into the queue without waiting, raise asyncio.QueueFull when it is full'
+        if self._closed:
+            raise QueueClosed('queue is closed')
+        if self.full():
+            raise asyncio.QueueFull
+        self._items.append(_item)
+        self._unfinished += 1
+        self._finished.clear()
+        self._wakeup_next(self._getters)
+
+    async def get(self: Self[_T]) -> _T:
+        'remove and return an item, waiting while the queue is empty'
+        while self.empty():
+            if self._closed:
+                raise QueueClosed('queue is closed')
+            await self._wait(self._getters)
+        return self.get_nowait()
+
+    def get_nowait(self: Self[_T]) -> _T:
+        'remove and return an item without waiting, raise asyncio.QueueEmpty when there is none'
+        if self.empty():
+            if self._closed:
+                raise QueueClosed('queue is closed')
+            raise asyncio.QueueEmpty
+        item = self._items.popleft().value
+        self._wakeup_next(self._putters)
+        return item
+
+    async def get_many(self: Self[_T], _count: int | None = None) -> DoublyLinkedList[_T]:
+        'wait for at least one item, then detach up to count items as a list, a full drain swaps the whole chain out in O(1)'
+        while self.empty():
+            if self._closed:
+                raise QueueClosed('queue is closed')
+            await self._wait(self._getters)
+        return self.get_many_nowait(_count)
+
+    def get_many_nowait(self: Self[_T], _count: int | None = None) -> DoublyLinkedList[_T]:
+        'detach up to count items, or all of them, as a list without waiting, raise asyncio.QueueEmpty or QueueClosed like get_nowait when there is none'
+        if _count is not None and _count < 1:
+            raise ValueError('count must be positive')
+        if self.empty():
+            if self._closed:
+                raise QueueClosed('queue is closed')
+            raise asyncio.QueueEmpty
+        if _count is None or len(self._items) <= _count:
+            batch, self._items = self._items, DoublyLinkedList()
+        else:
+            batch = self._items
+            self._items = batch.split_after(batch[_count - 1])
+        for _ in range(len(batch)):
+            if not self._putters:
+                break
+            self._wakeup_next(self._putters)
+        return batch
+
+    def task_done(self: Self[_T], _count: int = 1) -> None:
+        'mark count fetched items as processed'
+        if self._unfinished < _count:
+            raise ValueError('task_done() called too many times')
+        self._unfinished -= _count
+        if self._unfinished == 0:
+            self._finished.set()
+
+    async def join(self: Self[_T]) -> None:
+        'wait until every item put into the queue was marked done'
+        if self._unfinished > 0:
+            await self._finished.wait()
+
+    def close(self: Self[_T]) -> None:
+        'refuse new items and wake every waiter, getters stop once the queue is drained'
+        self._closed = True
+        for waiters in (self._getters, self._putters):
+            while waiters:
+                self._wakeup_next(waiters)
@@ -0,0 +1,342 @@
+'''linked list benchmark module, run with python -m linked_list.bench'''
+from __future__ import annotations
+import argparse
+import collections
+import datetime
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Iterable, NamedTuple
+from . import (
+    SinglyLinkedList, DoublyLinkedList, SinglyCircularlyLinkedList, DoublyCircularlyLinkedList,
+    UnrolledLinkedList, ArrayLinkedList,
+)
+
+SIZES = [10, 100, 1_000, 10_000, 100_000, 1_000_000]
+
+CLASSES: dict[str, Callable[[Iterable[int]], Any]] = {
+    'list': list,
+    'deque': collections.deque,
+    'SinglyLinkedList': SinglyLinkedList,
+    'DoublyLinkedList': DoublyLinkedList,
+    'DoublyLinkedList[indexed]': lambda _i: DoublyLinkedList(_i, indexed=True),
+    'DoublyLinkedList[hashed]': lambda _i: DoublyLinkedList(_i, hashed=True),
+    'SinglyCircularlyLinkedList': SinglyCircularlyLinkedList,
+    'DoublyCircularlyLinkedList': DoublyCircularlyLinkedList,
+    'UnrolledLinkedList': UnrolledLinkedList,
+    'ArrayLinkedList': ArrayLinkedList,
+}
+
+_CHUNK = list(range(100))
+
+
+def _any(_container: Any) -> bool:
+    return True
+
+
+class Case(NamedTuple):
+    'benchmark case tuple, setup prepares a container untimed and returns a batch that does count operations and returns how many units they covered, destructive cases change the container and run on a fresh one, supports tells whether a container can run the case'
+    name: str
+    setup: Callable[[Any, int], Callable[[int], int]]
+    destructive: bool = False
+    supports: Callable[[Any], bool] = _any
+
+
+class Result(NamedTuple):
+    'benchmark result tuple, one line of the json report'
+    cls: str
+    case: str
+    size: int
+    ns: float
+    unit: str
+
+
+_NODE_LISTS = (SinglyLinkedList, DoublyLinkedList, SinglyCircularlyLinkedList, DoublyCircularlyLinkedList)
+
+
+def _has_nodes(_container: Any) -> bool:
+    return isinstance(_container, (ArrayLinkedList, *_NODE_LISTS))
+
+
+def _slices(_container: Any) -> bool:
+    return not isinstance(_container, collections.deque)
+
+
+def _node_at(_container: Any, _index: int) -> Any:
+    'return a node handle at index'
+    if isinstance(_container, ArrayLinkedList):
+        return _container.node(_index)
+    return _container[_index]
+
+
+def _append(_c: Any, _n: int) -> Callable[[int], int]:
+    def batch(_count: int) -> int:
+        for _ in range(_count):
+            _c.append(0)
+        return _count
+    return batch
+
+
+def _extend(_c: Any, _n: int) -> Callable[[int], int]:
+    def batch(_count: int) -> int:
+        for _ in range(_count):
+            _c.extend(_CHUNK)
+        return _count * len(_CHUNK)
+    return batch
+
+
+def _position(_where: str, _n: int) -> int:
+    return {'head': 0, 'middle': _n // 2, 'tail': _n - 1}[_where]
+
+
+def _get(_where: str) -> Callable[[Any, int], Callable[[int], int]]:
+    def setup(_c: Any, _n: int) -> Callable[[int], int]:
+        i = _position(_where, _n)
+
+        def batch(_count: int) -> int:
+            for _ in range(_count):
+                _c[i]
+            return _count
+        return batch
+    return setup
+
+
+def _set(_where: str) -> Callable[[Any, int], Callable[[int], int]]:
+    def setup(_c: Any, _n: int) -> Callable[[int], int]:
+        i = _position(_where, _n)
+
+        def batch(_count: int) -> int:
+            for _ in range(_count):
+                _c[i] = 0
+            return _count
+        return batch
+    return setup
+
+
+def _delete(_where: str) -> Callable[[Any, int], Callable[[int], int]]:
+    def setup(_c: Any, _n: int) -> Callable[[int], int]:
+        _c[_position(_where, _n)]
+
+        def batch(_count: int) -> int:
+            for _ in range(_count):
+                del _c[{'head': 0, 'middle': len(_c) // 2, 'tail': -1}[_where]]
+            return _count
+        return batch
+    return setup
+
+
+def _insert_node(_c: Any, _n: int) -> Callable[[int], int]:
+    node = _node_at(_c, _n // 2)
+
+    def batch(_count: int) -> int:
+        for _ in range(_count):
+            _c.insert(node, 0)
+        return _count
+    return batch
+
+
+def _iterate(_c: Any, _n: int) -> Callable[[int], int]:
+    def batch(_count: int) -> int:
+        for _ in range(_count):
+            for _ in _c:
+                pass
+        return _count * _n
+    return batch
+
+
+def _iterate_reversed(_c: Any, _n: int) -> Callable[[int], int]:
+    def batch(_count: int) -> int:
+        for _ in range(_count):
+            for _ in reversed(_c):
+                pass
+        return _count * _n
+    return batch
+
+
+def _reverse(_c: Any, _n: int) -> Callable[[int], int]:
+    def batch(_count: int) -> int:
+        for _ in range(_count):
+            _c.reverse()
+        return _count * _n
+    return batch
+
+
+def _slice(_c: Any, _n: int) -> Callable[[int], int]:
+    def batch(_count: int) -> int:
+        for _ in range(_count):
+            _c[_n // 4:3 * _n // 4]
+        return _count * (3 * _n // 4 - _n // 4)
+    return batch
+
+
+def _contains(_c: Any, _n: int) -> Callable[[int], int]:
+    def batch(_count: int) -> int:
+        for _ in range(_count):
+            (_n - 1) in _c
+        return _count
+    return batch
+
+
+CASES = [
+    Case('append', _append, True),
+    Case('extend', _extend, True),
+    *[Case(f'get_{_w}', _get(_w)) for _w in ('head', 'middle', 'tail')],
+    *[Case(f'set_{_w}', _set(_w), True) for _w in ('head', 'middle', 'tail')],
+    *[Case(f'del_{_w}', _delete(_w), True) for _w in ('head', 'middle', 'tail')],
+    Case('insert_node', _insert_node, True, _has_nodes),
+    Case('iter', _iterate),
+    Case('reversed', _iterate_reversed),
+    Case('reverse', _reverse, True),
+    Case('slice', _slice, supports=_slices),
+    Case('contains', _contains),
+]
+
+_UNITS = {'extend': 'ns/element', 'iter': 'ns/element', 'reversed': 'ns/element', 'reverse': 'ns/element', 'slice': 'ns/element'}
+
+
+def measure(_factory: Callable[[Iterable[int]], Any], _case: Case, _size: int, repeat: int = 3, min_time: float = 0.02, max_count: int = 100_000, _shared: Any = None) -> float | None:
+    'return the best ns per unit of a case over repeat runs, None when the container does not support it'
+    values = range(_size)
+    best = None
+    for _ in range(repeat):
+        container = _factory(values) if _case.destructive or _shared is None else _shared
+        if not _case.supports(container):
+            return None
+        batch = _case.setup(container, _size)
+        start = time.perf_counter_ns()
+        batch(1)
+        elapsed = time.perf_counter_ns() - start
+        count = int(min(max(min_time * 1e9 / max(elapsed, 1), 1), max_count))
+        if _case.destructive:
+            if _case.name.startswith('del_'):
+                count = max(min(count, _size // 2), 1)
+            container = _factory(values)
+            batch = _case.setup(container, _size)
+        start = time.perf_counter_ns()
+        units = batch(count)
+        elapsed = time.perf_counter_ns() - start
+        per_unit = elapsed / max(units, 1)
+        best = per_unit if best is None else min(best, per_unit)
+    return best
+
+
+def memory_per_element(_factory: Callable[[Iterable[int]], Any], _size: int) -> float:
+    'return the bytes allocated per element while building a container from prebuilt values'
+    values = list(range(_size))
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        container = _factory(values)
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del container
+    return (after - before) / max(_size, 1)
+
+
+def run(sizes: Iterable[int] = SIZES, classes: Iterable[str] | None = None, cases: Iterable[str] | None = None, repeat: int = 3, min_time: float = 0.02, verbose: bool = True) -> list[Result]:
+    'run every case for every class and size and return the results'
+    classes = list(CLASSES) if classes is None else list(classes)
+    selected = [_c for _c in CASES if cases is None or _c.name in cases]
+    results = []
+    for size in sizes:
+        for name in classes:
+            factory = CLASSES[name]
+            shared = factory(range(size))
+            for case in selected:
+                if size < 2 and case.name.startswith('del_'):
+                    continue
+                ns = measure(factory, case, size, repeat, min_time, _shared=shared)
+                if ns is not None:
+                    results.append(Result(name, case.name, size, ns, _UNITS.get(case.name, 'ns/op')))
+            if cases is None or 'memory' in cases:
+                results.append(Result(name, 'memory', size, memory_per_element(factory, size), 'bytes/element'))
+            if verbose:
+                print(f'{size:>9} {name}', file=sys.stderr)
+        if verbose:
+            print(format_table([_r for _r in results if _r.size == size]))
+    return results
+
+
+def format_table(_results: list[Result]) -> str:
+    'format results of one size as a case by class table'
+    classes = list(dict.fromkeys(_r.cls for _r in _results))
+    case_names = list(dict.fromkeys(_r.case for _r in _results))
+    cells = {(_r.cls, _r.case): _r.ns for _r in _results}
+    width = max([len(_c) for _c in classes] + [10])
+    lines = [f'size {_results[0].size}' if _results else 'no results']
+    lines.append(' ' * 12 + ''.join(f'{_c:>{width + 1}}' for _c in classes))
+    for case in case_names:
+        row = ''.join(f'{cells[(_c, case)]:>{width + 1}.1f}' if (_c, case) in cells else f'{"-":>{width + 1}}' for _c in classes)
+        lines.append(f'{case:<12}{row}')
+    return '\n'.join(lines)
+
+
+def dump(_results: list[Result], _path: str) -> None:
+    'write results with enough metadata to compare runs across versions'
+    report = {
+        'meta': {
+            'date': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            'python': sys.version,
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'machine': platform.machine(),
+        },
+        'results': [_r._asdict() for _r in _results],
+    }
+    with open(_path, 'w', encoding='utf-8') as file:
+        json.dump(report, file, indent=1)
+
+
+def load(_path: str) -> list[Result]:
+    'read results written by dump'
+    with open(_path, encoding='utf-8') as file:
+        return [Result(**_r) for _r in json.load(file)['results']]
+
+
+def compare(_baseline: list[Result], _results: list[Result], threshold: float = 1.2) -> tuple[list[tuple[Result, float]], list[tuple[Result, float]]]:
+    'return results slower and faster than the baseline by more than threshold, with their ratios'
+    old = {(_r.cls, _r.case, _r.size): _r.ns for _r in _baseline}
+    slower, faster = [], []
+    for result in _results:
+        base = old.get((result.cls, result.case, result.size))
+        if not base:
+            continue
+        ratio = result.ns / base
+        if threshold < ratio:
+            slower.append((result, ratio))
+        elif ratio < 1 / threshold:
+            faster.append((result, ratio))
+    return slower, faster
+
+
+def main(_argv: list[str] | None = None) -> int:
+    'command line entry point, exits with 1 when a comparison finds regressions'
+    parser = argparse.ArgumentParser(prog='python -m linked_list.bench', description='benchmark the linked lists against list and collections.deque')
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES)
+    parser.add_argument('--classes', nargs='+', choices=list(CLASSES), default=None)
+    parser.add_argument('--cases', nargs='+', choices=[_c.name for _c in CASES] + ['memory'], default=None)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--min-time', type=float, default=0.02, help='seconds each timed batch should last')
+    parser.add_argument('--output', '-o', help='write results as json to this path')
+    parser.add_argument('--compare', '-c', help='compare with results from an earlier --output')
+    parser.add_argument('--threshold', type=float, default=1.2, help='ratio above which a case counts as a regression')
+    parser.add_argument('--quiet', '-q', action='store_true')
+    args = parser.parse_args(_argv)
+    results = run(args.sizes, args.classes, args.cases, args.repeat, args.min_time, not args.quiet)
+    if args.output:
+        dump(results, args.output)
+    if args.compare:
+        slower, faster = compare(load(args.compare), results, args.threshold)
+        for title, rows in (('regressions', slower), ('improvements', faster)):
+            print(f'{title}: {len(rows)}')
+            for result, ratio in rows:
+                print(f'\t{result.cls} {result.case} size {result.size}: {ratio:.2f}x')
+        return 1 if slower else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,333 @@
+'''linked list cache module'''
+from __future__ import annotations
+import abc
+import functools
+import threading
+import time
+from typing import Any, Callable, Generic, Hashable, Iterator, MutableMapping, NamedTuple, TypeVar, Self
+from .doubly_linked_list import List as DoublyLinkedList, Node as DoublyLinkedNode
+
+_K = TypeVar('_K', bound=Hashable)
+_V = TypeVar('_V')
+
+_MISSING = object()
+
+
+class CacheInfo(NamedTuple):
+    'cache info tuple, laid out like the one of functools.lru_cache'
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
+
+class CacheStats(NamedTuple):
+    'cache stats tuple'
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+
+
+class Entry(Generic[_K, _V]):
+    'cache entry class, the value held by every node of a cache'
+    __slots__ = ('key', 'value', 'weight', 'expires', 'bucket', )
+
+    def __init__(self: Self, _key: _K, _value: _V, _weight: int, _expires: float | None) -> None:
+        self.key = _key
+        self.value = _value
+        self.weight = _weight
+        self.expires = _expires
+        self.bucket: DoublyLinkedNode[Bucket] | None = None
+
+    def __repr__(self: Self) -> str:
+        return f'{type(self).__name__}({self.key!r}, {self.value!r})'
+
+
+class Bucket:
+    'frequency bucket class, holds the entries of a lfu cache that were used the same number of times'
+    __slots__ = ('count', 'entries', )
+
+    def __init__(self: Self, _count: int) -> None:
+        self.count = _count
+        self.entries: DoublyLinkedList[Entry] = DoublyLinkedList()
+
+    def __repr__(self: Self) -> str:
+        return f'{type(self).__name__}({self.count}, {[_e.key for _e in self.entries.values()]!r})'
+
+
+class Cache(MutableMapping[_K, _V], Generic[_K, _V]):
+    'cache base class, maps keys to linked list nodes and evicts by the order of those nodes'
+    __slots__ = ('capacity', 'ttl', 'weigher', 'timer', 'hits', 'misses', 'evictions', 'expirations', '_map', '_weight', )
+
+    def __init__(self: Self, capacity: int | None = 128, *, ttl: float | None = None, weigher: Callable[[_V], int] | None = None, timer: Callable[[], float] = time.monotonic) -> None:
+        if capacity is not None and capacity < 0:
+            raise ValueError('capacity must not be negative')
+        self.capacity = capacity
+        self.ttl = ttl
+        self.weigher = weigher
+        self.timer = timer
+        self.hits = self.misses = self.evictions = self.expirations = 0
+        self._map: dict[_K, DoublyLinkedNode[Entry[_K, _V]]] = {}
+        self._weight = 0
+
+    def __repr__(self: Self) -> str:
+        return f'{type(self).__name__}({ {_e.key: _e.value for _e in self._entries()}!r})'
+
+    def __len__(self: Self) -> int:
+        return len(self._map)
+
+    def __iter__(self: Self) -> Iterator[_K]:
+        for entry in list(self._entries()):
+            yield entry.key
+
+    def __contains__(self: Self, _key: object) -> bool:
+        node = self._map.get(_key)
+        return node is not None and not self._expired(node.value)
+
+    def __getitem__(self: Self, _key: _K) -> _V:
+        value = self.get(_key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(_key)
+        return value
+
+    def __setitem__(self: Self, _key: _K, _value: _V) -> None:
+        self.put(_key, _value)
+
+    def __delitem__(self: Self, _key: _K) -> None:
+        self._drop(self._map[_key])
+
+    @property
+    def weight(self: Self) -> int:
+        '''total weight of the cached values'''
+        return self._weight
+
+    def _expired(self: Self, _entry: Entry[_K, _V]) -> bool:
+        return _entry.expires is not None and _entry.expires <= self.timer()
+
+    def _drop(self: Self, _node: DoublyLinkedNode[Entry[_K, _V]]) -> None:
+        entry = _node.value
+        del self._map[entry.key]
+        self._weight -= entry.weight
+        self._unlink(_node)
+
+    def get(self: Self, _key: _K, _default: Any = None) -> _V | Any:
+        'return the value of key and mark it used, or default on a miss'
+        node = self._map.get(_key)
+        if node is None:
+            self.misses += 1
+            return _default
+        if self._expired(node.value):
+            self._drop(node)
+            self.expirations += 1
+            self.misses += 1
+            return _default
+        self.hits += 1
+        self._touch(node)
+        return node.value.value
+
+    def peek(self: Self, _key: _K, _default: Any = None) -> _V | Any:
+        'return the value of key without marking it used or counting stats'
+        node = self._map.get(_key)
+        if node is None or self._expired(node.value):
+            return _default
+        return node.value.value
+
+    def put(self: Self, _key: _K, _value: _V) -> None:
+        'store value under key, evicting entries until it fits'
+        weight = 1 if self.weigher is None else self.weigher(_value)
+        node = self._map.get(_key)
+        if node is not None:
+            self._drop(node)
+        if self.capacity is not None and weight > self.capacity:
+            return
+        while self.capacity is not None and self._weight + weight > self.capacity:
+            self._drop(self._victim())
+            self.evictions += 1
+        expires = None if self.ttl is None else self.timer() + self.ttl
+        self._map[_key] = self._link(Entry(_key, _value, weight, expires))
+        self._weight += weight
+
+    def expire(self: Self) -> int:
+        'drop every expired entry and return how many were dropped'
+        now = self.timer()
+        expired = [self._map[_e.key] for _e in self._entries() if _e.expires is not None and _e.expires <= now]
+        for node in expired:
+            self._drop(node)
+        self.expirations += len(expired)
+        return len(expired)
+
+    def clear(self: Self) -> None:
+        'drop every entry, keeping the stats'
+        self._map.clear()
+        self._weight = 0
+        self._clear()
+
+    def info(self: Self) -> CacheInfo:
+        'return hits, misses, capacity and size like functools.lru_cache'
+        return CacheInfo(self.hits, self.misses, self.capacity, len(self._map))
+
+    def stats(self: Self) -> CacheStats:
+        'return hit, miss, eviction and expiration counters'
+        return CacheStats(self.hits, self.misses, self.evictions, self.expirations)
+
+    @abc.abstractmethod
+    def _entries(self: Self) -> Iterator[Entry[_K, _V]]:
+        'iterate over entries from the next victim on'
+
+    @abc.abstractmethod
+    def _link(self: Self, _entry: Entry[_K, _V]) -> DoublyLinkedNode[Entry[_K, _V]]:
+        'link a new entry and return its node'
+
+    @abc.abstractmethod
+    def _unlink(self: Self, _node: DoublyLinkedNode[Entry[_K, _V]]) -> None:
+        'unlink the node of an entry that leaves the cache'
+
+    @abc.abstractmethod
+    def _touch(self: Self, _node: DoublyLinkedNode[Entry[_K, _V]]) -> None:
+        'record a use of the entry held by node'
+
+    @abc.abstractmethod
+    def _victim(self: Self) -> DoublyLinkedNode[Entry[_K, _V]]:
+        'return the node of the entry to evict next'
+
+    @abc.abstractmethod
+    def _clear(self: Self) -> None:
+        'unlink every entry'
+
+
+class LRUCache(Cache[_K, _V]):
+    'least recently used cache class, keeps entries in a doubly linked list ordered by last use'
+    __slots__ = ('_list', )
+
+    def __init__(self: Self, capacity: int | None = 128, *, ttl: float | None = None, weigher: Callable[[_V], int] | None = None, timer: Callable[[], float] = time.monotonic) -> None:
+        super().__init__(capacity, ttl=ttl, weigher=weigher, timer=timer)
+        self._list: DoublyLinkedList[Entry[_K, _V]] = DoublyLinkedList()
+
+    def _entries(self: Self) -> Iterator[Entry[_K, _V]]:
+        return self._list.values()
+
+    def _link(self: Self, _entry: Entry[_K, _V]) -> DoublyLinkedNode[Entry[_K, _V]]:
+        return self._list.insert_before(self._list.tail, _entry)
+
+    def _unlink(self: Self, _node: DoublyLinkedNode[Entry[_K, _V]]) -> None:
+        self._list.remove_node(_node)
+
+    def _touch(self: Self, _node: DoublyLinkedNode[Entry[_K, _V]]) -> None:
+        self._list.move_to_end(_node)
+
+    def _victim(self: Self) -> DoublyLinkedNode[Entry[_K, _V]]:
+        return self._list.head._next
+
+    def _clear(self: Self) -> None:
+        self._list.clear()
+
+
+class LFUCache(Cache[_K, _V]):
+    'least frequently used cache class, keeps a doubly linked list of use count buckets, ties go to the least recently used'
+    __slots__ = ('_buckets', )
+
+    def __init__(self: Self, capacity: int | None = 128, *, ttl: float | None = None, weigher: Callable[[_V], int] | None = None, timer: Callable[[], float] = time.monotonic) -> None:
+        super().__init__(capacity, ttl=ttl, weigher=weigher, timer=timer)
+        self._buckets: DoublyLinkedList[Bucket] = DoublyLinkedList()
+
+    def _entries(self: Self) -> Iterator[Entry[_K, _V]]:
+        for bucket in self._buckets.values():
+            yield from bucket.entries.values()
+
+    def _add(self: Self, _entry: Entry[_K, _V], _prev: DoublyLinkedNode[Bucket] | DoublyLinkedNode[None], _count: int) -> DoublyLinkedNode[Entry[_K, _V]]:
+        'link entry into the bucket of count that follows prev, creating the bucket when missing'
+        bucket = _prev._next
+        if bucket is self._buckets.tail or bucket.value.count != _count:
+            bucket = self._buckets.insert_after(_prev, Bucket(_count))
+        _entry.bucket = bucket
+        entries = bucket.value.entries
+        return entries.insert_before(entries.tail, _entry)
+
+    def _link(self: Self, _entry: Entry[_K, _V]) -> DoublyLinkedNode[Entry[_K, _V]]:
+        return self._add(_entry, self._buckets.head, 1)
+
+    def _unlink(self: Self, _node: DoublyLinkedNode[Entry[_K, _V]]) -> None:
+        bucket = _node.value.bucket
+        bucket.value.entries.remove_node(_node)
+        if not bucket.value.entries:
+            self._buckets.remove_node(bucket)
+
+    def _touch(self: Self, _node: DoublyLinkedNode[Entry[_K, _V]]) -> None:
+        entry = _node.value
+        bucket = entry.bucket
+        count = bucket.value.count + 1
+        bucket.value.entries.remove_node(_node)
+        self._map[entry.key] = self._add(entry, bucket, count)
+        if not bucket.value.entries:
+            self._buckets.remove_node(bucket)
+
+    def _victim(self: Self) -> DoublyLinkedNode[Entry[_K, _V]]:
+        return self._buckets.head._next.value.entries.head._next
+
+    def _clear(self: Self) -> None:
+        self._buckets.clear()
+
+    def count(self: Self, _key: _K) -> int:
+        'return how many times key was used since it was stored'
+        return self._map[_key].value.bucket.value.count
+
+
+def _make_key(_args: tuple, _kwds: dict, _typed: bool) -> Hashable:
+    key = _args
+    if _kwds:
+        key += (_MISSING, ) + tuple(_kwds.items())
+    if _typed:
+        key += tuple(type(_v) for _v in _args) + tuple(type(_v) for _v in _kwds.values())
+    elif len(key) == 1 and type(key[0]) in {int, str}:
+        return key[0]
+    return key
+
+
+def _decorator(_cache_class: type[Cache], maxsize: int | Callable | None, typed: bool, ttl: float | None, weigher: Callable[[Any], int] | None) -> Callable:
+    if callable(maxsize) and not isinstance(maxsize, int):
+        return _decorator(_cache_class, 128, typed, ttl, weigher)(maxsize)
+    if maxsize is not None and maxsize < 0:
+        maxsize = 0
+
+    def decorating_function(user_function: Callable) -> Callable:
+        cache = _cache_class(maxsize, ttl=ttl, weigher=weigher)
+        lock = threading.RLock()
+
+        def wrapper(*args: Any, **kwds: Any) -> Any:
+            key = _make_key(args, kwds, typed)
+            with lock:
+                result = cache.get(key, _MISSING)
+            if result is not _MISSING:
+                return result
+            result = user_function(*args, **kwds)
+            with lock:
+                cache.put(key, result)
+            return result
+
+        def cache_info() -> CacheInfo:
+            with lock:
+                return cache.info()
+
+        def cache_clear() -> None:
+            with lock:
+                cache.clear()
+                cache.hits = cache.misses = cache.evictions = cache.expirations = 0
+
+        wrapper.cache = cache
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        wrapper.cache_parameters = lambda: {'maxsize': maxsize, 'typed': typed, 'ttl': ttl}
+        return functools.update_wrapper(wrapper, user_function)
+
+    return decorating_function
+
+
+def lru_cache(maxsize: int | Callable | None = 128, typed: bool = False, *, ttl: float | None = None, weigher: Callable[[Any], int] | None = None) -> Callable:
+    'memoize a function in a LRUCache, usable in place of functools.lru_cache'
+    return _decorator(LRUCache, maxsize, typed, ttl, weigher)
+
+
+def lfu_cache(maxsize: int | Callable | None = 128, typed: bool = False, *, ttl: float | None = None, weigher: Callable[[Any], int] | None = None) -> Callable:
+    'memoize a function in a LFUCache, with the interface of functools.lru_cache'
+    return _decorator(LFUCache, maxsize, typed, ttl, weigher)
@@ -0,0 +1,80 @@
+'''concurrent queue module'''
+from __future__ import annotations
+import queue
+import threading
+from typing import Generic, TypeVar, Self
+from .singly_linked_list import Node
+
+_T = TypeVar('_T')
+
+
+class ConcurrentQueue(Generic[_T]):
+    'concurrent queue class, a two lock singly linked queue in the style of Michael and Scott, producers only take the tail lock and consumers only take the head lock'
+    __slots__ = ('maxsize', '_head', '_tail', '_head_lock', '_tail_lock', '_items', '_slots', '_puts', '_gets', )
+
+    def __init__(self: Self[_T], maxsize: int = 0) -> None:
+        self.maxsize = maxsize
+        self._head: Node[_T] | Node[None] = Node(None)
+        self._tail: Node[_T] | Node[None] = self._head
+        self._head_lock = threading.Lock()
+        self._tail_lock = threading.Lock()
+        self._items = threading.Semaphore(0)
+        self._slots = threading.Semaphore(maxsize) if 0 < maxsize else None
+        self._puts = 0
+        self._gets = 0
+
+    def __repr__(self: Self[_T]) -> str:
+        return f'{type(self).__name__}(maxsize={self.maxsize}, qsize={self.qsize()})'
+
+    def qsize(self: Self[_T]) -> int:
+        'return the approximate size of the queue, the counters are read without a lock so it may be stale by the time it returns, like queue.Queue.qsize'
+        return max(self._puts - self._gets, 0)
+
+    def empty(self: Self[_T]) -> bool:
+        'return True if the queue is empty, not reliable while other threads run'
+        return self.qsize() == 0
+
+    def full(self: Self[_T]) -> bool:
+        'return True if the queue is full, not reliable while other threads run'
+        return 0 < self.maxsize <= self.qsize()
+
+    def put(self: Self[_T], _item: _T, block: bool = True, timeout: float | None = None) -> None:
+        'link item after tail, waiting up to timeout for a free slot when the queue is bounded and full, timeout is ignored when block is false'
+        if not block:
+            timeout = None
+        elif timeout is not None and timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+        if self._slots is not None and not self._slots.acquire(block, timeout):
+            raise queue.Full
+        node = Node(_item)
+        with self._tail_lock:
+            self._tail.next = node
+            self._tail = node
+            self._puts += 1
+        self._items.release()
+
+    def get(self: Self[_T], block: bool = True, timeout: float | None = None) -> _T:
+        'unlink and return the value after head, waiting up to timeout for one when the queue is empty, timeout is ignored when block is false'
+        if not block:
+            timeout = None
+        elif timeout is not None and timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+        if not self._items.acquire(block, timeout):
+            raise queue.Empty
+        with self._head_lock:
+            first = self._head.next
+            item = first.value
+            first.value = None
+            self._head = first
+            self._gets += 1
+        if self._slots is not None:
+            self._slots.release()
+        return item
+
+    def put_nowait(self: Self[_T], _item: _T) -> None:
+        'put item without blocking, raise queue.Full when there is no free slot'
+        self.put(_item, False)
+
+    def get_nowait(self: Self[_T]) -> _T:
+        'get an item without blocking, raise queue.Empty when there is none'
+        return self.get(False)
@@ -1,20 +1,49 @@
 '''doubly circularly linked list module'''
 from __future__ import annotations
+import functools
 import sys
+import threading
 import types
 from typing import Any, Callable, Generic, TypeVar, Iterable, Iterator, MutableSequence, overload, Self
+from .value_proxy import ValueProxy
+from .memory import MemoryStats, PayloadCounter, class_size, node_size
+from .value_index import ValueIndex
+from .views import NodeView, ReversedView
 
 _T = TypeVar('_T')
 
 
-class Node(Generic[_T]):
+def _locked(func: Callable) -> Callable:
+    'run a list method while holding the lock of the list'
+    @functools.wraps(func)
+    def wrapper(self: List, *args: Any, **kwargs: Any) -> Any:
+        with self._lock:
+            return func(self, *args, **kwargs)
+    return wrapper
+
+
+class Node(ValueProxy, Generic[_T]):
     'doubly circularly linked node class'
     __slots__ = ('value', '_prev', '_next',)
     value: _T
     prev: Node[_T] | Node[None]
     next: Node[_T] | Node[None]
 
-    def __new__(cls: type[Self[_T]], _value: _T, _prev: Node | None = None, _next: Node | None = None) -> Node:
+    def __init__(self: Self[_T], _value: _T, _prev: Node | None = None, _next: Node | None = None) -> None:
+        self.value = _value
+        self._prev = self if _prev is None else _prev
+        self._next = self if _next is None else _next
+        if _prev is not None:
+            _prev.next = self
+        if _next is not None:
+            _next.prev = self
+
+    def __reduce__(self: Self) -> tuple[Callable[..., Node[_T]], tuple[_T]]:
+        return type(self), (self.value, )
+
+    @classmethod
+    def dynamic(cls: type[Self[_T]], _value: _T, _prev: Node | None = None, _next: Node | None = None) -> Node[_T]:
+        'create node of a new class forwarding every special method of the value type'
         def _is_special(name: str) -> bool:
             if name in {'__lt__', '__le__', '__eq__', '__ne__', '__gt__', '__ge__', '__repr__', '__str__', '__or__', '__ror__'}:
                 return True
@@ -28,7 +57,7 @@ class Node(Generic[_T]):
             return wrapper
 
         classdict = {method: _method(getattr(type(_value), method)) for method in dir(type(_value)) if _is_special(method)}
-        classdict.update({'value': _value, 'prev': Node.prev, 'next': Node.next})
+        classdict.update({'__reduce__': lambda _self: (cls.dynamic, (_self.value, )), 'value': _value, 'prev': Node.prev, 'next': Node.next})
         _cls = types.new_class('Node', (object, ), exec_body=lambda ns: ns.update(classdict))
         self = object.__new__(_cls)
         self.prev = _prev
@@ -43,7 +72,7 @@ class Node(Generic[_T]):
     @prev.setter
     def prev(self, _prev: Node[_T] | Node[None]) -> None:
         self._prev = self if _prev is None else _prev
-        if hasattr(_prev, 'next') and _prev.next != self:
+        if hasattr(_prev, 'next') and _prev.next is not self:
             _prev.next = self
 
     @property
@@ -54,32 +83,176 @@ class Node(Generic[_T]):
     @next.setter
     def next(self, _next: Node[_T] | Node[None]) -> None:
         self._next = self if _next is None else _next
-        if hasattr(_next, 'prev') and _next.prev != self:
+        if hasattr(_next, 'prev') and _next.prev is not self:
             _next.prev = self
 
 
 class List(MutableSequence[Node[_T]], Generic[_T]):
-    'doubly circularly linked list class'
-    __slots__ = ('head', )
+    'doubly circularly linked list class, methods that index or relink nodes hold the list lock, iteration and value searches do not, so hold lock around them while other threads mutate'
+    __slots__ = ('head', '_dynamic', '_len', '_version', '_finger', '_finger_index', '_lookup', '_maxlen', '_lock', )
+    debug = False
 
     @overload
-    def __init__(self: Self) -> None: ...
+    def __init__(self: Self, *, dynamic: bool = ..., hashed: bool = ..., maxlen: int | None = ...) -> None: ...
     @overload
-    def __init__(self: Self, __i: Iterable[_T]) -> None: ...
+    def __init__(self: Self, __i: Iterable[_T], *, dynamic: bool = ..., hashed: bool = ..., maxlen: int | None = ...) -> None: ...
 
-    def __init__(self: Self, _iterable: Iterable[_T] | None = None) -> None:
+    def __init__(self: Self, _iterable: Iterable[_T] | None = None, *, dynamic: bool = False, hashed: bool = False, maxlen: int | None = None) -> None:
+        self._dynamic = dynamic
+        self._len = 0
+        self._version = 0
+        self._finger: Node[_T] | None = None
+        self._finger_index = -1
         self.head: Node[None] = Node(None)
-        if _iterable is not None:
-            for _v in _iterable:
-                self.append(_v)
+        self._lookup = ValueIndex() if hashed else None
+        if maxlen is not None and maxlen < 0:
+            raise ValueError('maxlen must be non-negative')
+        self._maxlen = maxlen
+        self._lock = threading.RLock()
+        if isinstance(_iterable, Iterable):
+            self.extend(_iterable)
+
+    @classmethod
+    def from_iterable(cls: type[Self], _iterable: Iterable[_T], _length_hint: int | None = None, *, dynamic: bool = False, hashed: bool = False, maxlen: int | None = None) -> Self:
+        'build a list linking the whole iterable in one pass, length hint is advisory'
+        return cls(_iterable, dynamic=dynamic, hashed=hashed, maxlen=maxlen)
+
+    def __reduce__(self: Self) -> tuple[Callable[..., Self], tuple[Any, ...]]:
+        return self._restore, (list(self._iter(_values=True)), self._dynamic, self._lookup is not None, self._maxlen)
+
+    @classmethod
+    def _restore(cls: type[Self], _values: Iterable[_T], dynamic: bool, hashed: bool, maxlen: int | None) -> Self:
+        'rebuild a list from the flat value sequence written by __reduce__'
+        return cls(_values, dynamic=dynamic, hashed=hashed, maxlen=maxlen)
+
+    @property
+    def maxlen(self: Self) -> int | None:
+        '''maximum length, None when unbounded'''
+        return self._maxlen
+
+    @property
+    def lock(self: Self) -> threading.RLock:
+        '''reentrant lock held by every indexing and relinking method, hold it to make several calls or an iteration atomic'''
+        return self._lock
 
     def __repr__(self: Self) -> str:
-        return repr([v for v in self])
+        return repr(list(self.values()))
+
+    def __iter__(self: Self) -> Iterator[Node[_T]]:
+        return self._iter()
+
+    def __reversed__(self: Self) -> Iterator[Node[_T]]:
+        return self._iter(_reverse=True)
+
+    def values(self: Self, _reverse: bool = False) -> Iterator[_T]:
+        'iterate over node values instead of nodes'
+        return self._iter(_reverse, True)
+
+    def _iter(self: Self, _reverse: bool = False, _values: bool = False) -> Iterator[Node[_T]] | Iterator[_T]:
+        version = self._version
+        if _reverse:
+            node = self.head._prev
+            while node is not self.head:
+                yield node.value if _values else node
+                if self._version != version:
+                    raise RuntimeError('list mutated during iteration')
+                node = node._prev
+            return
+        node = self.head._next
+        while node is not self.head:
+            yield node.value if _values else node
+            if self._version != version:
+                raise RuntimeError('list mutated during iteration')
+            node = node._next
+
+    def index(self: Self, _value: _T, _start: int = 0, _stop: int | None = None) -> int:
+        'return first index of value'
+        start, stop, _ = slice(_start, _stop).indices(self._len)
+        nodes = self._hashed(_value)
+        if nodes is not None and not nodes:
+            raise ValueError(f'{_value!r} is not in list')
+        for _i, node in enumerate(self._iter()):
+            if _i >= stop:
+                break
+            if _i >= start and ((id(node) in nodes) if nodes is not None else (node is _value or node == _value)):
+                return _i
+        raise ValueError(f'{_value!r} is not in list')
+
+    def _hashed(self: Self, _value: Any) -> dict[int, Node[_T]] | None:
+        'return the nodes holding value keyed by id, or None when there is no value index to ask'
+        if self._lookup is None:
+            return None
+        if self._lookup.stale:
+            self._lookup.build(self._iter())
+        return self._lookup.get(_value)
+
+    def __contains__(self: Self, _value: Any) -> bool:
+        nodes = self._hashed(_value)
+        if nodes is None:
+            return super().__contains__(_value)
+        return bool(nodes)
+
+    def count(self: Self, _value: Any) -> int:
+        'return number of occurrences of value, in O(1) with a value index'
+        nodes = self._hashed(_value)
+        if nodes is None:
+            return super().count(_value)
+        return len(nodes)
+
+    def find(self: Self, _value: _T) -> Node[_T]:
+        'return the first node holding value, in O(1) when a value index holds a single one'
+        nodes = self._hashed(_value)
+        if nodes is not None and len(nodes) == 1:
+            return next(iter(nodes.values()))
+        if nodes is not None and not nodes:
+            raise ValueError(f'{_value!r} is not in list')
+        node = self.head._next
+        while node is not self.head:
+            if (id(node) in nodes) if nodes is not None else (node is _value or node == _value):
+                return node
+            node = node._next
+        raise ValueError(f'{_value!r} is not in list')
+
+    def view(self: Self, _start: int = 0, _stop: int | None = None) -> NodeView[_T]:
+        'return a lazy view of the nodes from start up to stop without copying them'
+        start, stop, _ = slice(_start, _stop).indices(self._len)
+        if stop <= start:
+            return NodeView(self, None, None, 0)
+        first, last = self._node(start), self._node(stop - 1)
+        return NodeView(self, first, last, stop - start)
+
+    def window(self: Self, _node: Node[_T], _count: int) -> NodeView[_T]:
+        'return a lazy view of at most count nodes starting at node'
+        if _count <= 0 or _node is self.head:
+            return NodeView(self, None, None, 0)
+        last, count = _node, 1
+        while count < _count and last._next is not self.head:
+            last = last._next
+            count += 1
+        return NodeView(self, _node, last, count)
 
     def __sizeof__(self: Self) -> int:
         return sys.getsizeof(self.head) + sum([sys.getsizeof(_v) for _v in self])
 
+    def memory_stats(self: Self, deep: bool = False, unique: bool = True) -> MemoryStats:
+        'return node, sentinel, per node class, payload and index bytes from one pass over the chain, payloads deep or shallow and shared objects counted once when unique'
+        payload = PayloadCounter(deep, unique)
+        count = node_bytes = class_bytes = 0
+        for node in self._iter():
+            count += 1
+            node_bytes += node_size(node)
+            if self._dynamic:
+                class_bytes += class_size(type(node))
+            payload.add(node.value)
+        return MemoryStats(count, node_bytes, node_size(self.head), class_bytes, payload.bytes, 0 if self._lookup is None else sys.getsizeof(self._lookup))
+
     def __len__(self: Self) -> int:
+        if self.debug and self._len != self._count():
+            raise AssertionError(f'cached length {self._len} does not match node count {self._count()}')
+        return self._len
+
+    def _count(self: Self) -> int:
+        'count nodes by walking the whole chain'
         _len = 0
         node = self.head.next
         while True:
@@ -89,48 +262,38 @@ class List(MutableSequence[Node[_T]], Generic[_T]):
             _len += 1
         return _len
 
-    def _valid_index(self: Self, index: int, _raise: bool = True) -> int:
-        _n = len(self)
-        if 0 <= index:
-            if index > _n:
-                if _raise:
-                    raise IndexError('list assignment index out of range')
-                index = _n
+    def _node(self: Self, _index: int) -> Node[_T]:
+        'return node at index, walking from whichever of either end or finger is nearest'
+        _n = self._len
+        if _index < 0:
+            _index += _n
+        if not 0 <= _index < _n:
+            raise IndexError('list assignment index out of range')
+        node, offset = self.head._next, _index
+        if _n - 1 - _index < _index:
+            node, offset = self.head._prev, _index - _n + 1
+        if self._finger is not None and abs(_index - self._finger_index) < abs(offset):
+            node, offset = self._finger, _index - self._finger_index
+        if 0 < offset:
+            for _ in range(offset):
+                node = node._next
         else:
-            if abs(index) > _n + 1:
-                if _raise:
-                    raise IndexError('list assignment index out of range')
-                index = - (_n + 1)
-        return index
+            for _ in range(-offset):
+                node = node._prev
+        self._finger, self._finger_index = node, _index
+        return node
 
     @overload
     def __getitem__(self: Self, __i: int) -> Node[_T]: ...
     @overload
-    def __getitem__(self: Self, __s: slice) -> List[Node[_T]]: ...
+    def __getitem__(self: Self, __s: slice) -> Self: ...
 
-    def __getitem__(self: Self, _index: int | slice) -> Node[_T] | List[Node[_T]]:
+    @_locked
+    def __getitem__(self: Self, _index: int | slice) -> Node[_T] | Self:
         if isinstance(_index, int):
-            _index = self._valid_index(_index)
-            if 0 <= _index:
-                node = self.head.next
-                if node is self.head:
-                    raise IndexError('list assignment index out of range')
-                for _ in range(_index):
-                    node = node.next
-                    if node is self.head:
-                        raise IndexError('list assignment index out of range')
-            else:
-                node = self.head.prev
-                if node is self.head:
-                    raise IndexError('list assignment index out of range')
-                for _ in range(self._valid_index(_index), -1):
-                    node = node.prev
-                    if node is self.head:
-                        raise IndexError('list assignment index out of range')
-            return node
+            return self._node(_index)
         elif isinstance(_index, slice):
-            start, stop, step = _index.indices(len(self))
-            return List([self[_i] for _i in range(start, stop, step)])
+            return self._get_slice(_index)
         else:
             raise TypeError(f'index must be integers or slices, not {type(_index)}')
 
@@ -139,33 +302,18 @@ class List(MutableSequence[Node[_T]], Generic[_T]):
     @overload
     def __setitem__(self: Self, __s: slice, __o: Iterable[_T]) -> None: ...
 
+    @_locked
     def __setitem__(self: Self, _index: int | slice, _value: _T | Iterable[_T]) -> None:
         if isinstance(_index, int):
-            _index = self._valid_index(_index)
-            if 0 <= _index:
-                node = self.head.next
-                if node is self.head:
-                    raise IndexError('list assignment index out of range')
-                for _ in range(_index):
-                    node = node.next
-                    if node is self.head:
-                        raise IndexError('list assignment index out of range')
+            node = self._node(_index)
+            if self._lookup is not None:
+                self._lookup.discard(node)
+                node.value = _value
+                self._lookup.add(node)
             else:
-                node = self.head.prev
-                if node is self.head:
-                    raise IndexError('list assignment index out of range')
-                for _ in range(_index, -1):
-                    node = node.prev
-                    if node is self.head:
-                        raise IndexError('list assignment index out of range')
-            node.value = _value
+                node.value = _value
         elif isinstance(_index, slice):
-            if isinstance(_value, Iterable):
-                start, stop, stride = _index.indices(len(self))
-                for _i, _v in zip(range(start, stop, stride), _value):
-                    self[_i] = _v
-            else:
-                raise TypeError('can only assign an iterable')
+            self._set_slice(_index, _value)
         else:
             raise TypeError(f'index must be integers or slices, not {type(_index)}')
 
@@ -174,43 +322,102 @@ class List(MutableSequence[Node[_T]], Generic[_T]):
     @overload
     def __delitem__(self: Self, __s: slice) -> None: ...
 
+    @_locked
     def __delitem__(self: Self, _index: int | slice) -> None:
         if isinstance(_index, int):
-            _index = self._valid_index(_index)
-            if 0 <= _index:
-                node = self.head.next
-                if node is self.head:
-                    raise IndexError('list assignment index out of range')
-                for _ in range(_index):
-                    node = node.next
-                    if node is self.head:
-                        raise IndexError('list assignment index out of range')
-            else:
-                node = self.head.prev
-                if node is self.head:
-                    raise IndexError('list assignment index out of range')
-                for _ in range(self._valid_index(_index), -1):
-                    node = node.prev
-                    if node is self.head:
-                        raise IndexError('list assignment index out of range')
+            node = self._node(_index)
             node.prev.next = node.next
+            if self._lookup is not None:
+                self._lookup.discard(node)
+            self._len -= 1
+            self._version += 1
+            if node._prev is self.head:
+                self._finger = None
+            else:
+                self._finger, self._finger_index = node._prev, self._finger_index - 1
             del node
         elif isinstance(_index, slice):
-            start, stop, stride = _index.indices(len(self))
-            for _i in range(start, stop, stride):
-                del self[_i]
+            self._del_slice(_index)
         else:
             raise TypeError(f'index must be integers or slices, not {type(_index)}')
 
-    def __reversed__(self: Self) -> Iterator[Node[_T]]:
-        _i = -1
-        try:
-            while True:
-                _v = self[_i]
-                yield _v
-                _i -= 1
-        except IndexError:
+    def _get_slice(self: Self, _index: slice) -> Self:
+        'copy the values of a slice into a new list in one walk'
+        _range = range(*_index.indices(self._len))
+        values = []
+        if _range:
+            ascending = _range if 0 < _range.step else _range[::-1]
+            node = self._node(ascending[0])
+            values.append(node.value)
+            for _ in range(len(ascending) - 1):
+                for _ in range(ascending.step):
+                    node = node._next
+                values.append(node.value)
+            if _range.step < 0:
+                values.reverse()
+        return type(self)(values, dynamic=self._dynamic, hashed=self._lookup is not None)
+
+    def _set_slice(self: Self, _index: slice, _value: Iterable[_T]) -> None:
+        'assign a slice in one walk, like list a contiguous slice may change length'
+        if self._lookup is not None:
+            self._lookup.invalidate()
+        if not isinstance(_value, Iterable):
+            raise TypeError('can only assign an iterable')
+        values = list(self.values()) if _value is self else list(_value)
+        start, stop, step = _index.indices(self._len)
+        if step == 1:
+            stop = max(start, stop)
+            prev = self._node(start - 1) if start else self.head
+            after = prev._next
+            for _ in range(stop - start):
+                after = after._next
+            new = Node.dynamic if self._dynamic else Node
+            first = last = Node(None)
+            for _v in values:
+                node = new(_v)
+                node._prev, last._next = last, node
+                last = node
+            last._next, after._prev = after, last
+            prev._next, first._next._prev = first._next, prev
+            self._len += len(values) - (stop - start)
+            self._version += 1
+            self._finger = None
+            self._trim()
+            return
+        _range = range(start, stop, step)
+        if len(values) != len(_range):
+            raise ValueError(f'attempt to assign sequence of size {len(values)} to extended slice of size {len(_range)}')
+        if not _range:
             return
+        if step < 0:
+            _range, values = _range[::-1], values[::-1]
+        node = self._node(_range[0])
+        for _i, _v in enumerate(values):
+            if _i:
+                for _ in range(_range.step):
+                    node = node._next
+            node.value = _v
+
+    def _del_slice(self: Self, _index: slice) -> None:
+        'delete a slice in one walk'
+        if self._lookup is not None:
+            self._lookup.invalidate()
+        _range = range(*_index.indices(self._len))
+        if not _range:
+            return
+        if _range.step < 0:
+            _range = _range[::-1]
+        node = self._node(_range[0])
+        for _i in range(len(_range)):
+            _next = node._next
+            node._prev._next, _next._prev = _next, node._prev
+            node = _next
+            if _i < len(_range) - 1:
+                for _ in range(_range.step - 1):
+                    node = node._next
+        self._len -= len(_range)
+        self._version += 1
+        self._finger = None
 
     @overload
     def insert(self: Self, __i: int, __v: _T) -> None: ...
@@ -219,67 +426,383 @@ class List(MutableSequence[Node[_T]], Generic[_T]):
     @overload
     def insert(self: Self, __n: Node[None], __v: _T) -> None: ...
 
+    @_locked
     def insert(self: Self, _index: int | Node[_T] | Node[None], _value: _T) -> None:
         'insert value to index or next to node'
+        if self._maxlen is not None and self._len >= self._maxlen:
+            raise IndexError('list already at its maximum size')
         try:
-            Node(_value, _index, _index.next)
+            node = (Node.dynamic if self._dynamic else Node)(_value, _index, _index.next)
+            if self._lookup is not None:
+                self._lookup.add(node)
+            self._len += 1
+            self._version += 1
+            self._finger = None
         except AttributeError as exc:
             if isinstance(_index, int):
-                _index = self._valid_index(_index, False)
-                if 0 <= _index:
-                    node = self.head
-                    for _ in range(_index):
-                        node = node.next
-                        if node is self.head:
-                            break
-                else:
-                    node = self.head
-                    for _ in range(_index, 0):
-                        node = node.prev
-                        if node is self.head:
-                            break
-                self.insert(node, _value)
+                _index = max(_index + self._len, 0) if _index < 0 else min(_index, self._len)
+                prev = self._node(_index - 1) if _index else self.head
+                self.insert(prev, _value)
+                self._finger, self._finger_index = prev._next, _index
             else:
                 raise IndexError('index must be integers or a node') from exc
 
+    @_locked
+    def extend(self: Self, _values: Iterable[_T]) -> None:
+        'append every value of the iterable, linking the batch before splicing it on'
+        if _values is self:
+            _values = list(self.values())
+        new = Node.dynamic if self._dynamic else Node
+        start = last = Node(None)
+        count = 0
+        for _v in _values:
+            node = new(_v)
+            node._prev = last
+            last._next = node
+            last = node
+            count += 1
+        if last is start:
+            return
+        anchor = self.head._prev
+        anchor._next, start._next._prev = start._next, anchor
+        last._next, self.head._prev = self.head, last
+        if self._lookup is not None:
+            node = start._next
+            while node is not self.head:
+                self._lookup.add(node)
+                node = node._next
+        self._len += count
+        self._version += 1
+        self._trim()
+
+    @_locked
+    def splice(self: Self, other: Self, _node: Node[_T] | Node[None]) -> None:
+        'move every node of other next to node, leaving other empty'
+        if type(other) is not type(self):
+            raise TypeError(f'can only splice {type(self).__name__}, not {type(other).__name__}')
+        if other is self:
+            raise ValueError('cannot splice a list into itself')
+        if other._len == 0:
+            return
+        first, last = other.head._next, other.head._prev
+        other.head._next, other.head._prev = other.head, other.head
+        after = _node._next
+        _node._next, first._prev = first, _node
+        last._next, after._prev = after, last
+        self._len += other._len
+        other._len = 0
+        for _list in (self, other):
+            _list._version += 1
+            _list._finger = None
+            if _list._lookup is not None:
+                _list._lookup.invalidate()
+        self._trim()
+
+    def concat(self: Self, other: Self) -> None:
+        'move every node of other to the end of the list, leaving other empty'
+        self.splice(other, self.head._prev)
+
+    @_locked
+    def split_after(self: Self, _node: Node[_T] | Node[None]) -> Self:
+        'move every node after node into a new list and return it, counting from the nearer end'
+        new = type(self)(dynamic=self._dynamic, hashed=self._lookup is not None)
+        if _node._next is self.head:
+            return new
+        count = 0
+        forward = backward = _node
+        while True:
+            forward = forward._next
+            if forward is self.head:
+                break
+            if backward is self.head:
+                count = self._len - count
+                break
+            backward = backward._prev
+            count += 1
+        first, last = _node._next, self.head._prev
+        _node._next, self.head._prev = self.head, _node
+        new.head._next, first._prev = first, new.head
+        last._next, new.head._prev = new.head, last
+        self._len -= count
+        new._len = count
+        self._version += 1
+        self._finger = None
+        if self._lookup is not None:
+            self._lookup.invalidate()
+        return new
+
+    @_locked
     def append(self: Self, _value: _T) -> None:
-        'append value to the end of the sequence'
-        self.insert(self.head.prev, _value)
+        'append value to the end of the sequence, dropping the first value when the list is full'
+        if self._maxlen is not None and self._len >= self._maxlen:
+            if not self._maxlen:
+                return
+            self.popleft()
+        self.insert(self.head._prev, _value)
+
+    @_locked
+    def appendleft(self: Self, _value: _T) -> None:
+        'prepend value to the start of the sequence, dropping the last value when the list is full'
+        if self._maxlen is not None and self._len >= self._maxlen:
+            if not self._maxlen:
+                return
+            self.pop()
+        self.insert(self.head, _value)
+
+    @_locked
+    def extendleft(self: Self, _values: Iterable[_T]) -> None:
+        'prepend every value of the iterable one by one, so they end up in reverse order'
+        if _values is self:
+            _values = list(self.values())
+        for _v in _values:
+            self.appendleft(_v)
+
+    def _trim(self: Self) -> None:
+        'drop values from the start until the list fits in maxlen'
+        if self._maxlen is not None:
+            while self._len > self._maxlen:
+                self.popleft()
+
+    @_locked
+    def rotate(self: Self, _steps: int = 1) -> None:
+        'rotate the list steps to the right by moving head, walking the shorter way round in O(min(k, n - k))'
+        _n = self._len
+        if _n < 2 or not _steps % _n:
+            return
+        steps = _steps % _n
+        node = self.head
+        if steps <= _n - steps:
+            for _ in range(steps):
+                node = node._prev
+        else:
+            for _ in range(_n - steps + 1):
+                node = node._next
+        head = self.head
+        head._prev._next, head._next._prev = head._next, head._prev
+        prev = node._prev
+        head._prev, head._next = prev, node
+        prev._next = node._prev = head
+        self._version += 1
+        self._finger = None
+
+    @_locked
+    def copy(self: Self) -> Self:
+        'return a shallow copy with the same options'
+        return type(self)(self.values(), dynamic=self._dynamic, hashed=self._lookup is not None, maxlen=self._maxlen)
+
+    def _unlink(self: Self, _node: Node[_T]) -> Node[_T]:
+        _node._prev._next, _node._next._prev = _node._next, _node._prev
+        if self._lookup is not None:
+            self._lookup.discard(_node)
+        self._len -= 1
+        self._version += 1
+        self._finger = None
+        return _node
+
+    def _relink(self: Self, _node: Node[_T], _prev: Node[_T] | Node[None]) -> None:
+        'move a linked node next to prev without changing the length'
+        _node._prev._next, _node._next._prev = _node._next, _node._prev
+        _next = _prev._next
+        _node._prev, _node._next = _prev, _next
+        _prev._next = _next._prev = _node
+        self._version += 1
+        self._finger = None
+
+    @_locked
+    def insert_after(self: Self, _node: Node[_T] | Node[None], _value: _T) -> Node[_T]:
+        'insert value next to node and return the new node, in O(1)'
+        self.insert(_node, _value)
+        return _node._next
+
+    @_locked
+    def insert_before(self: Self, _node: Node[_T] | Node[None], _value: _T) -> Node[_T]:
+        'insert value before node and return the new node, in O(1)'
+        if _node is self.head:
+            raise IndexError('cannot insert before head node')
+        return self.insert_after(_node._prev, _value)
+
+    @_locked
+    def remove_node(self: Self, _node: Node[_T]) -> None:
+        'unlink node, in O(1)'
+        if _node is self.head:
+            raise IndexError('cannot remove a sentinel node')
+        self._unlink(_node)
+
+    @_locked
+    def move_to_front(self: Self, _node: Node[_T]) -> None:
+        'relink node right after head, in O(1)'
+        if _node is self.head:
+            raise IndexError('cannot move a sentinel node')
+        if _node._prev is not self.head:
+            self._relink(_node, self.head)
+
+    @_locked
+    def move_to_end(self: Self, _node: Node[_T]) -> None:
+        'relink node before the end of the list, in O(1)'
+        if _node is self.head:
+            raise IndexError('cannot move a sentinel node')
+        if _node is not self.head._prev:
+            self._relink(_node, self.head._prev)
+
+    @_locked
+    def popleft(self: Self) -> Node[_T]:
+        'remove and return the first node, in O(1)'
+        if not self._len:
+            raise IndexError('pop from empty list')
+        return self._unlink(self.head._next)
+
+    @_locked
+    def pop(self: Self, _index: int = -1) -> Node[_T]:
+        'remove and return node at index, the last one by default in O(1)'
+        if not self._len:
+            raise IndexError('pop from empty list')
+        return self._unlink(self.head._prev if _index == -1 else self._node(_index))
+
+    @_locked
+    def clear(self: Self) -> None:
+        'unlink every node at once'
+        self.head._next = self.head._prev = self.head
+        self._len = 0
+        self._version += 1
+        self._finger = None
+        if self._lookup is not None:
+            self._lookup.invalidate()
 
+    @staticmethod
+    def _comparator(_key: Callable[[_T], Any] | None, _reverse: bool, *_lists: Self) -> Callable[[Node[_T], Node[_T]], bool]:
+        'return a function telling whether the second node has to go strictly before the first one'
+        if _key is None:
+            if _reverse:
+                return lambda _a, _b: _a.value < _b.value
+            return lambda _a, _b: _b.value < _a.value
+        keys = {id(_n): _key(_n.value) for _list in _lists for _n in _list._iter()}
+        if _reverse:
+            return lambda _a, _b: keys[id(_a)] < keys[id(_b)]
+        return lambda _a, _b: keys[id(_b)] < keys[id(_a)]
+
+    @staticmethod
+    def _merge_runs(_tail: Node[_T] | Node[None], _a: Node[_T], _a_end: Node[_T], _b: Node[_T], _b_end: Node[_T], _rest: Node[_T] | None, _before: Callable[[Node[_T], Node[_T]], bool]) -> Node[_T]:
+        'merge the None terminated runs a and b after tail, link rest after them and return the last merged node'
+        try:
+            while _a is not None and _b is not None:
+                if _before(_a, _b):
+                    _tail._next = _b
+                    _tail, _b = _b, _b._next
+                else:
+                    _tail._next = _a
+                    _tail, _a = _a, _a._next
+        except BaseException:
+            for first, last in ((_a, _a_end), (_b, _b_end)):
+                if first is not None:
+                    _tail._next = first
+                    _tail = last
+            _tail._next = _rest
+            raise
+        if _a is not None:
+            _tail._next, _tail = _a, _a_end
+        else:
+            _tail._next, _tail = _b, _b_end
+        _tail._next = _rest
+        return _tail
+
+    def _close_chain(self: Self) -> None:
+        'turn the None terminated chain after head back into a proper list'
+        prev, node = self.head, self.head._next
+        while node is not None:
+            node._prev = prev
+            prev, node = node, node._next
+        prev._next, self.head._prev = self.head, prev
+
+    @_locked
+    def sort(self: Self, *, key: Callable[[_T], Any] | None = None, reverse: bool = False) -> None:
+        'sort stably in place with a bottom up natural merge sort that only relinks the existing nodes'
+        if self._len < 2:
+            return
+        before = self._comparator(key, reverse, self)
+        self._version += 1
+        self._finger = None
+        self.head._prev._next = None
+        try:
+            while True:
+                tail, rest, merges = self.head, self.head._next, 0
+                while rest is not None:
+                    a = a_end = rest
+                    while a_end._next is not None and not before(a_end, a_end._next):
+                        a_end = a_end._next
+                    b = b_end = a_end._next
+                    if b is None:
+                        tail = a_end
+                        break
+                    while b_end._next is not None and not before(b_end, b_end._next):
+                        b_end = b_end._next
+                    rest = b_end._next
+                    a_end._next = b_end._next = None
+                    tail = self._merge_runs(tail, a, a_end, b, b_end, rest, before)
+                    merges += 1
+                if not merges:
+                    break
+        except BaseException:
+            self._close_chain()
+            raise
+        self._close_chain()
+
+    @_locked
+    def merge(self: Self, other: Self, *, key: Callable[[_T], Any] | None = None, reverse: bool = False) -> None:
+        'merge the sorted other list into this sorted list in linear time, leaving other empty, ties keep the nodes of this list first'
+        if type(other) is not type(self):
+            raise TypeError(f'can only merge {type(self).__name__}, not {type(other).__name__}')
+        if other is self:
+            raise ValueError('cannot merge a list into itself')
+        if not other._len:
+            return
+        if not self._len:
+            self.splice(other, self.head)
+            return
+        before = self._comparator(key, reverse, self, other)
+        a, a_end = self.head._next, self.head._prev
+        b, b_end = other.head._next, other.head._prev
+        a_end._next = b_end._next = None
+        other.head._next, other.head._prev = other.head, other.head
+        self._len += other._len
+        other._len = 0
+        for _list in (self, other):
+            _list._version += 1
+            _list._finger = None
+            if _list._lookup is not None:
+                _list._lookup.invalidate()
+        try:
+            self._merge_runs(self.head, a, a_end, b, b_end, None, before)
+        except BaseException:
+            self._close_chain()
+            raise
+        self._close_chain()
+        self._trim()
+
+    @_locked
     def reverse(self: Self):
         'reverse the list'
-        for i in range(len(self) // 2):
-            node_0, node_1 = self[i], self[- (i + 1)]
-            prev_0, prev_1 = node_0.prev, node_1.prev
-            next_0, next_1 = node_0.next, node_1.next
-            prev_0.next = node_1
-            prev_1.next = node_0
-            node_0.next = next_1
-            if next_0 is node_1:
-                node_1.next = node_0
-            else:
-                node_1.next = next_0
-            if node_0 is prev_1:
-                node_0.prev = node_1
-            else:
-                node_0.prev = prev_1
-            node_1.prev = prev_0
-            if next_0 is node_1:
-                next_0.prev = prev_0
-            else:
-                next_0.prev = node_1
-            next_1.prev = node_0
+        self._version += 1
+        self._finger = None
+        node = self.head
+        while True:
+            node._prev, node._next = node._next, node._prev
+            node = node._prev
+            if node is self.head:
+                break
+
+    def reversed_view(self: Self) -> ReversedView[_T]:
+        'return a view of the list that runs from tail to head, in O(1)'
+        return ReversedView(self)
 
     @overload
     def remove(self: Self, __v: _T) -> None: ...
     @overload
     def remove(self: Self, __n: Node[_T]) -> None: ...
 
+    @_locked
     def remove(self: Self, _value: _T | Node[_T]) -> None:
         'remove first occurrence of value or node'
-        try:
-            _value.prev.next = _value.next
-            _value.next.prev = _value.prev
-            del _value
-        except AttributeError:
-            del self[self.index(_value)]
+        if hasattr(_value, '_prev'):
+            self.remove_node(_value)
+        else:
+            self.remove_node(self.find(_value))
@@ -3,18 +3,37 @@ from __future__ import annotations
 import sys
 import types
 from typing import Any, Callable, Generic, TypeVar, Iterable, Iterator, MutableSequence, overload, Self
+from .value_proxy import ValueProxy
+from .skip_index import SkipIndex
+from .memory import MemoryStats, PayloadCounter, class_size, node_size
+from .value_index import ValueIndex
+from .views import NodeView, ReversedView
 
 _T = TypeVar('_T')
 
 
-class Node(Generic[_T]):
+class Node(ValueProxy, Generic[_T]):
     'doubly linked node class'
     __slots__ = ('value', '_prev', '_next',)
     value: _T
     prev: Node[_T] | Node[None] | None
     next: Node[_T] | Node[None] | None
 
-    def __new__(cls: type[Self[_T]], _value: _T, _prev: Node[_T] | Node[None] | None = None, _next: Node[_T] | Node[None] | None = None) -> Node[_T]:
+    def __init__(self: Self[_T], _value: _T, _prev: Node[_T] | Node[None] | None = None, _next: Node[_T] | Node[None] | None = None) -> None:
+        self.value = _value
+        self._prev = _prev
+        self._next = _next
+        if _prev is not None:
+            _prev.next = self
+        if _next is not None:
+            _next.prev = self
+
+    def __reduce__(self: Self[_T]) -> tuple[Callable[..., Node[_T]], tuple[_T]]:
+        return type(self), (self.value, )
+
+    @classmethod
+    def dynamic(cls: type[Self[_T]], _value: _T, _prev: Node[_T] | Node[None] | None = None, _next: Node[_T] | Node[None] | None = None) -> Node[_T]:
+        'create node of a new class forwarding every special method of the value type'
         def _is_special(name: str) -> bool:
             if name in {'__lt__', '__le__', '__eq__', '__ne__', '__gt__', '__ge__', '__repr__', '__str__', '__or__', '__ror__'}:
                 return True
@@ -26,9 +45,9 @@ class Node(Generic[_T]):
             def wrapper(*args: Any):
                 return func(*tuple(arg.value if hasattr(arg, 'value') else arg for arg in args))
             return wrapper
-        
+
         classdict = {method: _method(getattr(type(_value), method)) for method in dir(type(_value)) if _is_special(method)}
-        classdict.update({'value': _value, 'prev':Node.prev , 'next': Node.next})
+        classdict.update({'__reduce__': lambda _self: (cls.dynamic, (_self.value, )), 'value': _value, 'prev': Node.prev, 'next': Node.next})
         _cls = types.new_class('Node', (object, ), exec_body=lambda ns: ns.update(classdict))
         self = object.__new__(_cls)
         self.prev = _prev
@@ -60,27 +79,158 @@ class Node(Generic[_T]):
 
 class List(MutableSequence[Node[_T]], Generic[_T]):
     'doubly linked list class'
-    __slots__ = ('head', 'tail', )
+    __slots__ = ('head', 'tail', '_dynamic', '_len', '_version', '_finger', '_finger_index', '_lookup', '_skip', )
+    debug = False
 
     @overload
-    def __init__(self: Self[_T]) -> None: ...
+    def __init__(self: Self[_T], *, dynamic: bool = ..., indexed: bool = ..., hashed: bool = ...) -> None: ...
     @overload
-    def __init__(self: Self[_T], __i: Iterable[_T]) -> None: ...
+    def __init__(self: Self[_T], __i: Iterable[_T], *, dynamic: bool = ..., indexed: bool = ..., hashed: bool = ...) -> None: ...
 
-    def __init__(self: Self[_T], _iterable: Iterable[_T] | None = None) -> None:
+    def __init__(self: Self[_T], _iterable: Iterable[_T] | None = None, *, dynamic: bool = False, indexed: bool = False, hashed: bool = False) -> None:
+        self._dynamic = dynamic
+        self._len = 0
+        self._version = 0
+        self._finger: Node[_T] | None = None
+        self._finger_index = -1
         self.head: Node[None] = Node(None)
         self.tail: Node[None] = Node(None, self.head)
+        self._skip = SkipIndex(self.head, self.tail) if indexed else None
+        self._lookup = ValueIndex() if hashed else None
         if isinstance(_iterable, Iterable):
-            for _v in _iterable:
-                self.append(_v)
+            self.extend(_iterable)
+
+    @classmethod
+    def from_iterable(cls: type[Self[_T]], _iterable: Iterable[_T], _length_hint: int | None = None, *, dynamic: bool = False, indexed: bool = False, hashed: bool = False) -> Self[_T]:
+        'build a list linking the whole iterable in one pass, length hint is advisory'
+        return cls(_iterable, dynamic=dynamic, indexed=indexed, hashed=hashed)
+
+    def __reduce__(self: Self[_T]) -> tuple[Callable[..., Self[_T]], tuple[Any, ...]]:
+        return self._restore, (list(self._iter(_values=True)), self._dynamic, self._skip is not None, self._lookup is not None)
+
+    @classmethod
+    def _restore(cls: type[Self[_T]], _values: Iterable[_T], dynamic: bool, indexed: bool, hashed: bool) -> Self[_T]:
+        'rebuild a list from the flat value sequence written by __reduce__'
+        return cls(_values, dynamic=dynamic, indexed=indexed, hashed=hashed)
 
     def __repr__(self: Self[_T]) -> str:
-        return repr([_v for _v in self])
+        return repr(list(self.values()))
+
+    def __iter__(self: Self[_T]) -> Iterator[Node[_T]]:
+        return self._iter()
+
+    def __reversed__(self: Self[_T]) -> Iterator[Node[_T]]:
+        return self._iter(_reverse=True)
+
+    def values(self: Self[_T], _reverse: bool = False) -> Iterator[_T]:
+        'iterate over node values instead of nodes'
+        return self._iter(_reverse, True)
+
+    def _iter(self: Self[_T], _reverse: bool = False, _values: bool = False) -> Iterator[Node[_T]] | Iterator[_T]:
+        version = self._version
+        if _reverse:
+            node = self.tail._prev
+            while node is not self.head:
+                yield node.value if _values else node
+                if self._version != version:
+                    raise RuntimeError('list mutated during iteration')
+                node = node._prev
+            return
+        node = self.head._next
+        while node is not self.tail:
+            yield node.value if _values else node
+            if self._version != version:
+                raise RuntimeError('list mutated during iteration')
+            node = node._next
+
+    def index(self: Self[_T], _value: _T, _start: int = 0, _stop: int | None = None) -> int:
+        'return first index of value'
+        start, stop, _ = slice(_start, _stop).indices(self._len)
+        nodes = self._hashed(_value)
+        if nodes is not None and not nodes:
+            raise ValueError(f'{_value!r} is not in list')
+        for _i, node in enumerate(self._iter()):
+            if _i >= stop:
+                break
+            if _i >= start and ((id(node) in nodes) if nodes is not None else (node is _value or node == _value)):
+                return _i
+        raise ValueError(f'{_value!r} is not in list')
+
+    def _hashed(self: Self[_T], _value: Any) -> dict[int, Node[_T]] | None:
+        'return the nodes holding value keyed by id, or None when there is no value index to ask'
+        if self._lookup is None:
+            return None
+        if self._lookup.stale:
+            self._lookup.build(self._iter())
+        return self._lookup.get(_value)
+
+    def __contains__(self: Self[_T], _value: Any) -> bool:
+        nodes = self._hashed(_value)
+        if nodes is None:
+            return super().__contains__(_value)
+        return bool(nodes)
+
+    def count(self: Self[_T], _value: Any) -> int:
+        'return number of occurrences of value, in O(1) with a value index'
+        nodes = self._hashed(_value)
+        if nodes is None:
+            return super().count(_value)
+        return len(nodes)
+
+    def find(self: Self[_T], _value: _T) -> Node[_T]:
+        'return the first node holding value, in O(1) when a value index holds a single one'
+        nodes = self._hashed(_value)
+        if nodes is not None and len(nodes) == 1:
+            return next(iter(nodes.values()))
+        if nodes is not None and not nodes:
+            raise ValueError(f'{_value!r} is not in list')
+        node = self.head._next
+        while node is not self.tail:
+            if (id(node) in nodes) if nodes is not None else (node is _value or node == _value):
+                return node
+            node = node._next
+        raise ValueError(f'{_value!r} is not in list')
+
+    def view(self: Self[_T], _start: int = 0, _stop: int | None = None) -> NodeView[_T]:
+        'return a lazy view of the nodes from start up to stop without copying them'
+        start, stop, _ = slice(_start, _stop).indices(self._len)
+        if stop <= start:
+            return NodeView(self, None, None, 0)
+        first, last = self._node(start), self._node(stop - 1)
+        return NodeView(self, first, last, stop - start)
+
+    def window(self: Self[_T], _node: Node[_T], _count: int) -> NodeView[_T]:
+        'return a lazy view of at most count nodes starting at node'
+        if _count <= 0 or _node is self.tail:
+            return NodeView(self, None, None, 0)
+        last, count = _node, 1
+        while count < _count and last._next is not self.tail:
+            last = last._next
+            count += 1
+        return NodeView(self, _node, last, count)
 
     def __sizeof__(self: Self[_T]) -> int:
         return sys.getsizeof(self.head) + sum([sys.getsizeof(_v) for _v in self]) + sys.getsizeof(self.tail)
 
+    def memory_stats(self: Self[_T], deep: bool = False, unique: bool = True) -> MemoryStats:
+        'return node, sentinel, per node class, payload and index bytes from one pass over the chain, payloads deep or shallow and shared objects counted once when unique'
+        payload = PayloadCounter(deep, unique)
+        count = node_bytes = class_bytes = 0
+        for node in self._iter():
+            count += 1
+            node_bytes += node_size(node)
+            if self._dynamic:
+                class_bytes += class_size(type(node))
+            payload.add(node.value)
+        return MemoryStats(count, node_bytes, node_size(self.head) + node_size(self.tail), class_bytes, payload.bytes, (0 if self._skip is None else sys.getsizeof(self._skip)) + (0 if self._lookup is None else sys.getsizeof(self._lookup)))
+
     def __len__(self: Self[_T]) -> int:
+        if self.debug and self._len != self._count():
+            raise AssertionError(f'cached length {self._len} does not match node count {self._count()}')
+        return self._len
+
+    def _count(self: Self[_T]) -> int:
+        'count nodes by walking the whole chain'
         _len = 0
         node = self.head.next
         while True:
@@ -90,19 +240,28 @@ class List(MutableSequence[Node[_T]], Generic[_T]):
             _len += 1
         return _len
 
-    def _valid_index(self: Self[_T], _index: int, _raise: bool = True) -> int:
-        _n = len(self)
-        if 0 <= _index:
-            if _index > _n:
-                if _raise:
-                    raise IndexError('list assignment index out of range')
-                _index = _n
+    def _node(self: Self[_T], _index: int) -> Node[_T]:
+        'return node at index, walking from whichever of head, tail or finger is nearest'
+        _n = self._len
+        if _index < 0:
+            _index += _n
+        if not 0 <= _index < _n:
+            raise IndexError('list assignment index out of range')
+        node, offset = self.head._next, _index
+        if _n - 1 - _index < _index:
+            node, offset = self.tail._prev, _index - _n + 1
+        if self._finger is not None and abs(_index - self._finger_index) < abs(offset):
+            node, offset = self._finger, _index - self._finger_index
+        if self._skip is not None and 1 < abs(offset):
+            node, offset = self._skip.node(_index), 0
+        if 0 < offset:
+            for _ in range(offset):
+                node = node._next
         else:
-            if abs(_index) > _n + 1:
-                if _raise:
-                    raise IndexError('list assignment index out of range')
-                _index = - (_n + 1)
-        return _index
+            for _ in range(-offset):
+                node = node._prev
+        self._finger, self._finger_index = node, _index
+        return node
 
     @overload
     def __getitem__(self: Self[_T], __i: int) -> Node[_T]: ...
@@ -111,27 +270,9 @@ class List(MutableSequence[Node[_T]], Generic[_T]):
 
     def __getitem__(self: Self[_T], _index: int | slice) -> Node[_T] | Self[_T]:
         if isinstance(_index, int):
-            _index = self._valid_index(_index)
-            if 0 <= _index:
-                node = self.head.next
-                if node is self.tail:
-                    raise IndexError('list assignment index out of range')
-                for _ in range(_index):
-                    node = node.next
-                    if node is self.tail:
-                        raise IndexError('list assignment index out of range')
-            else:
-                node = self.tail.prev
-                if node is self.head:
-                    raise IndexError('list assignment index out of range')
-                for _ in range(self._valid_index(_index), -1):
-                    node = node.prev
-                    if node is self.head:
-                        raise IndexError('list assignment index out of range')
-            return node
+            return self._node(_index)
         elif isinstance(_index, slice):
-            start, stop, step = _index.indices(len(self))
-            return List([self[_i] for _i in range(start, stop, step)])
+            return self._get_slice(_index)
         else:
             raise TypeError(f'index must be integers or slices, not {type(_index)}')
 
@@ -142,31 +283,15 @@ class List(MutableSequence[Node[_T]], Generic[_T]):
 
     def __setitem__(self: Self[_T], _index: int | slice, _value: _T | Iterable[_T]) -> None:
         if isinstance(_index, int):
-            _index = self._valid_index(_index)
-            if 0 <= _index:
-                node = self.head.next
-                if node is self.tail:
-                    raise IndexError('list assignment index out of range')
-                for _ in range(_index):
-                    node = node.next
-                    if node is self.tail:
-                        raise IndexError('list assignment index out of range')
+            node = self._node(_index)
+            if self._lookup is not None:
+                self._lookup.discard(node)
+                node.value = _value
+                self._lookup.add(node)
             else:
-                node = self.tail.prev
-                if node is self.head:
-                    raise IndexError('list assignment index out of range')
-                for _ in range(_index, -1):
-                    node = node.prev
-                    if node is self.head:
-                        raise IndexError('list assignment index out of range')
-            node.value = _value
+                node.value = _value
         elif isinstance(_index, slice):
-            if isinstance(_value, Iterable):
-                start, stop, stride = _index.indices(len(self))
-                for _i, _v in zip(range(start, stop, stride), _value):
-                    self[_i] = _v
-            else:
-                raise TypeError('can only assign an iterable')
+            self._set_slice(_index, _value)
         else:
             raise TypeError(f'index must be integers or slices, not {type(_index)}')
 
@@ -177,41 +302,104 @@ class List(MutableSequence[Node[_T]], Generic[_T]):
 
     def __delitem__(self: Self[_T], _index: int | slice) -> None:
         if isinstance(_index, int):
-            _index = self._valid_index(_index)
-            if 0 <= _index:
-                node = self.head.next
-                if node is self.tail:
-                    raise IndexError('list assignment index out of range')
-                for _ in range(_index):
-                    node = node.next
-                    if node is self.tail:
-                        raise IndexError('list assignment index out of range')
-            else:
-                node = self.tail.prev
-                if node is self.head:
-                    raise IndexError('list assignment index out of range')
-                for _ in range(self._valid_index(_index), -1):
-                    node = node.prev
-                    if node is self.head:
-                        raise IndexError('list assignment index out of range')
+            node = self._node(_index)
             node.prev.next = node.next
+            if self._lookup is not None:
+                self._lookup.discard(node)
+            if self._skip is not None:
+                self._skip.remove(node)
+            self._len -= 1
+            self._version += 1
+            if node._prev is self.head:
+                self._finger = None
+            else:
+                self._finger, self._finger_index = node._prev, self._finger_index - 1
             del node
         elif isinstance(_index, slice):
-            start, stop, stride = _index.indices(len(self))
-            for _i in range(start, stop, stride):
-                del self[_i]
+            self._del_slice(_index)
         else:
             raise TypeError(f'index must be integers or slices, not {type(_index)}')
 
-    def __reversed__(self: Self[_T]) -> Iterator[Node[_T]]:
-        _i = -1
-        try:
-            while True:
-                _v = self[_i]
-                yield _v
-                _i -= 1
-        except IndexError:
+    def _get_slice(self: Self[_T], _index: slice) -> Self[_T]:
+        'copy the values of a slice into a new list in one walk'
+        _range = range(*_index.indices(self._len))
+        values = []
+        if _range:
+            ascending = _range if 0 < _range.step else _range[::-1]
+            node = self._node(ascending[0])
+            values.append(node.value)
+            for _ in range(len(ascending) - 1):
+                for _ in range(ascending.step):
+                    node = node._next
+                values.append(node.value)
+            if _range.step < 0:
+                values.reverse()
+        return type(self)(values, dynamic=self._dynamic, indexed=self._skip is not None, hashed=self._lookup is not None)
+
+    def _set_slice(self: Self[_T], _index: slice, _value: Iterable[_T]) -> None:
+        'assign a slice in one walk, like list a contiguous slice may change length'
+        if self._lookup is not None:
+            self._lookup.invalidate()
+        if not isinstance(_value, Iterable):
+            raise TypeError('can only assign an iterable')
+        values = list(self.values()) if _value is self else list(_value)
+        start, stop, step = _index.indices(self._len)
+        if step == 1:
+            stop = max(start, stop)
+            prev = self._node(start - 1) if start else self.head
+            after = prev._next
+            for _ in range(stop - start):
+                after = after._next
+            new = Node.dynamic if self._dynamic else Node
+            first = last = Node(None)
+            for _v in values:
+                node = new(_v)
+                node._prev, last._next = last, node
+                last = node
+            last._next, after._prev = after, last
+            prev._next, first._next._prev = first._next, prev
+            self._len += len(values) - (stop - start)
+            self._version += 1
+            self._finger = None
+            if self._skip is not None:
+                self._skip.invalidate()
+            return
+        _range = range(start, stop, step)
+        if len(values) != len(_range):
+            raise ValueError(f'attempt to assign sequence of size {len(values)} to extended slice of size {len(_range)}')
+        if not _range:
             return
+        if step < 0:
+            _range, values = _range[::-1], values[::-1]
+        node = self._node(_range[0])
+        for _i, _v in enumerate(values):
+            if _i:
+                for _ in range(_range.step):
+                    node = node._next
+            node.value = _v
+
+    def _del_slice(self: Self[_T], _index: slice) -> None:
+        'delete a slice in one walk'
+        if self._lookup is not None:
+            self._lookup.invalidate()
+        _range = range(*_index.indices(self._len))
+        if not _range:
+            return
+        if _range.step < 0:
+            _range = _range[::-1]
+        node = self._node(_range[0])
+        for _i in range(len(_range)):
+            _next = node._next
+            node._prev._next, _next._prev = _next, node._prev
+            node = _next
+            if _i < len(_range) - 1:
+                for _ in range(_range.step - 1):
+                    node = node._next
+        self._len -= len(_range)
+        self._version += 1
+        self._finger = None
+        if self._skip is not None:
+            self._skip.invalidate()
 
     @overload
     def insert(self: Self[_T], __i: int, __v: _T) -> None: ...
@@ -225,53 +413,331 @@ class List(MutableSequence[Node[_T]], Generic[_T]):
         try:
             if _index is self.tail:
                 raise IndexError('cannot insert next to tail node')
-            Node(_value, _index, _index.next)
+            node = (Node.dynamic if self._dynamic else Node)(_value, _index, _index.next)
+            if self._skip is not None:
+                self._skip.insert(node)
+            if self._lookup is not None:
+                self._lookup.add(node)
+            self._len += 1
+            self._version += 1
+            self._finger = None
         except AttributeError as exc:
             if isinstance(_index, int):
-                _index = self._valid_index(_index, False)
-                if 0 <= _index:
-                    node = self.head
-                    for _ in range(_index):
-                        if node is self.tail:
-                            break
-                        node = node.next
-                else:
-                    node = self.tail
-                    for _ in range(_index, 0):
-                        if node is self.head:
-                            break
-                        node = node.prev
-                self.insert(node, _value)
+                _index = max(_index + self._len, 0) if _index < 0 else min(_index, self._len)
+                prev = self._node(_index - 1) if _index else self.head
+                self.insert(prev, _value)
+                self._finger, self._finger_index = prev._next, _index
             else:
                 raise IndexError('index must be integers or a node') from exc
 
+    def extend(self: Self[_T], _values: Iterable[_T]) -> None:
+        'append every value of the iterable, linking the batch before splicing it on'
+        if _values is self:
+            _values = list(self.values())
+        new = Node.dynamic if self._dynamic else Node
+        start = last = Node(None)
+        count = 0
+        for _v in _values:
+            node = new(_v)
+            node._prev = last
+            last._next = node
+            last = node
+            count += 1
+        if last is start:
+            return
+        anchor = self.tail._prev
+        anchor._next, start._next._prev = start._next, anchor
+        last._next, self.tail._prev = self.tail, last
+        if self._skip is not None:
+            node = start._next
+            while node is not self.tail:
+                self._skip.insert(node)
+                node = node._next
+        if self._lookup is not None:
+            node = start._next
+            while node is not self.tail:
+                self._lookup.add(node)
+                node = node._next
+        self._len += count
+        self._version += 1
+
+    def splice(self: Self[_T], other: Self[_T], _node: Node[_T] | Node[None]) -> None:
+        'move every node of other next to node, leaving other empty'
+        if type(other) is not type(self):
+            raise TypeError(f'can only splice {type(self).__name__}, not {type(other).__name__}')
+        if other is self:
+            raise ValueError('cannot splice a list into itself')
+        if _node is self.tail:
+            raise IndexError('cannot splice next to tail node')
+        if other._len == 0:
+            return
+        first, last = other.head._next, other.tail._prev
+        other.head._next, other.tail._prev = other.tail, other.head
+        after = _node._next
+        _node._next, first._prev = first, _node
+        last._next, after._prev = after, last
+        self._len += other._len
+        other._len = 0
+        for _list in (self, other):
+            _list._version += 1
+            _list._finger = None
+            if _list._lookup is not None:
+                _list._lookup.invalidate()
+            if _list._skip is not None:
+                _list._skip.invalidate()
+
+    def concat(self: Self[_T], other: Self[_T]) -> None:
+        'move every node of other to the end of the list, leaving other empty'
+        self.splice(other, self.tail._prev)
+
+    def split_after(self: Self[_T], _node: Node[_T] | Node[None]) -> Self[_T]:
+        'move every node after node into a new list and return it, counting from the nearer end'
+        if _node is self.tail:
+            raise IndexError('cannot splice next to tail node')
+        new = type(self)(dynamic=self._dynamic, indexed=self._skip is not None, hashed=self._lookup is not None)
+        if _node._next is self.tail:
+            return new
+        count = 0
+        forward = backward = _node
+        while True:
+            forward = forward._next
+            if forward is self.tail:
+                break
+            if backward is self.head:
+                count = self._len - count
+                break
+            backward = backward._prev
+            count += 1
+        first, last = _node._next, self.tail._prev
+        _node._next, self.tail._prev = self.tail, _node
+        new.head._next, first._prev = first, new.head
+        last._next, new.tail._prev = new.tail, last
+        self._len -= count
+        new._len = count
+        self._version += 1
+        self._finger = None
+        if self._lookup is not None:
+            self._lookup.invalidate()
+        if self._skip is not None:
+            self._skip.invalidate()
+        return new
+
     def append(self: Self[_T], _value: _T) -> None:
         'append value to the end of the sequence'
         self.insert(self.tail.prev, _value)
 
+    def appendleft(self: Self[_T], _value: _T) -> None:
+        'prepend value to the start of the sequence'
+        self.insert(self.head, _value)
+
+    def _unlink(self: Self[_T], _node: Node[_T]) -> Node[_T]:
+        _node._prev._next, _node._next._prev = _node._next, _node._prev
+        if self._skip is not None:
+            self._skip.remove(_node)
+        if self._lookup is not None:
+            self._lookup.discard(_node)
+        self._len -= 1
+        self._version += 1
+        self._finger = None
+        return _node
+
+    def _relink(self: Self[_T], _node: Node[_T], _prev: Node[_T] | Node[None]) -> None:
+        'move a linked node next to prev without changing the length'
+        _node._prev._next, _node._next._prev = _node._next, _node._prev
+        if self._skip is not None:
+            self._skip.remove(_node)
+        _next = _prev._next
+        _node._prev, _node._next = _prev, _next
+        _prev._next = _next._prev = _node
+        if self._skip is not None:
+            self._skip.insert(_node)
+        self._version += 1
+        self._finger = None
+
+    def insert_after(self: Self[_T], _node: Node[_T] | Node[None], _value: _T) -> Node[_T]:
+        'insert value next to node and return the new node, in O(1)'
+        self.insert(_node, _value)
+        return _node._next
+
+    def insert_before(self: Self[_T], _node: Node[_T] | Node[None], _value: _T) -> Node[_T]:
+        'insert value before node and return the new node, in O(1)'
+        if _node is self.head:
+            raise IndexError('cannot insert before head node')
+        return self.insert_after(_node._prev, _value)
+
+    def remove_node(self: Self[_T], _node: Node[_T]) -> None:
+        'unlink node, in O(1)'
+        if _node is self.head or _node is self.tail:
+            raise IndexError('cannot remove a sentinel node')
+        self._unlink(_node)
+
+    def move_to_front(self: Self[_T], _node: Node[_T]) -> None:
+        'relink node right after head, in O(1)'
+        if _node is self.head or _node is self.tail:
+            raise IndexError('cannot move a sentinel node')
+        if _node._prev is not self.head:
+            self._relink(_node, self.head)
+
+    def move_to_end(self: Self[_T], _node: Node[_T]) -> None:
+        'relink node before the end of the list, in O(1)'
+        if _node is self.head or _node is self.tail:
+            raise IndexError('cannot move a sentinel node')
+        if _node is not self.tail._prev:
+            self._relink(_node, self.tail._prev)
+
+    def popleft(self: Self[_T]) -> Node[_T]:
+        'remove and return the first node, in O(1)'
+        if not self._len:
+            raise IndexError('pop from empty list')
+        return self._unlink(self.head._next)
+
+    def pop(self: Self[_T], _index: int = -1) -> Node[_T]:
+        'remove and return node at index, the last one by default in O(1)'
+        if not self._len:
+            raise IndexError('pop from empty list')
+        return self._unlink(self.tail._prev if _index == -1 else self._node(_index))
+
+    def clear(self: Self[_T]) -> None:
+        'unlink every node at once'
+        self.head._next, self.tail._prev = self.tail, self.head
+        self._len = 0
+        self._version += 1
+        self._finger = None
+        if self._skip is not None:
+            self._skip.invalidate()
+        if self._lookup is not None:
+            self._lookup.invalidate()
+
+    @staticmethod
+    def _comparator(_key: Callable[[_T], Any] | None, _reverse: bool, *_lists: Self[_T]) -> Callable[[Node[_T], Node[_T]], bool]:
+        'return a function telling whether the second node has to go strictly before the first one'
+        if _key is None:
+            if _reverse:
+                return lambda _a, _b: _a.value < _b.value
+            return lambda _a, _b: _b.value < _a.value
+        keys = {id(_n): _key(_n.value) for _list in _lists for _n in _list._iter()}
+        if _reverse:
+            return lambda _a, _b: keys[id(_a)] < keys[id(_b)]
+        return lambda _a, _b: keys[id(_b)] < keys[id(_a)]
+
+    @staticmethod
+    def _merge_runs(_tail: Node[_T] | Node[None], _a: Node[_T], _a_end: Node[_T], _b: Node[_T], _b_end: Node[_T], _rest: Node[_T] | None, _before: Callable[[Node[_T], Node[_T]], bool]) -> Node[_T]:
+        'merge the None terminated runs a and b after tail, link rest after them and return the last merged node'
+        try:
+            while _a is not None and _b is not None:
+                if _before(_a, _b):
+                    _tail._next = _b
+                    _tail, _b = _b, _b._next
+                else:
+                    _tail._next = _a
+                    _tail, _a = _a, _a._next
+        except BaseException:
+            for first, last in ((_a, _a_end), (_b, _b_end)):
+                if first is not None:
+                    _tail._next = first
+                    _tail = last
+            _tail._next = _rest
+            raise
+        if _a is not None:
+            _tail._next, _tail = _a, _a_end
+        else:
+            _tail._next, _tail = _b, _b_end
+        _tail._next = _rest
+        return _tail
+
+    def _close_chain(self: Self[_T]) -> None:
+        'turn the None terminated chain after head back into a proper list'
+        prev, node = self.head, self.head._next
+        while node is not None:
+            node._prev = prev
+            prev, node = node, node._next
+        prev._next, self.tail._prev = self.tail, prev
+
+    def sort(self: Self[_T], *, key: Callable[[_T], Any] | None = None, reverse: bool = False) -> None:
+        'sort stably in place with a bottom up natural merge sort that only relinks the existing nodes'
+        if self._len < 2:
+            return
+        before = self._comparator(key, reverse, self)
+        self._version += 1
+        self._finger = None
+        if self._skip is not None:
+            self._skip.invalidate()
+        self.tail._prev._next = None
+        try:
+            while True:
+                tail, rest, merges = self.head, self.head._next, 0
+                while rest is not None:
+                    a = a_end = rest
+                    while a_end._next is not None and not before(a_end, a_end._next):
+                        a_end = a_end._next
+                    b = b_end = a_end._next
+                    if b is None:
+                        tail = a_end
+                        break
+                    while b_end._next is not None and not before(b_end, b_end._next):
+                        b_end = b_end._next
+                    rest = b_end._next
+                    a_end._next = b_end._next = None
+                    tail = self._merge_runs(tail, a, a_end, b, b_end, rest, before)
+                    merges += 1
+                if not merges:
+                    break
+        except BaseException:
+            self._close_chain()
+            raise
+        self._close_chain()
+
+    def merge(self: Self[_T], other: Self[_T], *, key: Callable[[_T], Any] | None = None, reverse: bool = False) -> None:
+        'merge the sorted other list into this sorted list in linear time, leaving other empty, ties keep the nodes of this list first'
+        if type(other) is not type(self):
+            raise TypeError(f'can only merge {type(self).__name__}, not {type(other).__name__}')
+        if other is self:
+            raise ValueError('cannot merge a list into itself')
+        if not other._len:
+            return
+        if not self._len:
+            self.splice(other, self.head)
+            return
+        before = self._comparator(key, reverse, self, other)
+        a, a_end = self.head._next, self.tail._prev
+        b, b_end = other.head._next, other.tail._prev
+        a_end._next = b_end._next = None
+        other.head._next, other.tail._prev = other.tail, other.head
+        self._len += other._len
+        other._len = 0
+        for _list in (self, other):
+            _list._version += 1
+            _list._finger = None
+            if _list._skip is not None:
+                _list._skip.invalidate()
+            if _list._lookup is not None:
+                _list._lookup.invalidate()
+        try:
+            self._merge_runs(self.head, a, a_end, b, b_end, None, before)
+        except BaseException:
+            self._close_chain()
+            raise
+        self._close_chain()
+
     def reverse(self: Self[_T]):
         'reverse the list'
-        for i in range(len(self) // 2):
-            node_0, node_1 = self[i], self[- (i + 1)]
-            prev_0, prev_1 = node_0.prev, node_1.prev
-            next_0, next_1 = node_0.next, node_1.next
-            prev_0.next = node_1
-            prev_1.next = node_0
-            node_0.next = next_1
-            if next_0 is node_1:
-                node_1.next = node_0
-            else:
-                node_1.next = next_0
-            if node_0 is prev_1:
-                node_0.prev = node_1
-            else:
-                node_0.prev = prev_1
-            node_1.prev = prev_0
-            if next_0 is node_1:
-                next_0.prev = prev_0
-            else:
-                next_0.prev = node_1
-            next_1.prev = node_0
+        self._version += 1
+        self._finger = None
+        if self._skip is not None:
+            self._skip.invalidate()
+        first, last = self.head._next, self.tail._prev
+        if first is self.tail:
+            return
+        node = first
+        while node is not self.tail:
+            node._prev, node._next = node._next, node._prev
+            node = node._prev
+        self.head._next, last._prev = last, self.head
+        self.tail._prev, first._next = first, self.tail
+
+    def reversed_view(self: Self[_T]) -> ReversedView[_T]:
+        'return a view of the list that runs from tail to head, in O(1)'
+        return ReversedView(self)
 
     @overload
     def remove(self: Self[_T], __v: _T) -> None: ...
@@ -280,8 +746,7 @@ class List(MutableSequence[Node[_T]], Generic[_T]):
 
     def remove(self: Self[_T], _value: _T | Node[_T]) -> None:
         'remove first occurrence of value or node'
-        try:
-            _value.prev.next = _value.next
-            del _value
-        except AttributeError:
-            del self[self.index(_value)]
+        if hasattr(_value, '_prev'):
+            self.remove_node(_value)
+        else:
+            self.remove_node(self.find(_value))
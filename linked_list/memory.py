@@ -0,0 +1,86 @@
+'''memory accounting module'''
+from __future__ import annotations
+import sys
+import types
+from typing import Any, NamedTuple
+
+_ATOMIC = (str, bytes, bytearray, int, float, complex, bool, type(None), range, type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType)
+
+
+class MemoryStats(NamedTuple):
+    'memory stats tuple, bytes are measured with sys.getsizeof'
+    nodes: int
+    node_bytes: int
+    sentinel_bytes: int
+    class_bytes: int
+    payload_bytes: int
+    index_bytes: int = 0
+
+    @property
+    def total(self) -> int:
+        '''sum of every byte count'''
+        return self.node_bytes + self.sentinel_bytes + self.class_bytes + self.payload_bytes + self.index_bytes
+
+
+def node_size(_node: Any) -> int:
+    'return bytes held by a node object, including the instance dict of a dynamic node'
+    namespace = getattr(_node, '__dict__', None)
+    return sys.getsizeof(_node) + (0 if namespace is None else sys.getsizeof(namespace))
+
+
+def class_size(_cls: type) -> int:
+    'return bytes held by the per node class of a dynamic node, its type object, namespace and forwarding wrappers'
+    namespace = vars(_cls)
+    size = sys.getsizeof(_cls) + sys.getsizeof(dict(namespace))
+    for _v in namespace.values():
+        if isinstance(_v, types.FunctionType):
+            size += sys.getsizeof(_v) + sum([sys.getsizeof(_c) for _c in _v.__closure__ or ()])
+    return size
+
+
+def deep_size(_value: Any, _seen: set[int]) -> int:
+    'return bytes held by value and everything it references that is not in seen, adding what it counts to seen'
+    size = 0
+    stack = [_value]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in _seen:
+            continue
+        _seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, _ATOMIC):
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        if hasattr(obj, '__dict__'):
+            stack.append(vars(obj))
+        for cls in type(obj).__mro__:
+            slots = cls.__dict__.get('__slots__', ())
+            for name in (slots, ) if isinstance(slots, str) else slots:
+                if name not in ('__dict__', '__weakref__') and hasattr(obj, name):
+                    stack.append(getattr(obj, name))
+    return size
+
+
+class PayloadCounter:
+    'payload counter class, sums value sizes in one pass, shallow or deep, counting every object once when unique'
+    __slots__ = ('deep', 'unique', 'seen', 'bytes', )
+
+    def __init__(self, _deep: bool, _unique: bool) -> None:
+        self.deep = _deep
+        self.unique = _unique
+        self.seen: set[int] = set()
+        self.bytes = 0
+
+    def add(self, _value: Any) -> None:
+        'count one value'
+        if self.deep:
+            self.bytes += deep_size(_value, self.seen if self.unique else set())
+        elif not self.unique:
+            self.bytes += sys.getsizeof(_value)
+        elif id(_value) not in self.seen:
+            self.seen.add(id(_value))
+            self.bytes += sys.getsizeof(_value)
@@ -0,0 +1,465 @@
+'''memory mapped linked list module'''
+from __future__ import annotations
+import mmap
+import os
+import pickle
+import struct
+from typing import Any, BinaryIO, Generic, TypeVar, Iterable, Iterator, MutableSequence, overload, Self
+from .memory import MemoryStats
+
+_T = TypeVar('_T')
+
+MAGIC = b'LLMMAP\x00\x00'
+VERSION = 1
+
+_HEADER = struct.Struct('<8sQqqqq')
+_RECORD = struct.Struct('<qqqq')
+_LINK = struct.Struct('<q')
+_BASE = 64
+_INITIAL_SLOTS = 64
+_INITIAL_HEAP = mmap.PAGESIZE
+
+
+class Node(int):
+    'memory mapped linked node class, an integer cursor naming a record of the list file'
+    __slots__ = ()
+
+    def __repr__(self: Self) -> str:
+        return f'{type(self).__name__}({int(self)})'
+
+
+class List(MutableSequence[_T], Generic[_T]):
+    'memory mapped linked list class, a doubly linked list of fixed size prev, next, value offset and size records in a mapped file, with the pickled values in an append only heap file beside it'
+    __slots__ = ('path', '_file', '_heap_file', '_records', '_heap', '_len', '_free', '_slots', '_heap_end', '_version', )
+    debug = False
+
+    @overload
+    def __init__(self: Self[_T], __p: str | os.PathLike) -> None: ...
+    @overload
+    def __init__(self: Self[_T], __p: str | os.PathLike, __i: Iterable[_T]) -> None: ...
+
+    def __init__(self: Self[_T], _path: str | os.PathLike, _iterable: Iterable[_T] | None = None) -> None:
+        self.path = os.fspath(_path)
+        self._version = 0
+        self._open()
+        if isinstance(_iterable, Iterable):
+            self.extend(_iterable)
+
+    def _open(self: Self[_T]) -> None:
+        'map the list file and its heap, reading the header of an existing list or writing a new one'
+        exists = os.path.exists(self.path) and 0 < os.path.getsize(self.path)
+        self._file: BinaryIO = open(self.path, 'r+b' if exists else 'w+b')
+        try:
+            self._heap_file: BinaryIO = open(self.path + '.heap', 'r+b' if exists else 'w+b')
+        except BaseException:
+            self._file.close()
+            raise
+        if not exists:
+            self._file.truncate(_BASE + _RECORD.size * _INITIAL_SLOTS)
+            self._heap_file.truncate(_INITIAL_HEAP)
+        self._records = mmap.mmap(self._file.fileno(), 0)
+        self._heap = mmap.mmap(self._heap_file.fileno(), 0)
+        if exists:
+            magic, version, self._len, self._free, self._slots, self._heap_end = _HEADER.unpack_from(self._records)
+            if magic != MAGIC or version != VERSION:
+                self.close()
+                raise ValueError(f'{self.path!r} is not a memory mapped linked list of version {VERSION}')
+        else:
+            self._len, self._free, self._slots, self._heap_end = 0, 0, 1, 0
+            _RECORD.pack_into(self._records, _BASE, 0, 0, 0, 0)
+            self._store_header()
+
+    def _store_header(self: Self[_T]) -> None:
+        _HEADER.pack_into(self._records, 0, MAGIC, VERSION, self._len, self._free, self._slots, self._heap_end)
+
+    @staticmethod
+    def _grow(_map: mmap.mmap, _file: BinaryIO, _size: int) -> mmap.mmap:
+        'return a mapping of file at least size bytes long, doubling the file when it is too short'
+        if _size <= len(_map):
+            return _map
+        size = max(_size, 2 * len(_map))
+        _map.close()
+        _file.truncate(size)
+        return mmap.mmap(_file.fileno(), 0)
+
+    def flush(self: Self[_T]) -> None:
+        'write dirty pages of both files back to disk'
+        self._records.flush()
+        self._heap.flush()
+
+    def close(self: Self[_T]) -> None:
+        'flush and unmap both files, the list can be reopened from its path'
+        if self._file.closed:
+            return
+        if not self._records.closed:
+            self.flush()
+            self._records.close()
+            self._heap.close()
+        self._heap_file.close()
+        self._file.close()
+
+    @property
+    def closed(self: Self[_T]) -> bool:
+        '''True once close was called'''
+        return self._file.closed
+
+    def __enter__(self: Self[_T]) -> Self[_T]:
+        return self
+
+    def __exit__(self: Self[_T], *_: Any) -> None:
+        self.close()
+
+    @property
+    def head(self: Self[_T]) -> Node:
+        '''head sentinel node, insert next to it to prepend'''
+        return Node(0)
+
+    @property
+    def tail(self: Self[_T]) -> Node:
+        '''last node, or head when the list is empty'''
+        return Node(self._prev(0))
+
+    @property
+    def heap_size(self: Self[_T]) -> int:
+        '''bytes written to the value heap, including values that were overwritten or removed since the last compact'''
+        return self._heap_end
+
+    def __repr__(self: Self[_T]) -> str:
+        return f'{type(self).__name__}({self.path!r}, len={self._len})'
+
+    def memory_stats(self: Self[_T], deep: bool = False, unique: bool = True) -> MemoryStats:
+        'return record and heap bytes in use in the mapped files, read from the header in O(1), payloads are the pickled heap bytes whatever deep and unique say'
+        return MemoryStats(self._len, _RECORD.size * (self._slots - 1), _BASE + _RECORD.size, 0, self._heap_end)
+
+    def _offset(self: Self[_T], _slot: int) -> int:
+        return _BASE + _RECORD.size * _slot
+
+    def _prev(self: Self[_T], _slot: int) -> int:
+        return _LINK.unpack_from(self._records, _BASE + _RECORD.size * _slot)[0]
+
+    def _next(self: Self[_T], _slot: int) -> int:
+        return _LINK.unpack_from(self._records, _BASE + _RECORD.size * _slot + 8)[0]
+
+    def _set_prev(self: Self[_T], _slot: int, _prev: int) -> None:
+        _LINK.pack_into(self._records, _BASE + _RECORD.size * _slot, _prev)
+
+    def _set_next(self: Self[_T], _slot: int, _next: int) -> None:
+        _LINK.pack_into(self._records, _BASE + _RECORD.size * _slot + 8, _next)
+
+    def _load(self: Self[_T], _slot: int) -> _T:
+        'unpickle the value of a record from the heap'
+        _, _, offset, size = _RECORD.unpack_from(self._records, self._offset(_slot))
+        return pickle.loads(self._heap[offset:offset + size])
+
+    def _store(self: Self[_T], _value: _T) -> tuple[int, int]:
+        'append the pickled value to the heap and return its offset and size'
+        return self._append_heap(pickle.dumps(_value, pickle.HIGHEST_PROTOCOL))
+
+    def _append_heap(self: Self[_T], _data: bytes) -> tuple[int, int]:
+        offset = self._heap_end
+        self._heap = self._grow(self._heap, self._heap_file, offset + len(_data))
+        self._heap[offset:offset + len(_data)] = _data
+        self._heap_end = offset + len(_data)
+        return offset, len(_data)
+
+    def __iter__(self: Self[_T]) -> Iterator[_T]:
+        return self.values()
+
+    def __reversed__(self: Self[_T]) -> Iterator[_T]:
+        return self.values(True)
+
+    def values(self: Self[_T], _reverse: bool = False) -> Iterator[_T]:
+        'iterate over values'
+        for slot in self._slots_of(_reverse):
+            yield self._load(slot)
+
+    def nodes(self: Self[_T], _reverse: bool = False) -> Iterator[Node]:
+        'iterate over node handles'
+        for slot in self._slots_of(_reverse):
+            yield Node(slot)
+
+    def _slots_of(self: Self[_T], _reverse: bool = False) -> Iterator[int]:
+        version = self._version
+        link = self._prev if _reverse else self._next
+        slot = link(0)
+        while slot:
+            yield slot
+            if self._version != version:
+                raise RuntimeError('list mutated during iteration')
+            slot = link(slot)
+
+    def __len__(self: Self[_T]) -> int:
+        if self.debug and self._len != self._count():
+            raise AssertionError(f'cached length {self._len} does not match node count {self._count()}')
+        return self._len
+
+    def _count(self: Self[_T]) -> int:
+        'count nodes by walking the whole chain'
+        _len = 0
+        slot = self._next(0)
+        while slot:
+            slot = self._next(slot)
+            _len += 1
+        return _len
+
+    def _slot(self: Self[_T], _index: int) -> int:
+        'return slot at index, walking from whichever end is nearer'
+        _n = self._len
+        if _index < 0:
+            _index += _n
+        if not 0 <= _index < _n:
+            raise IndexError('list index out of range')
+        slot = 0
+        if _index < _n - _index:
+            for _ in range(_index + 1):
+                slot = self._next(slot)
+        else:
+            for _ in range(_n - _index):
+                slot = self._prev(slot)
+        return slot
+
+    def _valid_node(self: Self[_T], _node: Node, _head: bool = False) -> int:
+        if not isinstance(_node, Node):
+            raise TypeError(f'node must be a {Node.__name__}, not {type(_node)}')
+        if not (_head and _node == 0) and not (0 < _node < self._slots and self._prev(_node) >= 0):
+            raise ValueError(f'{_node!r} is not in the list')
+        return int(_node)
+
+    def node(self: Self[_T], _index: int) -> Node:
+        'return node handle at index'
+        return Node(self._slot(_index))
+
+    def value(self: Self[_T], _node: Node) -> _T:
+        'return value held by node'
+        return self._load(self._valid_node(_node))
+
+    def index(self: Self[_T], _value: _T, _start: int = 0, _stop: int | None = None) -> int:
+        'return first index of value'
+        start, stop, _ = slice(_start, _stop).indices(self._len)
+        for _i, slot in enumerate(self._slots_of()):
+            if _i >= stop:
+                break
+            if _i >= start:
+                _v = self._load(slot)
+                if _v is _value or _v == _value:
+                    return _i
+        raise ValueError(f'{_value!r} is not in list')
+
+    @overload
+    def __getitem__(self: Self[_T], __i: int) -> _T: ...
+    @overload
+    def __getitem__(self: Self[_T], __s: slice) -> list[_T]: ...
+
+    def __getitem__(self: Self[_T], _index: int | slice) -> _T | list[_T]:
+        if isinstance(_index, int):
+            return self._load(self._slot(_index))
+        elif isinstance(_index, slice):
+            return list(self)[_index]
+        else:
+            raise TypeError(f'index must be integers or slices, not {type(_index)}')
+
+    @overload
+    def __setitem__(self: Self[_T], __i: int, __v: _T) -> None: ...
+    @overload
+    def __setitem__(self: Self[_T], __s: slice, __o: Iterable[_T]) -> None: ...
+
+    def __setitem__(self: Self[_T], _index: int | slice, _value: _T | Iterable[_T]) -> None:
+        if isinstance(_index, int):
+            slot = self._slot(_index)
+            offset, size = self._store(_value)
+            _RECORD.pack_into(self._records, self._offset(slot), self._prev(slot), self._next(slot), offset, size)
+            self._store_header()
+        elif isinstance(_index, slice):
+            self._set_slice(_index, _value)
+        else:
+            raise TypeError(f'index must be integers or slices, not {type(_index)}')
+
+    @overload
+    def __delitem__(self: Self[_T], __i: int) -> None: ...
+    @overload
+    def __delitem__(self: Self[_T], __s: slice) -> None: ...
+
+    def __delitem__(self: Self[_T], _index: int | slice) -> None:
+        if isinstance(_index, int):
+            self._unlink(self._slot(_index))
+        elif isinstance(_index, slice):
+            for slot in self._slice_slots(range(*_index.indices(self._len))):
+                self._unlink(slot)
+        else:
+            raise TypeError(f'index must be integers or slices, not {type(_index)}')
+
+    def _slice_slots(self: Self[_T], _range: range) -> list[int]:
+        'return the slots of a range of indexes in one walk, in the order of the range'
+        if not _range:
+            return []
+        ascending = _range if 0 < _range.step else _range[::-1]
+        slot = self._slot(ascending[0])
+        slots = [slot]
+        for _ in range(len(ascending) - 1):
+            for _ in range(ascending.step):
+                slot = self._next(slot)
+            slots.append(slot)
+        if _range.step < 0:
+            slots.reverse()
+        return slots
+
+    def _set_slice(self: Self[_T], _index: slice, _value: Iterable[_T]) -> None:
+        'assign a slice in place, freeing the replaced records and linking new ones, so handles outside the slice keep their values'
+        if not isinstance(_value, Iterable):
+            raise TypeError('can only assign an iterable')
+        values = list(_value)
+        start, stop, step = _index.indices(self._len)
+        _range = range(start, stop, step)
+        if step != 1 and len(values) != len(_range):
+            raise ValueError(f'attempt to assign sequence of size {len(values)} to extended slice of size {len(_range)}')
+        stored = [self._store(value) for value in values]
+        if step == 1:
+            prev = self._slot(start - 1) if start else 0
+            for _ in range(max(start, stop) - start):
+                self._unlink(self._next(prev))
+            for offset, size in stored:
+                prev = self._link_after(prev, offset, size)
+            self._version += 1
+        else:
+            for slot, (offset, size) in zip(self._slice_slots(_range), stored):
+                _RECORD.pack_into(self._records, self._offset(slot), self._prev(slot), self._next(slot), offset, size)
+        self._store_header()
+
+    def _unlink(self: Self[_T], _slot: int) -> None:
+        prev, _next = self._prev(_slot), self._next(_slot)
+        self._set_next(prev, _next)
+        self._set_prev(_next, prev)
+        _RECORD.pack_into(self._records, self._offset(_slot), -1 - self._free, -1 - self._free, 0, 0)
+        self._free = _slot
+        self._len -= 1
+        self._version += 1
+        self._store_header()
+
+    def _link_after(self: Self[_T], _prev: int, _offset: int, _size: int) -> int:
+        'write a record for the heap bytes at offset next to prev and return its slot, leaving the header to the caller'
+        if self._free:
+            slot = self._free
+            self._free = -1 - self._next(slot)
+        else:
+            slot = self._slots
+            self._records = self._grow(self._records, self._file, self._offset(slot + 1))
+            self._slots += 1
+        _next = self._next(_prev)
+        _RECORD.pack_into(self._records, self._offset(slot), _prev, _next, _offset, _size)
+        self._set_next(_prev, slot)
+        self._set_prev(_next, slot)
+        self._len += 1
+        return slot
+
+    @overload
+    def insert(self: Self[_T], __i: int, __v: _T) -> None: ...
+    @overload
+    def insert(self: Self[_T], __n: Node, __v: _T) -> None: ...
+
+    def insert(self: Self[_T], _index: int | Node, _value: _T) -> None:
+        'insert value to index or next to node'
+        if isinstance(_index, Node):
+            prev = self._valid_node(_index, True)
+        elif isinstance(_index, int):
+            _index = max(_index + self._len, 0) if _index < 0 else min(_index, self._len)
+            prev = self._slot(_index - 1) if _index else 0
+        else:
+            raise IndexError('index must be integers or a node')
+        self._link_after(prev, *self._store(_value))
+        self._version += 1
+        self._store_header()
+
+    def append(self: Self[_T], _value: _T) -> None:
+        'append value to the end of the sequence, touching the sentinel, the old last record and the heap end'
+        self.insert(Node(self._prev(0)), _value)
+
+    def appendleft(self: Self[_T], _value: _T) -> None:
+        'prepend value to the start of the sequence'
+        self.insert(Node(0), _value)
+
+    def extend(self: Self[_T], _values: Iterable[_T]) -> None:
+        'append every value of the iterable, writing the header once'
+        if _values is self:
+            _values = list(_values)
+        prev = self._prev(0)
+        try:
+            for value in _values:
+                prev = self._link_after(prev, *self._store(value))
+        finally:
+            self._version += 1
+            self._store_header()
+
+    def pop(self: Self[_T], _index: int = -1) -> _T:
+        'remove and return value at index, the last one by default in O(1)'
+        if not self._len:
+            raise IndexError('pop from empty list')
+        slot = self._prev(0) if _index == -1 else self._slot(_index)
+        value = self._load(slot)
+        self._unlink(slot)
+        return value
+
+    def popleft(self: Self[_T]) -> _T:
+        'remove and return the first value, in O(1)'
+        if not self._len:
+            raise IndexError('pop from empty list')
+        slot = self._next(0)
+        value = self._load(slot)
+        self._unlink(slot)
+        return value
+
+    @overload
+    def remove(self: Self[_T], __v: _T) -> None: ...
+    @overload
+    def remove(self: Self[_T], __n: Node) -> None: ...
+
+    def remove(self: Self[_T], _value: _T | Node) -> None:
+        'remove first occurrence of value or node'
+        if isinstance(_value, Node):
+            self._unlink(self._valid_node(_value))
+            return
+        for slot in self._slots_of():
+            _v = self._load(slot)
+            if _v is _value or _v == _value:
+                self._unlink(slot)
+                return
+        raise ValueError(f'{_value!r} is not in list')
+
+    def clear(self: Self[_T]) -> None:
+        'remove all values and shrink both files back to their initial size'
+        self._records.close()
+        self._heap.close()
+        self._file.truncate(_BASE + _RECORD.size * _INITIAL_SLOTS)
+        self._heap_file.truncate(_INITIAL_HEAP)
+        self._records = mmap.mmap(self._file.fileno(), 0)
+        self._heap = mmap.mmap(self._heap_file.fileno(), 0)
+        self._len, self._free, self._slots, self._heap_end = 0, 0, 1, 0
+        _RECORD.pack_into(self._records, _BASE, 0, 0, 0, 0)
+        self._version += 1
+        self._store_header()
+
+    def compact(self: Self[_T]) -> None:
+        'rewrite live values in list order into fresh files, dropping free records and dead heap bytes and invalidating node handles'
+        path = self.path + '.compact'
+        for _path in (path, path + '.heap'):
+            if os.path.exists(_path):
+                os.remove(_path)
+        with type(self)(path) as new:
+            prev = 0
+            for slot in self._slots_of():
+                _, _, offset, size = _RECORD.unpack_from(self._records, self._offset(slot))
+                prev = new._link_after(prev, *new._append_heap(self._heap[offset:offset + size]))
+            new._version += 1
+            new._store_header()
+        self.close()
+        os.replace(path, self.path)
+        os.replace(path + '.heap', self.path + '.heap')
+        self._version += 1
+        self._open()
+
+    def reverse(self: Self[_T]) -> None:
+        'reverse the list by swapping the links of every record'
+        for slot in range(self._slots):
+            prev, _next = self._prev(slot), self._next(slot)
+            self._set_prev(slot, _next)
+            self._set_next(slot, prev)
+        self._version += 1
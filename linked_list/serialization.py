@@ -0,0 +1,123 @@
+'''linked list serialization module'''
+from __future__ import annotations
+import io
+import json
+import pickle
+import struct
+import sys
+from array import array
+from typing import Any, BinaryIO
+from .singly_linked_list import List as SinglyLinkedList
+from .doubly_linked_list import List as DoublyLinkedList
+from .singly_circularly_linked_list import List as SinglyCircularlyLinkedList
+from .doubly_circularly_linked_list import List as DoublyCircularlyLinkedList
+from .unrolled_linked_list import List as UnrolledLinkedList
+from .array_linked_list import List as ArrayLinkedList
+from .sorted_linked_list import SortedLinkedList
+
+MAGIC = b'LLST'
+VERSION = 1
+
+CLASSES: dict[str, type] = {
+    'SinglyLinkedList': SinglyLinkedList,
+    'DoublyLinkedList': DoublyLinkedList,
+    'SinglyCircularlyLinkedList': SinglyCircularlyLinkedList,
+    'DoublyCircularlyLinkedList': DoublyCircularlyLinkedList,
+    'UnrolledLinkedList': UnrolledLinkedList,
+    'ArrayLinkedList': ArrayLinkedList,
+    'SortedLinkedList': SortedLinkedList,
+}
+_NAMES = {_cls: _name for _name, _cls in CLASSES.items()}
+
+_INT64, _FLOAT64, _BYTES, _PICKLE = range(4)
+
+_HEADER = struct.Struct('<4sBBHIQQ')
+
+
+def _native(_array: array) -> array:
+    'swap an array between native and little endian order on big endian machines'
+    if sys.byteorder == 'big':
+        _array.byteswap()
+    return _array
+
+
+def _encode(_values: list[Any]) -> tuple[int, bytes]:
+    'return the payload kind and bytes of a value sequence, typed arrays for homogeneous int, float and bytes values'
+    if _values and all(type(_v) is int for _v in _values):
+        try:
+            return _INT64, _native(array('q', _values)).tobytes()
+        except OverflowError:
+            pass
+    elif _values and all(type(_v) is float for _v in _values):
+        return _FLOAT64, _native(array('d', _values)).tobytes()
+    elif _values and all(type(_v) is bytes for _v in _values):
+        return _BYTES, _native(array('Q', map(len, _values))).tobytes() + b''.join(_values)
+    return _PICKLE, pickle.dumps(_values, pickle.HIGHEST_PROTOCOL)
+
+
+def _decode(_kind: int, _count: int, _payload: bytes) -> list[Any]:
+    if _kind == _INT64 or _kind == _FLOAT64:
+        values = array('q' if _kind == _INT64 else 'd')
+        values.frombytes(_payload)
+        return _native(values).tolist()
+    if _kind == _BYTES:
+        lengths = array('Q')
+        lengths.frombytes(_payload[:8 * _count])
+        view, pos, values = memoryview(_payload), 8 * _count, []
+        for length in _native(lengths):
+            values.append(bytes(view[pos:pos + length]))
+            pos += length
+        return values
+    if _kind == _PICKLE:
+        return pickle.loads(_payload)
+    raise ValueError(f'unknown payload kind {_kind}')
+
+
+def dump(_list: Any, _file: BinaryIO) -> None:
+    'write a list to a binary file as its class name, constructor options and a length prefixed value payload'
+    name = _NAMES.get(type(_list))
+    if name is None:
+        raise TypeError(f'cannot dump {type(_list).__name__}')
+    _, (values, *options) = _list.__reduce__()
+    try:
+        meta = json.dumps(options).encode()
+    except TypeError as exc:
+        raise TypeError(f'cannot dump the options of {name}, {exc}') from None
+    kind, payload = _encode(values)
+    encoded = name.encode()
+    _file.write(_HEADER.pack(MAGIC, VERSION, kind, len(encoded), len(meta), len(values), len(payload)))
+    _file.write(encoded)
+    _file.write(meta)
+    _file.write(payload)
+
+
+def load(_file: BinaryIO) -> Any:
+    'read a list written by dump'
+    header = _file.read(_HEADER.size)
+    if len(header) < _HEADER.size:
+        raise ValueError('truncated linked list header')
+    magic, version, kind, name_len, meta_len, count, payload_len = _HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError('not a linked list dump')
+    if version != VERSION:
+        raise ValueError(f'unsupported linked list dump version {version}')
+    name = _file.read(name_len).decode()
+    options = json.loads(_file.read(meta_len))
+    payload = _file.read(payload_len)
+    if len(payload) < payload_len:
+        raise ValueError('truncated linked list payload')
+    if name not in CLASSES:
+        raise ValueError(f'unknown linked list class {name}')
+    return CLASSES[name]._restore(_decode(kind, count, payload), *options)
+
+
+def dumps(_list: Any) -> bytes:
+    'return the bytes dump would write'
+    file = io.BytesIO()
+    dump(_list, file)
+    return file.getvalue()
+
+
+def loads(_data: bytes) -> Any:
+    'read a list from bytes written by dumps'
+    return load(io.BytesIO(_data))
@@ -1,19 +1,43 @@
 '''singly circularly linked list module'''
 from __future__ import annotations
+import functools
 import sys
+import threading
 import types
-from typing import Any, Callable, Generic, TypeVar, Iterable, MutableSequence, overload, Self
+from typing import Any, Callable, Generic, TypeVar, Iterable, Iterator, MutableSequence, overload, Self
+from .value_proxy import ValueProxy
+from .memory import MemoryStats, PayloadCounter, class_size, node_size
+from .value_index import ValueIndex
+from .views import NodeView
 
 _T = TypeVar('_T')
 
 
-class Node(Generic[_T]):
+def _locked(func: Callable) -> Callable:
+    'run a list method while holding the lock of the list'
+    @functools.wraps(func)
+    def wrapper(self: List, *args: Any, **kwargs: Any) -> Any:
+        with self._lock:
+            return func(self, *args, **kwargs)
+    return wrapper
+
+
+class Node(ValueProxy, Generic[_T]):
     '''singly circularly node class'''
     __slots__ = ('value', 'next',)
     value: _T
     next: Node[_T] | Node[None]
 
-    def __new__(cls: type[Self[_T]], _value: _T, _next: Node[_T] | None = None) -> Node[_T]:
+    def __init__(self: Self[_T], _value: _T, _next: Node[_T] | None = None) -> None:
+        self.value = _value
+        self.next = self if _next is None else _next
+
+    def __reduce__(self: Self[_T]) -> tuple[Callable[..., Node[_T]], tuple[_T]]:
+        return type(self), (self.value, )
+
+    @classmethod
+    def dynamic(cls: type[Self[_T]], _value: _T, _next: Node[_T] | None = None) -> Node[_T]:
+        'create node of a new class forwarding every special method of the value type'
         def _is_special(name: str) -> bool:
             if name in {'__lt__', '__le__', '__eq__', '__ne__', '__gt__', '__ge__', '__repr__', '__str__', '__or__', '__ror__'}:
                 return True
@@ -27,7 +51,7 @@ class Node(Generic[_T]):
             return wrapper
 
         classdict = {method: _method(getattr(type(_value), method)) for method in dir(type(_value)) if _is_special(method)}
-        classdict.update({'value': _value, 'next': _next})
+        classdict.update({'__reduce__': lambda _self: (cls.dynamic, (_self.value, )), 'value': _value, 'next': _next})
         _cls = types.new_class('Node', (object, ), exec_body=lambda ns: ns.update(classdict))
         self = object.__new__(_cls)
         self.next = self if _next is None else _next
@@ -35,28 +59,183 @@ class Node(Generic[_T]):
 
 
 class List(MutableSequence[Node[_T]], Generic[_T]):
-    'singly circularly linked list class'
-    __slots__ = ('head', 'tail', )
+    'singly circularly linked list class, methods that index or relink nodes hold the list lock, iteration and value searches do not, so hold lock around them while other threads mutate'
+    __slots__ = ('head', 'tail', '_dynamic', '_len', '_version', '_finger', '_finger_index', '_lookup', '_maxlen', '_lock', )
+    debug = False
 
     @overload
-    def __init__(self: Self[_T]) -> None: ...
+    def __init__(self: Self[_T], *, dynamic: bool = ..., hashed: bool = ..., maxlen: int | None = ...) -> None: ...
     @overload
-    def __init__(self: Self[_T], __i: Iterable[_T]) -> None: ...
+    def __init__(self: Self[_T], __i: Iterable[_T], *, dynamic: bool = ..., hashed: bool = ..., maxlen: int | None = ...) -> None: ...
 
-    def __init__(self: Self[_T], _iterable: Iterable[_T] | None = None) -> None:
+    def __init__(self: Self[_T], _iterable: Iterable[_T] | None = None, *, dynamic: bool = False, hashed: bool = False, maxlen: int | None = None) -> None:
+        self._dynamic = dynamic
+        self._len = 0
+        self._version = 0
+        self._finger: Node[_T] | Node[None] | None = None
+        self._finger_index = -1
         self.head: Node[None] = Node(None)
         self.tail: Node[_T] | Node[None] = self.head
+        self._lookup = ValueIndex() if hashed else None
+        if maxlen is not None and maxlen < 0:
+            raise ValueError('maxlen must be non-negative')
+        self._maxlen = maxlen
+        self._lock = threading.RLock()
         if isinstance(_iterable, Iterable):
-            for _v in _iterable:
-                self.append(_v)
+            self.extend(_iterable)
+
+    @classmethod
+    def from_iterable(cls: type[Self[_T]], _iterable: Iterable[_T], _length_hint: int | None = None, *, dynamic: bool = False, hashed: bool = False, maxlen: int | None = None) -> Self[_T]:
+        'build a list linking the whole iterable in one pass, length hint is advisory'
+        return cls(_iterable, dynamic=dynamic, hashed=hashed, maxlen=maxlen)
+
+    def __reduce__(self: Self[_T]) -> tuple[Callable[..., Self[_T]], tuple[Any, ...]]:
+        return self._restore, (list(self._iter(_values=True)), self._dynamic, self._lookup is not None, self._maxlen)
+
+    @classmethod
+    def _restore(cls: type[Self[_T]], _values: Iterable[_T], dynamic: bool, hashed: bool, maxlen: int | None) -> Self[_T]:
+        'rebuild a list from the flat value sequence written by __reduce__'
+        return cls(_values, dynamic=dynamic, hashed=hashed, maxlen=maxlen)
+
+    @property
+    def maxlen(self: Self[_T]) -> int | None:
+        '''maximum length, None when unbounded'''
+        return self._maxlen
+
+    @property
+    def lock(self: Self[_T]) -> threading.RLock:
+        '''reentrant lock held by every indexing and relinking method, hold it to make several calls or an iteration atomic'''
+        return self._lock
 
     def __repr__(self: Self[_T]) -> str:
-        return repr([_v for _v in self])
+        return repr(list(self.values()))
+
+    def __iter__(self: Self[_T]) -> Iterator[Node[_T]]:
+        return self._iter()
+
+    def __reversed__(self: Self[_T]) -> Iterator[Node[_T]]:
+        return self._iter(_reverse=True)
+
+    def values(self: Self[_T], _reverse: bool = False) -> Iterator[_T]:
+        'iterate over node values instead of nodes'
+        return self._iter(_reverse, True)
+
+    def _iter(self: Self[_T], _reverse: bool = False, _values: bool = False) -> Iterator[Node[_T]] | Iterator[_T]:
+        version = self._version
+        if _reverse:
+            nodes = []
+            node = self.head.next
+            while node is not self.head:
+                nodes.append(node)
+                node = node.next
+            for node in reversed(nodes):
+                yield node.value if _values else node
+                if self._version != version:
+                    raise RuntimeError('list mutated during iteration')
+            return
+        node = self.head.next
+        while node is not self.head:
+            yield node.value if _values else node
+            if self._version != version:
+                raise RuntimeError('list mutated during iteration')
+            node = node.next
+
+    def index(self: Self[_T], _value: _T, _start: int = 0, _stop: int | None = None) -> int:
+        'return first index of value'
+        start, stop, _ = slice(_start, _stop).indices(self._len)
+        nodes = self._hashed(_value)
+        if nodes is not None and not nodes:
+            raise ValueError(f'{_value!r} is not in list')
+        for _i, node in enumerate(self._iter()):
+            if _i >= stop:
+                break
+            if _i >= start and ((id(node) in nodes) if nodes is not None else (node is _value or node == _value)):
+                return _i
+        raise ValueError(f'{_value!r} is not in list')
+
+    def _hashed(self: Self[_T], _value: Any) -> dict[int, Node[_T]] | None:
+        'return the nodes holding value keyed by id, or None when there is no value index to ask'
+        if self._lookup is None:
+            return None
+        if self._lookup.stale:
+            self._lookup.build(self._iter())
+        return self._lookup.get(_value)
+
+    def __contains__(self: Self[_T], _value: Any) -> bool:
+        nodes = self._hashed(_value)
+        if nodes is None:
+            return super().__contains__(_value)
+        return bool(nodes)
+
+    def count(self: Self[_T], _value: Any) -> int:
+        'return number of occurrences of value, in O(1) with a value index'
+        nodes = self._hashed(_value)
+        if nodes is None:
+            return super().count(_value)
+        return len(nodes)
+
+    def _find_prev(self: Self[_T], _value: _T) -> Node[_T] | Node[None]:
+        'return the node before the first one holding value in one walk, matching node ids when there is a value index'
+        nodes = self._hashed(_value)
+        if nodes is not None and not nodes:
+            raise ValueError(f'{_value!r} is not in list')
+        prev, node = self.head, self.head.next
+        while node is not self.head:
+            if (id(node) in nodes) if nodes is not None else (node is _value or node == _value):
+                return prev
+            prev, node = node, node.next
+        raise ValueError(f'{_value!r} is not in list')
+
+    def find(self: Self[_T], _value: _T) -> Node[_T]:
+        'return the first node holding value, in O(1) when a value index holds a single one'
+        nodes = self._hashed(_value)
+        if nodes is not None and len(nodes) == 1:
+            return next(iter(nodes.values()))
+        return self._find_prev(_value).next
+
+    def view(self: Self[_T], _start: int = 0, _stop: int | None = None) -> NodeView[_T]:
+        'return a lazy view of the nodes from start up to stop without copying them'
+        start, stop, _ = slice(_start, _stop).indices(self._len)
+        if stop <= start:
+            return NodeView(self, None, None, 0)
+        first = self._node(start)
+        last = first
+        for _ in range(stop - start - 1):
+            last = last.next
+        return NodeView(self, first, last, stop - start)
+
+    def window(self: Self[_T], _node: Node[_T], _count: int) -> NodeView[_T]:
+        'return a lazy view of at most count nodes starting at node'
+        if _count <= 0 or _node is self.head:
+            return NodeView(self, None, None, 0)
+        last, count = _node, 1
+        while count < _count and last.next is not self.head:
+            last = last.next
+            count += 1
+        return NodeView(self, _node, last, count)
 
     def __sizeof__(self: Self[_T]) -> int:
         return sys.getsizeof(self.head) + sum([sys.getsizeof(_v) for _v in self])
 
+    def memory_stats(self: Self[_T], deep: bool = False, unique: bool = True) -> MemoryStats:
+        'return node, sentinel, per node class, payload and index bytes from one pass over the chain, payloads deep or shallow and shared objects counted once when unique'
+        payload = PayloadCounter(deep, unique)
+        count = node_bytes = class_bytes = 0
+        for node in self._iter():
+            count += 1
+            node_bytes += node_size(node)
+            if self._dynamic:
+                class_bytes += class_size(type(node))
+            payload.add(node.value)
+        return MemoryStats(count, node_bytes, node_size(self.head), class_bytes, payload.bytes, 0 if self._lookup is None else sys.getsizeof(self._lookup))
+
     def __len__(self: Self[_T]) -> int:
+        if self.debug and self._len != self._count():
+            raise AssertionError(f'cached length {self._len} does not match node count {self._count()}')
+        return self._len
+
+    def _count(self: Self[_T]) -> int:
+        'count nodes by walking the whole chain'
         _len = 0
         node = self.head.next
         while True:
@@ -66,36 +245,37 @@ class List(MutableSequence[Node[_T]], Generic[_T]):
             _len += 1
         return _len
 
-    def _valid_index(self: Self[_T], _index: int, _raise: bool = True) -> int:
-        _n = len(self)
+    def _position(self: Self[_T], _index: int) -> int:
         if _index < 0:
-            _index += _n
-            if _index < 0:
-                _index = 0
-        if _index > _n:
-            if _raise:
-                raise IndexError('list assignment index out of range')
-            _index = _n
+            _index += self._len
+        if not 0 <= _index < self._len:
+            raise IndexError('list assignment index out of range')
         return _index
 
+    def _node(self: Self[_T], _index: int) -> Node[_T] | Node[None]:
+        'return node at index (head at -1), walking from head, finger or tail'
+        if _index == self._len - 1:
+            node = self.tail
+        else:
+            node, start = self.head, -1
+            if self._finger is not None and self._finger_index <= _index:
+                node, start = self._finger, self._finger_index
+            for _ in range(_index - start):
+                node = node.next
+        self._finger, self._finger_index = node, _index
+        return node
+
     @overload
     def __getitem__(self: Self[_T], __i: int) -> Node[_T]: ...
     @overload
     def __getitem__(self: Self[_T], __s: slice) -> Self[_T]: ...
 
+    @_locked
     def __getitem__(self: Self[_T], _index: int | slice) -> Node[_T] | Self[_T]:
         if isinstance(_index, int):
-            node = self.head.next
-            if node is self.head:
-                raise IndexError('list assignment index out of range')
-            for _ in range(self._valid_index(_index)):
-                node = node.next
-                if node is self.head:
-                    raise IndexError('list assignment index out of range')
-            return node
+            return self._node(self._position(_index))
         elif isinstance(_index, slice):
-            start, stop, step = _index.indices(len(self))
-            return List([self[_i] for _i in range(start, stop, step)])
+            return self._get_slice(_index)
         else:
             raise TypeError(f'index must be integers or slices, not {type(_index)}')
 
@@ -104,25 +284,18 @@ class List(MutableSequence[Node[_T]], Generic[_T]):
     @overload
     def __setitem__(self: Self[_T], __s: slice, __o: Iterable[_T]) -> None: ...
 
+    @_locked
     def __setitem__(self: Self[_T], _index: int | slice, _value: _T | Iterable[_T]) -> None:
         if isinstance(_index, int):
-            prev = self.head
-            node = prev.next
-            if node is self.head:
-                raise IndexError('list assignment index out of range')
-            for _ in range(self._valid_index(_index)):
-                prev = node
-                node = prev.next
-                if node is self.head:
-                    raise IndexError('list assignment index out of range')
-            prev.value = _value
-        elif isinstance(_index, slice):
-            if isinstance(_value, Iterable):
-                start, stop, stride = _index.indices(len(self))
-                for _i, _v in zip(range(start, stop, stride), _value):
-                    self[_i] = _v
+            node = self._node(self._position(_index))
+            if self._lookup is not None:
+                self._lookup.discard(node)
+                node.value = _value
+                self._lookup.add(node)
             else:
-                raise TypeError('can only assign an iterable')
+                node.value = _value
+        elif isinstance(_index, slice):
+            self._set_slice(_index, _value)
         else:
             raise TypeError(f'index must be integers or slices, not {type(_index)}')
 
@@ -131,28 +304,103 @@ class List(MutableSequence[Node[_T]], Generic[_T]):
     @overload
     def __delitem__(self: Self[_T], __s: slice) -> None: ...
 
+    @_locked
     def __delitem__(self: Self[_T], _index: int | slice) -> None:
         if isinstance(_index, int):
-            prev = self.head
+            prev = self._node(self._position(_index) - 1)
             node = prev.next
-            if node is self.head:
-                raise IndexError('list assignment index out of range')
-            for _ in range(self._valid_index(_index)):
-                prev = node
-                node = prev.next
-                if node is self.head:
-                    raise IndexError('list assignment index out of range')
             prev.next = node.next
+            if self._lookup is not None:
+                self._lookup.discard(node)
             if prev.next is self.head:
-                self.tail = self.head
+                self.tail = prev
+            self._len -= 1
+            self._version += 1
             del node
         elif isinstance(_index, slice):
-            start, stop, stride = _index.indices(len(self))
-            for _i in range(start, stop, stride):
-                del self[_i]
+            self._del_slice(_index)
         else:
             raise TypeError(f'index must be integers or slices, not {type(_index)}')
 
+    def _get_slice(self: Self[_T], _index: slice) -> Self[_T]:
+        'copy the values of a slice into a new list in one walk'
+        _range = range(*_index.indices(self._len))
+        values = []
+        if _range:
+            ascending = _range if 0 < _range.step else _range[::-1]
+            node = self._node(ascending[0])
+            values.append(node.value)
+            for _ in range(len(ascending) - 1):
+                for _ in range(ascending.step):
+                    node = node.next
+                values.append(node.value)
+            if _range.step < 0:
+                values.reverse()
+        return type(self)(values, dynamic=self._dynamic, hashed=self._lookup is not None)
+
+    def _set_slice(self: Self[_T], _index: slice, _value: Iterable[_T]) -> None:
+        'assign a slice in one walk, like list a contiguous slice may change length'
+        if self._lookup is not None:
+            self._lookup.invalidate()
+        if not isinstance(_value, Iterable):
+            raise TypeError('can only assign an iterable')
+        values = list(self.values()) if _value is self else list(_value)
+        start, stop, step = _index.indices(self._len)
+        if step == 1:
+            stop = max(start, stop)
+            prev = self._node(start - 1)
+            after = prev.next
+            for _ in range(stop - start):
+                after = after.next
+            new = Node.dynamic if self._dynamic else Node
+            first = last = Node(None)
+            for _v in values:
+                last.next = new(_v)
+                last = last.next
+            last.next = after
+            prev.next = first.next
+            if after is self.head:
+                self.tail = prev if last is first else last
+            self._len += len(values) - (stop - start)
+            self._version += 1
+            self._finger = None
+            self._trim()
+            return
+        _range = range(start, stop, step)
+        if len(values) != len(_range):
+            raise ValueError(f'attempt to assign sequence of size {len(values)} to extended slice of size {len(_range)}')
+        if not _range:
+            return
+        if step < 0:
+            _range, values = _range[::-1], values[::-1]
+        node = self._node(_range[0])
+        for _i, _v in enumerate(values):
+            if _i:
+                for _ in range(_range.step):
+                    node = node.next
+            node.value = _v
+
+    def _del_slice(self: Self[_T], _index: slice) -> None:
+        'delete a slice in one walk'
+        if self._lookup is not None:
+            self._lookup.invalidate()
+        _range = range(*_index.indices(self._len))
+        if not _range:
+            return
+        if _range.step < 0:
+            _range = _range[::-1]
+        prev = self._node(_range[0] - 1)
+        for _i in range(len(_range)):
+            prev.next = prev.next.next
+            if _i < len(_range) - 1:
+                for _ in range(_range.step - 1):
+                    prev = prev.next
+        if prev.next is self.head:
+            self.tail = prev
+        self._len -= len(_range)
+        self._version += 1
+        self._finger = None
+
     @overload
     def insert(self: Self[_T], __i: int, __v: _T) -> None: ...
     @overload
@@ -160,40 +408,382 @@ class List(MutableSequence[Node[_T]], Generic[_T]):
     @overload
     def insert(self: Self[_T], __n: Node[None], __v: _T) -> None: ...
 
+    @_locked
     def insert(self: Self[_T], _index: int | Node[_T] | Node[None], _value: _T) -> None:
         'insert value to index or next to node'
+        if self._maxlen is not None and self._len >= self._maxlen:
+            raise IndexError('list already at its maximum size')
         try:
-            node = Node(_value, _index.next)
+            node = (Node.dynamic if self._dynamic else Node)(_value, _index.next)
+            _index.next = node
             if node.next is self.head:
-                self.tail= node
+                self.tail = node
+            if self._lookup is not None:
+                self._lookup.add(node)
+            self._len += 1
+            self._version += 1
+            self._finger = None
         except AttributeError as exc:
             if isinstance(_index, int):
-                node = self.head
-                for _ in range(self._valid_index(_index, False)):
-                    if node.next is None:
-                        break
-                    node = node.next
-                self.insert(node, _value)
+                _index = max(_index + self._len, 0) if _index < 0 else min(_index, self._len)
+                prev = self._node(_index - 1)
+                self.insert(prev, _value)
+                self._finger, self._finger_index = prev.next, _index
             else:
                 raise IndexError('index must be integers or a node') from exc
 
-    def append(self, _value: _T) -> None:
-        'append value to the end of the sequence'
+    @_locked
+    def extend(self: Self[_T], _values: Iterable[_T]) -> None:
+        'append every value of the iterable, linking the batch before splicing it on'
+        if _values is self:
+            _values = list(self.values())
+        new = Node.dynamic if self._dynamic else Node
+        start = last = Node(None)
+        count = 0
+        for _v in _values:
+            last.next = new(_v)
+            last = last.next
+            count += 1
+        if last is start:
+            return
+        last.next = self.head
+        self.tail.next = start.next
+        self.tail = last
+        if self._lookup is not None:
+            node = start.next
+            while node is not self.head:
+                self._lookup.add(node)
+                node = node.next
+        self._len += count
+        self._version += 1
+        self._trim()
+
+    @_locked
+    def splice(self: Self[_T], other: Self[_T], _node: Node[_T] | Node[None]) -> None:
+        'move every node of other next to node, leaving other empty'
+        if type(other) is not type(self):
+            raise TypeError(f'can only splice {type(self).__name__}, not {type(other).__name__}')
+        if other is self:
+            raise ValueError('cannot splice a list into itself')
+        if other._len == 0:
+            return
+        first, last = other.head.next, other.tail
+        other.head.next, other.tail = other.head, other.head
+        last.next = _node.next
+        _node.next = first
+        if _node is self.tail:
+            self.tail = last
+        self._len += other._len
+        other._len = 0
+        for _list in (self, other):
+            _list._version += 1
+            _list._finger = None
+            if _list._lookup is not None:
+                _list._lookup.invalidate()
+        self._trim()
+
+    def concat(self: Self[_T], other: Self[_T]) -> None:
+        'move every node of other to the end of the list, leaving other empty'
+        self.splice(other, self.tail)
+
+    @_locked
+    def split_after(self: Self[_T], _node: Node[_T] | Node[None]) -> Self[_T]:
+        'move every node after node into a new list and return it'
+        new = type(self)(dynamic=self._dynamic, hashed=self._lookup is not None)
+        first = _node.next
+        if first is self.head:
+            return new
+        count = 0
+        node = first
+        while node is not self.head:
+            node = node.next
+            count += 1
+        new.head.next, new.tail = first, self.tail
+        new.tail.next = new.head
+        _node.next = self.head
+        self.tail = _node
+        self._len -= count
+        new._len = count
+        self._version += 1
+        self._finger = None
+        if self._lookup is not None:
+            self._lookup.invalidate()
+        return new
+
+    @_locked
+    def append(self: Self[_T], _value: _T) -> None:
+        'append value to the end of the sequence, dropping the first value when the list is full'
+        if self._maxlen is not None and self._len >= self._maxlen:
+            if not self._maxlen:
+                return
+            self.popleft()
         self.insert(self.tail, _value)
 
+    @_locked
+    def appendleft(self: Self[_T], _value: _T) -> None:
+        'prepend value to the start of the sequence, dropping the last value when the list is full'
+        if self._maxlen is not None and self._len >= self._maxlen:
+            if not self._maxlen:
+                return
+            self.pop()
+        self.insert(self.head, _value)
+
+    @_locked
+    def extendleft(self: Self[_T], _values: Iterable[_T]) -> None:
+        'prepend every value of the iterable one by one, so they end up in reverse order'
+        if _values is self:
+            _values = list(self.values())
+        for _v in _values:
+            self.appendleft(_v)
+
+    def _trim(self: Self[_T]) -> None:
+        'drop values from the start until the list fits in maxlen'
+        if self._maxlen is not None:
+            while self._len > self._maxlen:
+                self.popleft()
+
+    @_locked
+    def rotate(self: Self[_T], _steps: int = 1) -> None:
+        'rotate the list steps to the right by moving head, walking forward in O(n - steps % n)'
+        _n = self._len
+        if _n < 2 or not _steps % _n:
+            return
+        steps = _steps % _n
+        prev = self.head
+        for _ in range(_n - steps):
+            prev = prev.next
+        self.tail.next = self.head.next
+        self.head.next = prev.next
+        prev.next = self.head
+        self.tail = prev
+        self._version += 1
+        self._finger = None
+
+    @_locked
+    def copy(self: Self[_T]) -> Self[_T]:
+        'return a shallow copy with the same options'
+        return type(self)(self.values(), dynamic=self._dynamic, hashed=self._lookup is not None, maxlen=self._maxlen)
+
+    def _prev_node(self: Self[_T], _node: Node[_T]) -> Node[_T] | Node[None]:
+        'return the node linked before node, walking from head in O(n)'
+        if _node is self.head:
+            raise IndexError('head node has no previous node')
+        prev = self.head
+        while prev.next is not _node:
+            prev = prev.next
+            if prev is self.head:
+                raise ValueError('node is not in the list')
+        return prev
+
+    def _unlink_after(self: Self[_T], _prev: Node[_T] | Node[None]) -> Node[_T]:
+        node = _prev.next
+        _prev.next = node.next
+        if self._lookup is not None:
+            self._lookup.discard(node)
+        if node is self.tail:
+            self.tail = _prev
+        self._len -= 1
+        self._version += 1
+        self._finger = None
+        return node
+
+    @_locked
+    def insert_after(self: Self[_T], _node: Node[_T] | Node[None], _value: _T) -> Node[_T]:
+        'insert value next to node and return the new node, in O(1)'
+        self.insert(_node, _value)
+        return _node.next
+
+    @_locked
+    def insert_before(self: Self[_T], _node: Node[_T], _value: _T) -> Node[_T]:
+        'insert value before node and return the new node, finding the previous node in O(n)'
+        return self.insert_after(self._prev_node(_node), _value)
+
+    @_locked
+    def remove_node(self: Self[_T], _node: Node[_T]) -> None:
+        'unlink node, finding the previous node in O(n)'
+        self._unlink_after(self._prev_node(_node))
+
+    @_locked
+    def move_to_front(self: Self[_T], _node: Node[_T]) -> None:
+        'relink node right after head, finding the previous node in O(n)'
+        prev = self._prev_node(_node)
+        if prev is self.head:
+            return
+        prev.next = _node.next
+        if _node is self.tail:
+            self.tail = prev
+        _node.next, self.head.next = self.head.next, _node
+        self._version += 1
+        self._finger = None
+
+    @_locked
+    def move_to_end(self: Self[_T], _node: Node[_T]) -> None:
+        'relink node after tail, finding the previous node in O(n)'
+        if _node is self.tail:
+            return
+        prev = self._prev_node(_node)
+        prev.next = _node.next
+        _node.next = self.head
+        self.tail.next = _node
+        self.tail = _node
+        self._version += 1
+        self._finger = None
+
+    @_locked
+    def popleft(self: Self[_T]) -> Node[_T]:
+        'remove and return the first node, in O(1)'
+        if not self._len:
+            raise IndexError('pop from empty list')
+        return self._unlink_after(self.head)
+
+    @_locked
+    def pop(self: Self[_T], _index: int = -1) -> Node[_T]:
+        'remove and return node at index, the last one by default, finding the previous node in O(n)'
+        if not self._len:
+            raise IndexError('pop from empty list')
+        return self._unlink_after(self._node(self._position(_index) - 1))
+
+    @_locked
+    def remove(self: Self[_T], _value: _T) -> None:
+        'remove first occurrence of value in one walk, the previous node is still found by walking in O(n)'
+        self._unlink_after(self._find_prev(_value))
+
+    @_locked
+    def clear(self: Self[_T]) -> None:
+        'unlink every node at once'
+        self.head.next = self.head
+        self.tail = self.head
+        self._len = 0
+        self._version += 1
+        self._finger = None
+        if self._lookup is not None:
+            self._lookup.invalidate()
+
+    @staticmethod
+    def _comparator(_key: Callable[[_T], Any] | None, _reverse: bool, *_lists: Self[_T]) -> Callable[[Node[_T], Node[_T]], bool]:
+        'return a function telling whether the second node has to go strictly before the first one'
+        if _key is None:
+            if _reverse:
+                return lambda _a, _b: _a.value < _b.value
+            return lambda _a, _b: _b.value < _a.value
+        keys = {id(_n): _key(_n.value) for _list in _lists for _n in _list._iter()}
+        if _reverse:
+            return lambda _a, _b: keys[id(_a)] < keys[id(_b)]
+        return lambda _a, _b: keys[id(_b)] < keys[id(_a)]
+
+    @staticmethod
+    def _merge_runs(_tail: Node[_T] | Node[None], _a: Node[_T], _a_end: Node[_T], _b: Node[_T], _b_end: Node[_T], _rest: Node[_T] | None, _before: Callable[[Node[_T], Node[_T]], bool]) -> Node[_T]:
+        'merge the None terminated runs a and b after tail, link rest after them and return the last merged node'
+        try:
+            while _a is not None and _b is not None:
+                if _before(_a, _b):
+                    _tail.next = _b
+                    _tail, _b = _b, _b.next
+                else:
+                    _tail.next = _a
+                    _tail, _a = _a, _a.next
+        except BaseException:
+            for first, last in ((_a, _a_end), (_b, _b_end)):
+                if first is not None:
+                    _tail.next = first
+                    _tail = last
+            _tail.next = _rest
+            raise
+        if _a is not None:
+            _tail.next, _tail = _a, _a_end
+        else:
+            _tail.next, _tail = _b, _b_end
+        _tail.next = _rest
+        return _tail
+
+    def _close_chain(self: Self[_T], _last: Node[_T]) -> None:
+        'turn the None terminated chain after head back into a proper list'
+        _last.next = self.head
+        self.tail = _last
+
+    @_locked
+    def sort(self: Self[_T], *, key: Callable[[_T], Any] | None = None, reverse: bool = False) -> None:
+        'sort stably in place with a bottom up natural merge sort that only relinks the existing nodes'
+        if self._len < 2:
+            return
+        before = self._comparator(key, reverse, self)
+        self._version += 1
+        self._finger = None
+        self.tail.next = None
+        try:
+            while True:
+                tail, rest, merges = self.head, self.head.next, 0
+                while rest is not None:
+                    a = a_end = rest
+                    while a_end.next is not None and not before(a_end, a_end.next):
+                        a_end = a_end.next
+                    b = b_end = a_end.next
+                    if b is None:
+                        tail = a_end
+                        break
+                    while b_end.next is not None and not before(b_end, b_end.next):
+                        b_end = b_end.next
+                    rest = b_end.next
+                    a_end.next = b_end.next = None
+                    tail = self._merge_runs(tail, a, a_end, b, b_end, rest, before)
+                    merges += 1
+                if not merges:
+                    break
+        except BaseException:
+            last = self.head
+            while last.next is not None:
+                last = last.next
+            self._close_chain(last)
+            raise
+        self._close_chain(tail)
+
+    @_locked
+    def merge(self: Self[_T], other: Self[_T], *, key: Callable[[_T], Any] | None = None, reverse: bool = False) -> None:
+        'merge the sorted other list into this sorted list in linear time, leaving other empty, ties keep the nodes of this list first'
+        if type(other) is not type(self):
+            raise TypeError(f'can only merge {type(self).__name__}, not {type(other).__name__}')
+        if other is self:
+            raise ValueError('cannot merge a list into itself')
+        if not other._len:
+            return
+        if not self._len:
+            self.splice(other, self.head)
+            return
+        before = self._comparator(key, reverse, self, other)
+        a, a_end = self.head.next, self.tail
+        b, b_end = other.head.next, other.tail
+        a_end.next = b_end.next = None
+        other.head.next, other.tail = other.head, other.head
+        self._len += other._len
+        other._len = 0
+        for _list in (self, other):
+            _list._version += 1
+            _list._finger = None
+            if _list._lookup is not None:
+                _list._lookup.invalidate()
+        try:
+            last = self._merge_runs(self.head, a, a_end, b, b_end, None, before)
+        except BaseException:
+            last = self.head
+            while last.next is not None:
+                last = last.next
+            self._close_chain(last)
+            raise
+        self._close_chain(last)
+        self._trim()
+
+    @_locked
     def reverse(self: Self[_T]):
         'reverse the list'
-        _n = len(self)
-        for i in range(_n // 2):
-            prev_0, prev_1 = self.head if i == 0 else self[i - 1], self[_n - i - 2]
-            node_0, node_1 = prev_0.next, prev_1.next
-            next_0, next_1 = node_0.next, node_1.next
-            prev_0.next = node_1
-            prev_1.next = node_0
-            node_0.next = next_1
-            if next_0 is node_1:
-                node_1.next = node_0
-            else:
-                node_1.next = next_0
-            if node_1 is self.tail:
-                self.tail = node_0
+        self._version += 1
+        self._finger = None
+        prev = self.head
+        node = self.head.next
+        if node is not self.head:
+            self.tail = node
+        while node is not self.head:
+            _next = node.next
+            node.next = prev
+            prev = node
+            node = _next
+        self.head.next = prev
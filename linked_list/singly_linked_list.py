@@ -2,18 +2,31 @@
 from __future__ import annotations
 import sys
 import types
-from typing import Any, Callable, Generic, TypeVar, Iterable, MutableSequence, overload, Self
+from typing import Any, Callable, Generic, TypeVar, Iterable, Iterator, MutableSequence, overload, Self
+from .value_proxy import ValueProxy
+from .memory import MemoryStats, PayloadCounter, class_size, node_size
+from .value_index import ValueIndex
+from .views import NodeView
 
 _T = TypeVar('_T')
 
 
-class Node(Generic[_T]):
+class Node(ValueProxy, Generic[_T]):
     'singly linked node class'
     __slots__ = ('value', 'next', )
     value: _T
     next: Node[_T] | None
 
-    def __new__(cls: type[Self[_T]], _value: _T, _next: Node[_T] | None = None) -> Node[_T]:
+    def __init__(self: Self[_T], _value: _T, _next: Node[_T] | None = None) -> None:
+        self.value = _value
+        self.next = _next
+
+    def __reduce__(self: Self[_T]) -> tuple[Callable[..., Node[_T]], tuple[_T]]:
+        return type(self), (self.value, )
+
+    @classmethod
+    def dynamic(cls: type[Self[_T]], _value: _T, _next: Node[_T] | None = None) -> Node[_T]:
+        'create node of a new class forwarding every special method of the value type'
         def _is_special(name: str) -> bool:
             if name in {'__lt__', '__le__', '__eq__', '__ne__', '__gt__', '__ge__', '__repr__', '__str__', '__or__', '__ror__'}:
                 return True
@@ -27,34 +40,175 @@ class Node(Generic[_T]):
             return wrapper
 
         classdict = {method: _method(getattr(type(_value), method)) for method in dir(type(_value)) if _is_special(method)}
-        classdict.update({'value': _value, 'next': _next})
+        classdict.update({'__reduce__': lambda _self: (cls.dynamic, (_self.value, )), 'value': _value, 'next': _next})
         _cls = types.new_class('Node', (object, ), exec_body=lambda ns: ns.update(classdict))
         return object.__new__(_cls)
 
 
 class List(MutableSequence[Node[_T]], Generic[_T]):
     'singly linked list class'
-    __slots__ = ('head', 'tail', )
+    __slots__ = ('head', 'tail', '_dynamic', '_len', '_version', '_finger', '_finger_index', '_lookup', )
+    debug = False
 
     @overload
-    def __init__(self: Self[_T]) -> None: ...
+    def __init__(self: Self[_T], *, dynamic: bool = ..., hashed: bool = ...) -> None: ...
     @overload
-    def __init__(self: Self[_T], __i: Iterable[_T]) -> None: ...
+    def __init__(self: Self[_T], __i: Iterable[_T], *, dynamic: bool = ..., hashed: bool = ...) -> None: ...
 
-    def __init__(self: Self[_T], _iterable: Iterable[_T] | None = None) -> None:
+    def __init__(self: Self[_T], _iterable: Iterable[_T] | None = None, *, dynamic: bool = False, hashed: bool = False) -> None:
+        self._dynamic = dynamic
+        self._len = 0
+        self._version = 0
+        self._finger: Node[_T] | Node[None] | None = None
+        self._finger_index = -1
         self.head: Node[None] = Node(None)
         self.tail: Node[_T] | Node[None] = self.head
+        self._lookup = ValueIndex() if hashed else None
         if isinstance(_iterable, Iterable):
-            for _v in _iterable:
-                self.append(_v)
+            self.extend(_iterable)
+
+    @classmethod
+    def from_iterable(cls: type[Self[_T]], _iterable: Iterable[_T], _length_hint: int | None = None, *, dynamic: bool = False, hashed: bool = False) -> Self[_T]:
+        'build a list linking the whole iterable in one pass, length hint is advisory'
+        return cls(_iterable, dynamic=dynamic, hashed=hashed)
+
+    def __reduce__(self: Self[_T]) -> tuple[Callable[..., Self[_T]], tuple[Any, ...]]:
+        return self._restore, (list(self._iter(_values=True)), self._dynamic, self._lookup is not None)
+
+    @classmethod
+    def _restore(cls: type[Self[_T]], _values: Iterable[_T], dynamic: bool, hashed: bool) -> Self[_T]:
+        'rebuild a list from the flat value sequence written by __reduce__'
+        return cls(_values, dynamic=dynamic, hashed=hashed)
 
     def __repr__(self: Self[_T]) -> str:
-        return repr([_v for _v in self])
+        return repr(list(self.values()))
+
+    def __iter__(self: Self[_T]) -> Iterator[Node[_T]]:
+        return self._iter()
+
+    def __reversed__(self: Self[_T]) -> Iterator[Node[_T]]:
+        return self._iter(_reverse=True)
+
+    def values(self: Self[_T], _reverse: bool = False) -> Iterator[_T]:
+        'iterate over node values instead of nodes'
+        return self._iter(_reverse, True)
+
+    def _iter(self: Self[_T], _reverse: bool = False, _values: bool = False) -> Iterator[Node[_T]] | Iterator[_T]:
+        version = self._version
+        if _reverse:
+            nodes = []
+            node = self.head.next
+            while node is not None:
+                nodes.append(node)
+                node = node.next
+            for node in reversed(nodes):
+                yield node.value if _values else node
+                if self._version != version:
+                    raise RuntimeError('list mutated during iteration')
+            return
+        node = self.head.next
+        while node is not None:
+            yield node.value if _values else node
+            if self._version != version:
+                raise RuntimeError('list mutated during iteration')
+            node = node.next
+
+    def index(self: Self[_T], _value: _T, _start: int = 0, _stop: int | None = None) -> int:
+        'return first index of value'
+        start, stop, _ = slice(_start, _stop).indices(self._len)
+        nodes = self._hashed(_value)
+        if nodes is not None and not nodes:
+            raise ValueError(f'{_value!r} is not in list')
+        for _i, node in enumerate(self._iter()):
+            if _i >= stop:
+                break
+            if _i >= start and ((id(node) in nodes) if nodes is not None else (node is _value or node == _value)):
+                return _i
+        raise ValueError(f'{_value!r} is not in list')
+
+    def _hashed(self: Self[_T], _value: Any) -> dict[int, Node[_T]] | None:
+        'return the nodes holding value keyed by id, or None when there is no value index to ask'
+        if self._lookup is None:
+            return None
+        if self._lookup.stale:
+            self._lookup.build(self._iter())
+        return self._lookup.get(_value)
+
+    def __contains__(self: Self[_T], _value: Any) -> bool:
+        nodes = self._hashed(_value)
+        if nodes is None:
+            return super().__contains__(_value)
+        return bool(nodes)
+
+    def count(self: Self[_T], _value: Any) -> int:
+        'return number of occurrences of value, in O(1) with a value index'
+        nodes = self._hashed(_value)
+        if nodes is None:
+            return super().count(_value)
+        return len(nodes)
+
+    def _find_prev(self: Self[_T], _value: _T) -> Node[_T] | Node[None]:
+        'return the node before the first one holding value in one walk, matching node ids when there is a value index'
+        nodes = self._hashed(_value)
+        if nodes is not None and not nodes:
+            raise ValueError(f'{_value!r} is not in list')
+        prev, node = self.head, self.head.next
+        while node is not None:
+            if (id(node) in nodes) if nodes is not None else (node is _value or node == _value):
+                return prev
+            prev, node = node, node.next
+        raise ValueError(f'{_value!r} is not in list')
+
+    def find(self: Self[_T], _value: _T) -> Node[_T]:
+        'return the first node holding value, in O(1) when a value index holds a single one'
+        nodes = self._hashed(_value)
+        if nodes is not None and len(nodes) == 1:
+            return next(iter(nodes.values()))
+        return self._find_prev(_value).next
+
+    def view(self: Self[_T], _start: int = 0, _stop: int | None = None) -> NodeView[_T]:
+        'return a lazy view of the nodes from start up to stop without copying them'
+        start, stop, _ = slice(_start, _stop).indices(self._len)
+        if stop <= start:
+            return NodeView(self, None, None, 0)
+        first = self._node(start)
+        last = first
+        for _ in range(stop - start - 1):
+            last = last.next
+        return NodeView(self, first, last, stop - start)
+
+    def window(self: Self[_T], _node: Node[_T], _count: int) -> NodeView[_T]:
+        'return a lazy view of at most count nodes starting at node'
+        if _count <= 0 or _node is None:
+            return NodeView(self, None, None, 0)
+        last, count = _node, 1
+        while count < _count and last.next is not None:
+            last = last.next
+            count += 1
+        return NodeView(self, _node, last, count)
 
     def __sizeof__(self: Self[_T]) -> int:
         return sys.getsizeof(self.head) + sum([sys.getsizeof(_v) for _v in self])
 
+    def memory_stats(self: Self[_T], deep: bool = False, unique: bool = True) -> MemoryStats:
+        'return node, sentinel, per node class, payload and index bytes from one pass over the chain, payloads deep or shallow and shared objects counted once when unique'
+        payload = PayloadCounter(deep, unique)
+        count = node_bytes = class_bytes = 0
+        for node in self._iter():
+            count += 1
+            node_bytes += node_size(node)
+            if self._dynamic:
+                class_bytes += class_size(type(node))
+            payload.add(node.value)
+        return MemoryStats(count, node_bytes, node_size(self.head), class_bytes, payload.bytes, 0 if self._lookup is None else sys.getsizeof(self._lookup))
+
     def __len__(self: Self[_T]) -> int:
+        if self.debug and self._len != self._count():
+            raise AssertionError(f'cached length {self._len} does not match node count {self._count()}')
+        return self._len
+
+    def _count(self: Self[_T]) -> int:
+        'count nodes by walking the whole chain'
         _len = 0
         node = self.head.next
         while True:
@@ -65,18 +219,26 @@ class List(MutableSequence[Node[_T]], Generic[_T]):
             _len += 1
         return _len
 
-    def _valid_index(self: Self[_T], _index: int, _raise: bool = True) -> int:
-        _n = len(self)
+    def _position(self: Self[_T], _index: int) -> int:
         if _index < 0:
-            _index += _n
-            if _index < 0:
-                _index = 0
-        if _index > _n:
-            if _raise:
-                raise IndexError('list assignment index out of range')
-            _index = _n
+            _index += self._len
+        if not 0 <= _index < self._len:
+            raise IndexError('list assignment index out of range')
         return _index
 
+    def _node(self: Self[_T], _index: int) -> Node[_T] | Node[None]:
+        'return node at index (head at -1), walking from head, finger or tail'
+        if _index == self._len - 1:
+            node = self.tail
+        else:
+            node, start = self.head, -1
+            if self._finger is not None and self._finger_index <= _index:
+                node, start = self._finger, self._finger_index
+            for _ in range(_index - start):
+                node = node.next
+        self._finger, self._finger_index = node, _index
+        return node
+
     @overload
     def __getitem__(self: Self[_T], __i: int) -> Node[_T]: ...
     @overload
@@ -84,17 +246,9 @@ class List(MutableSequence[Node[_T]], Generic[_T]):
 
     def __getitem__(self: Self[_T], _index: int | slice) -> Node[_T] | Self[_T]:
         if isinstance(_index, int):
-            node = self.head.next
-            if node is None:
-                raise IndexError('list assignment index out of range')
-            for _ in range(self._valid_index(_index)):
-                node = node.next
-                if node is None:
-                    raise IndexError('list assignment index out of range')
-            return node
+            return self._node(self._position(_index))
         elif isinstance(_index, slice):
-            start, stop, step = _index.indices(len(self))
-            return List([self[_i] for _i in range(start, stop, step)])
+            return self._get_slice(_index)
         else:
             raise IndexError(f'index must be integers or slices, not {type(_index)}')
 
@@ -105,23 +259,15 @@ class List(MutableSequence[Node[_T]], Generic[_T]):
 
     def __setitem__(self: Self[_T], _index: int | slice, _value: _T | Iterable[_T]) -> None:
         if isinstance(_index, int):
-            prev = self.head
-            node = prev.next
-            if node is None:
-                raise IndexError('list assignment index out of range')
-            for _ in range(self._valid_index(_index)):
-                prev = node
-                node = prev.next
-                if node is None:
-                    raise IndexError('list assignment index out of range')
-            node.value = _value
-        elif isinstance(_index, slice):
-            if isinstance(_value, Iterable):
-                start, stop, stride = _index.indices(len(self))
-                for _i, _v in zip(range(start, stop, stride), _value):
-                    self[_i] = _v
+            node = self._node(self._position(_index))
+            if self._lookup is not None:
+                self._lookup.discard(node)
+                node.value = _value
+                self._lookup.add(node)
             else:
-                raise TypeError('can only assign an iterable')
+                node.value = _value
+        elif isinstance(_index, slice):
+            self._set_slice(_index, _value)
         else:
             raise TypeError(f'index must be integers or slices, not {type(_index)}')
 
@@ -132,26 +278,99 @@ class List(MutableSequence[Node[_T]], Generic[_T]):
 
     def __delitem__(self: Self[_T], _index: int | slice) -> None:
         if isinstance(_index, int):
-            prev = self.head
+            prev = self._node(self._position(_index) - 1)
             node = prev.next
-            if node is None:
-                raise IndexError('list assignment index out of range')
-            for _ in range(self._valid_index(_index)):
-                prev = node
-                node = prev.next
-                if node is None:
-                    raise IndexError('list assignment index out of range')
             prev.next = node.next
+            if self._lookup is not None:
+                self._lookup.discard(node)
             if prev.next is None:
                 self.tail = prev
+            self._len -= 1
+            self._version += 1
             del node
         elif isinstance(_index, slice):
-            start, stop, stride = _index.indices(len(self))
-            for _i in range(start, stop, stride):
-                del self[_i]
+            self._del_slice(_index)
         else:
             raise TypeError(f'index must be integers or slices, not {type(_index)}')
 
+    def _get_slice(self: Self[_T], _index: slice) -> Self[_T]:
+        'copy the values of a slice into a new list in one walk'
+        _range = range(*_index.indices(self._len))
+        values = []
+        if _range:
+            ascending = _range if 0 < _range.step else _range[::-1]
+            node = self._node(ascending[0])
+            values.append(node.value)
+            for _ in range(len(ascending) - 1):
+                for _ in range(ascending.step):
+                    node = node.next
+                values.append(node.value)
+            if _range.step < 0:
+                values.reverse()
+        return type(self)(values, dynamic=self._dynamic, hashed=self._lookup is not None)
+
+    def _set_slice(self: Self[_T], _index: slice, _value: Iterable[_T]) -> None:
+        'assign a slice in one walk, like list a contiguous slice may change length'
+        if self._lookup is not None:
+            self._lookup.invalidate()
+        if not isinstance(_value, Iterable):
+            raise TypeError('can only assign an iterable')
+        values = list(self.values()) if _value is self else list(_value)
+        start, stop, step = _index.indices(self._len)
+        if step == 1:
+            stop = max(start, stop)
+            prev = self._node(start - 1)
+            after = prev.next
+            for _ in range(stop - start):
+                after = after.next
+            new = Node.dynamic if self._dynamic else Node
+            first = last = Node(None)
+            for _v in values:
+                last.next = new(_v)
+                last = last.next
+            last.next = after
+            prev.next = first.next
+            if after is None:
+                self.tail = prev if last is first else last
+            self._len += len(values) - (stop - start)
+            self._version += 1
+            self._finger = None
+            return
+        _range = range(start, stop, step)
+        if len(values) != len(_range):
+            raise ValueError(f'attempt to assign sequence of size {len(values)} to extended slice of size {len(_range)}')
+        if not _range:
+            return
+        if step < 0:
+            _range, values = _range[::-1], values[::-1]
+        node = self._node(_range[0])
+        for _i, _v in enumerate(values):
+            if _i:
+                for _ in range(_range.step):
+                    node = node.next
+            node.value = _v
+
+    def _del_slice(self: Self[_T], _index: slice) -> None:
+        'delete a slice in one walk'
+        if self._lookup is not None:
+            self._lookup.invalidate()
+        _range = range(*_index.indices(self._len))
+        if not _range:
+            return
+        if _range.step < 0:
+            _range = _range[::-1]
+        prev = self._node(_range[0] - 1)
+        for _i in range(len(_range)):
+            prev.next = prev.next.next
+            if _i < len(_range) - 1:
+                for _ in range(_range.step - 1):
+                    prev = prev.next
+        if prev.next is None:
+            self.tail = prev
+        self._len -= len(_range)
+        self._version += 1
+        self._finger = None
+
     @overload
     def insert(self: Self[_T], __i: int, __v: _T) -> None: ...
     @overload
@@ -162,38 +381,311 @@ class List(MutableSequence[Node[_T]], Generic[_T]):
     def insert(self: Self[_T], _index: int | Node[_T] | Node[None], _value: _T) -> None:
         'insert value to index or next to node'
         try:
-            node = Node(_value, _index.next)
+            node = (Node.dynamic if self._dynamic else Node)(_value, _index.next)
             _index.next = node
             if node.next is None:
                 self.tail = node
+            if self._lookup is not None:
+                self._lookup.add(node)
+            self._len += 1
+            self._version += 1
+            self._finger = None
         except AttributeError as exc:
             if isinstance(_index, int):
-                node = self.head
-                for _ in range(self._valid_index(_index, False)):
-                    if node.next is None:
-                        break
-                    node = node.next
-                self.insert(node, _value)
+                _index = max(_index + self._len, 0) if _index < 0 else min(_index, self._len)
+                prev = self._node(_index - 1)
+                self.insert(prev, _value)
+                self._finger, self._finger_index = prev.next, _index
             else:
                 raise IndexError('index must be integers or a node') from exc
 
+    def extend(self: Self[_T], _values: Iterable[_T]) -> None:
+        'append every value of the iterable, linking the batch before splicing it on'
+        if _values is self:
+            _values = list(self.values())
+        new = Node.dynamic if self._dynamic else Node
+        start = last = Node(None)
+        count = 0
+        for _v in _values:
+            last.next = new(_v)
+            last = last.next
+            count += 1
+        if last is start:
+            return
+        last.next = None
+        self.tail.next = start.next
+        self.tail = last
+        if self._lookup is not None:
+            node = start.next
+            while node is not None:
+                self._lookup.add(node)
+                node = node.next
+        self._len += count
+        self._version += 1
+
+    def splice(self: Self[_T], other: Self[_T], _node: Node[_T] | Node[None]) -> None:
+        'move every node of other next to node, leaving other empty'
+        if type(other) is not type(self):
+            raise TypeError(f'can only splice {type(self).__name__}, not {type(other).__name__}')
+        if other is self:
+            raise ValueError('cannot splice a list into itself')
+        if other._len == 0:
+            return
+        first, last = other.head.next, other.tail
+        other.head.next, other.tail = None, other.head
+        last.next = _node.next
+        _node.next = first
+        if _node is self.tail:
+            self.tail = last
+        self._len += other._len
+        other._len = 0
+        for _list in (self, other):
+            _list._version += 1
+            _list._finger = None
+            if _list._lookup is not None:
+                _list._lookup.invalidate()
+
+    def concat(self: Self[_T], other: Self[_T]) -> None:
+        'move every node of other to the end of the list, leaving other empty'
+        self.splice(other, self.tail)
+
+    def split_after(self: Self[_T], _node: Node[_T] | Node[None]) -> Self[_T]:
+        'move every node after node into a new list and return it'
+        new = type(self)(dynamic=self._dynamic, hashed=self._lookup is not None)
+        first = _node.next
+        if first is None:
+            return new
+        count = 0
+        node = first
+        while node is not None:
+            node = node.next
+            count += 1
+        new.head.next, new.tail = first, self.tail
+        new.tail.next = None
+        _node.next = None
+        self.tail = _node
+        self._len -= count
+        new._len = count
+        self._version += 1
+        self._finger = None
+        if self._lookup is not None:
+            self._lookup.invalidate()
+        return new
+
     def append(self: Self[_T], _value: _T) -> None:
         'append value to the end of the sequence'
         self.insert(self.tail, _value)
 
+    def appendleft(self: Self[_T], _value: _T) -> None:
+        'prepend value to the start of the sequence'
+        self.insert(self.head, _value)
+
+    def _prev_node(self: Self[_T], _node: Node[_T]) -> Node[_T] | Node[None]:
+        'return the node linked before node, walking from head in O(n)'
+        if _node is self.head:
+            raise IndexError('head node has no previous node')
+        prev = self.head
+        while prev.next is not _node:
+            prev = prev.next
+            if prev is None:
+                raise ValueError('node is not in the list')
+        return prev
+
+    def _unlink_after(self: Self[_T], _prev: Node[_T] | Node[None]) -> Node[_T]:
+        node = _prev.next
+        _prev.next = node.next
+        if self._lookup is not None:
+            self._lookup.discard(node)
+        if node is self.tail:
+            self.tail = _prev
+        self._len -= 1
+        self._version += 1
+        self._finger = None
+        return node
+
+    def insert_after(self: Self[_T], _node: Node[_T] | Node[None], _value: _T) -> Node[_T]:
+        'insert value next to node and return the new node, in O(1)'
+        self.insert(_node, _value)
+        return _node.next
+
+    def insert_before(self: Self[_T], _node: Node[_T], _value: _T) -> Node[_T]:
+        'insert value before node and return the new node, finding the previous node in O(n)'
+        return self.insert_after(self._prev_node(_node), _value)
+
+    def remove_node(self: Self[_T], _node: Node[_T]) -> None:
+        'unlink node, finding the previous node in O(n)'
+        self._unlink_after(self._prev_node(_node))
+
+    def move_to_front(self: Self[_T], _node: Node[_T]) -> None:
+        'relink node right after head, finding the previous node in O(n)'
+        prev = self._prev_node(_node)
+        if prev is self.head:
+            return
+        prev.next = _node.next
+        if _node is self.tail:
+            self.tail = prev
+        _node.next, self.head.next = self.head.next, _node
+        self._version += 1
+        self._finger = None
+
+    def move_to_end(self: Self[_T], _node: Node[_T]) -> None:
+        'relink node after tail, finding the previous node in O(n)'
+        if _node is self.tail:
+            return
+        prev = self._prev_node(_node)
+        prev.next = _node.next
+        _node.next = None
+        self.tail.next = _node
+        self.tail = _node
+        self._version += 1
+        self._finger = None
+
+    def popleft(self: Self[_T]) -> Node[_T]:
+        'remove and return the first node, in O(1)'
+        if not self._len:
+            raise IndexError('pop from empty list')
+        return self._unlink_after(self.head)
+
+    def pop(self: Self[_T], _index: int = -1) -> Node[_T]:
+        'remove and return node at index, the last one by default, finding the previous node in O(n)'
+        if not self._len:
+            raise IndexError('pop from empty list')
+        return self._unlink_after(self._node(self._position(_index) - 1))
+
+    def remove(self: Self[_T], _value: _T) -> None:
+        'remove first occurrence of value in one walk, the previous node is still found by walking in O(n)'
+        self._unlink_after(self._find_prev(_value))
+
+    def clear(self: Self[_T]) -> None:
+        'unlink every node at once'
+        self.head.next = None
+        self.tail = self.head
+        self._len = 0
+        self._version += 1
+        self._finger = None
+        if self._lookup is not None:
+            self._lookup.invalidate()
+
+    @staticmethod
+    def _comparator(_key: Callable[[_T], Any] | None, _reverse: bool, *_lists: Self[_T]) -> Callable[[Node[_T], Node[_T]], bool]:
+        'return a function telling whether the second node has to go strictly before the first one'
+        if _key is None:
+            if _reverse:
+                return lambda _a, _b: _a.value < _b.value
+            return lambda _a, _b: _b.value < _a.value
+        keys = {id(_n): _key(_n.value) for _list in _lists for _n in _list._iter()}
+        if _reverse:
+            return lambda _a, _b: keys[id(_a)] < keys[id(_b)]
+        return lambda _a, _b: keys[id(_b)] < keys[id(_a)]
+
+    @staticmethod
+    def _merge_runs(_tail: Node[_T] | Node[None], _a: Node[_T], _a_end: Node[_T], _b: Node[_T], _b_end: Node[_T], _rest: Node[_T] | None, _before: Callable[[Node[_T], Node[_T]], bool]) -> Node[_T]:
+        'merge the None terminated runs a and b after tail, link rest after them and return the last merged node'
+        try:
+            while _a is not None and _b is not None:
+                if _before(_a, _b):
+                    _tail.next = _b
+                    _tail, _b = _b, _b.next
+                else:
+                    _tail.next = _a
+                    _tail, _a = _a, _a.next
+        except BaseException:
+            for first, last in ((_a, _a_end), (_b, _b_end)):
+                if first is not None:
+                    _tail.next = first
+                    _tail = last
+            _tail.next = _rest
+            raise
+        if _a is not None:
+            _tail.next, _tail = _a, _a_end
+        else:
+            _tail.next, _tail = _b, _b_end
+        _tail.next = _rest
+        return _tail
+
+    def _close_chain(self: Self[_T], _last: Node[_T]) -> None:
+        'turn the None terminated chain after head back into a proper list'
+        _last.next = None
+        self.tail = _last
+
+    def sort(self: Self[_T], *, key: Callable[[_T], Any] | None = None, reverse: bool = False) -> None:
+        'sort stably in place with a bottom up natural merge sort that only relinks the existing nodes'
+        if self._len < 2:
+            return
+        before = self._comparator(key, reverse, self)
+        self._version += 1
+        self._finger = None
+        try:
+            while True:
+                tail, rest, merges = self.head, self.head.next, 0
+                while rest is not None:
+                    a = a_end = rest
+                    while a_end.next is not None and not before(a_end, a_end.next):
+                        a_end = a_end.next
+                    b = b_end = a_end.next
+                    if b is None:
+                        tail = a_end
+                        break
+                    while b_end.next is not None and not before(b_end, b_end.next):
+                        b_end = b_end.next
+                    rest = b_end.next
+                    a_end.next = b_end.next = None
+                    tail = self._merge_runs(tail, a, a_end, b, b_end, rest, before)
+                    merges += 1
+                if not merges:
+                    break
+        except BaseException:
+            last = self.head
+            while last.next is not None:
+                last = last.next
+            self._close_chain(last)
+            raise
+        self._close_chain(tail)
+
+    def merge(self: Self[_T], other: Self[_T], *, key: Callable[[_T], Any] | None = None, reverse: bool = False) -> None:
+        'merge the sorted other list into this sorted list in linear time, leaving other empty, ties keep the nodes of this list first'
+        if type(other) is not type(self):
+            raise TypeError(f'can only merge {type(self).__name__}, not {type(other).__name__}')
+        if other is self:
+            raise ValueError('cannot merge a list into itself')
+        if not other._len:
+            return
+        if not self._len:
+            self.splice(other, self.head)
+            return
+        before = self._comparator(key, reverse, self, other)
+        a, a_end = self.head.next, self.tail
+        b, b_end = other.head.next, other.tail
+        a_end.next = b_end.next = None
+        other.head.next, other.tail = None, other.head
+        self._len += other._len
+        other._len = 0
+        for _list in (self, other):
+            _list._version += 1
+            _list._finger = None
+            if _list._lookup is not None:
+                _list._lookup.invalidate()
+        try:
+            last = self._merge_runs(self.head, a, a_end, b, b_end, None, before)
+        except BaseException:
+            last = self.head
+            while last.next is not None:
+                last = last.next
+            self._close_chain(last)
+            raise
+        self._close_chain(last)
+
     def reverse(self: Self[_T]):
         'reverse the list'
-        _n = len(self)
-        for i in range(_n // 2):
-            prev_0, prev_1 = self.head if i == 0 else self[i - 1], self[_n - i - 2]
-            node_0, node_1 = prev_0.next, prev_1.next
-            next_0, next_1 = node_0.next, node_1.next
-            prev_0.next = node_1
-            prev_1.next = node_0
-            node_0.next = next_1
-            if next_0 is node_1:
-                node_1.next = node_0
-            else:
-                node_1.next = next_0
-            if node_1 is self.tail:
-                self.tail = node_0
+        self._version += 1
+        self._finger = None
+        prev = None
+        node = self.head.next
+        if node is not None:
+            self.tail = node
+        while node is not None:
+            _next = node.next
+            node.next = prev
+            prev = node
+            node = _next
+        self.head.next = prev
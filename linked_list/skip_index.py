@@ -0,0 +1,168 @@
+'''skip list index module'''
+from __future__ import annotations
+import random
+import sys
+from typing import Any, Callable
+
+_P = 0.25
+_MAX_LEVEL = 32
+
+
+class Tower:
+    'skip list tower class, holds the express links of one node'
+    __slots__ = ('node', 'next', 'prev', 'span', )
+
+    def __init__(self, _node: Any, _height: int) -> None:
+        self.node = _node
+        self.next: list[Tower | None] = [None] * _height
+        self.prev: list[Tower | None] = [None] * _height
+        self.span: list[int] = [0] * _height
+
+
+class SkipIndex:
+    'skip list index class, keeps span counted express links over a doubly linked node chain'
+    __slots__ = ('head', 'end', 'root', 'towers', 'level', 'stale', )
+
+    def __init__(self, _head: Any, _end: Any) -> None:
+        self.head = _head
+        self.end = _end
+        self.root = Tower(_head, _MAX_LEVEL)
+        self.towers: dict[int, Tower] = {}
+        self.level = 0
+        self.stale = True
+
+    def __sizeof__(self) -> int:
+        towers = self.towers if id(self.head) in self.towers else {**self.towers, id(self.head): self.root}
+        return object.__sizeof__(self) + sys.getsizeof(self.towers) + sum([
+            sys.getsizeof(_t) + sys.getsizeof(_t.next) + sys.getsizeof(_t.prev) + sys.getsizeof(_t.span) for _t in towers.values()
+        ])
+
+    @staticmethod
+    def _height() -> int:
+        _height = 0
+        while random.random() < _P and _height < _MAX_LEVEL:
+            _height += 1
+        return _height
+
+    def invalidate(self) -> None:
+        'drop every tower, the index is rebuilt on the next lookup'
+        self.root = Tower(self.head, _MAX_LEVEL)
+        self.towers = {}
+        self.level = 0
+        self.stale = True
+
+    def build(self) -> None:
+        'build towers for the whole chain in one pass'
+        self.invalidate()
+        self.towers[id(self.head)] = self.root
+        last = [self.root] * _MAX_LEVEL
+        last_pos = [0] * _MAX_LEVEL
+        pos = 0
+        node = self.head._next
+        while node is not self.end:
+            pos += 1
+            _height = self._height()
+            if _height:
+                tower = Tower(node, _height)
+                self.towers[id(node)] = tower
+                for lvl in range(_height):
+                    prev = last[lvl]
+                    prev.next[lvl] = tower
+                    prev.span[lvl] = pos - last_pos[lvl]
+                    tower.prev[lvl] = prev
+                    last[lvl] = tower
+                    last_pos[lvl] = pos
+                self.level = max(self.level, _height)
+            node = node._next
+        self.stale = False
+
+    def node(self, _index: int) -> Any:
+        'return node at a non negative index'
+        if self.stale:
+            self.build()
+        rank = _index + 1
+        tower, pos = self.root, 0
+        for lvl in range(self.level - 1, -1, -1):
+            while tower.next[lvl] is not None and pos + tower.span[lvl] <= rank:
+                pos += tower.span[lvl]
+                tower = tower.next[lvl]
+        node = tower.node
+        for _ in range(rank - pos):
+            node = node._next
+        return node
+
+    def search(self, _before: Callable[[Any], bool]) -> tuple[Any, int]:
+        'return the last node that before holds for with its position, head and 0 if none, before has to hold for a prefix of the chain'
+        if self.stale:
+            self.build()
+        tower, pos = self.root, 0
+        for lvl in range(self.level - 1, -1, -1):
+            while tower.next[lvl] is not None and _before(tower.next[lvl].node):
+                pos += tower.span[lvl]
+                tower = tower.next[lvl]
+        node = tower.node
+        while node._next is not self.end and _before(node._next):
+            node = node._next
+            pos += 1
+        return node, pos
+
+    def _covering(self, _node: Any) -> tuple[list[tuple[Tower, int]], int]:
+        'return the last tower at or before node on every level with its distance, and the position of node'
+        dist = 0
+        while id(_node) not in self.towers:
+            _node = _node._prev
+            dist += 1
+        tower = self.towers[id(_node)]
+        covering = []
+        for lvl in range(self.level):
+            while len(tower.next) <= lvl:
+                tower = tower.prev[lvl - 1]
+                dist += tower.span[lvl - 1]
+            covering.append((tower, dist))
+        while tower is not self.root:
+            tower = tower.prev[self.level - 1]
+            dist += tower.span[self.level - 1]
+        return covering, dist
+
+    def insert(self, _node: Any) -> None:
+        'add towers for a node that was just linked into the chain'
+        if self.stale:
+            return
+        covering, pos = self._covering(_node._prev)
+        _height = self._height()
+        if _height:
+            tower = Tower(_node, _height)
+            self.towers[id(_node)] = tower
+            for _ in range(self.level, _height):
+                covering.append((self.root, pos))
+            self.level = max(self.level, _height)
+        for lvl, (prev, dist) in enumerate(covering):
+            if lvl < _height:
+                _next = prev.next[lvl]
+                tower.next[lvl] = _next
+                tower.prev[lvl] = prev
+                if _next is not None:
+                    _next.prev[lvl] = tower
+                    tower.span[lvl] = prev.span[lvl] - dist
+                prev.next[lvl] = tower
+                prev.span[lvl] = dist + 1
+            elif prev.next[lvl] is not None:
+                prev.span[lvl] += 1
+
+    def remove(self, _node: Any) -> None:
+        'drop towers of a node that is about to be unlinked from the chain'
+        if self.stale:
+            return
+        tower = self.towers.pop(id(_node), None)
+        covering, _ = self._covering(_node._prev)
+        for lvl, (prev, dist) in enumerate(covering):
+            if tower is not None and lvl < len(tower.next):
+                _next = tower.next[lvl]
+                prev.next[lvl] = _next
+                if _next is not None:
+                    _next.prev[lvl] = prev
+                    prev.span[lvl] += tower.span[lvl] - 1
+            elif prev.next[lvl] is not None:
+                prev.span[lvl] -= 1
+        while self.level and self.root.next[self.level - 1] is None:
+            self.level -= 1
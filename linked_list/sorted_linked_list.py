@@ -0,0 +1,148 @@
+'''sorted linked list module'''
+from __future__ import annotations
+from typing import Any, Callable, Generic, Iterable, Iterator, TypeVar, Self
+from .doubly_linked_list import List as DoublyLinkedList, Node as DoublyLinkedNode
+from .memory import MemoryStats
+
+_T = TypeVar('_T')
+
+
+def _identity(_value: Any) -> Any:
+    return _value
+
+
+class SortedLinkedList(Generic[_T]):
+    'sorted linked list class, keeps values ordered by key in an indexed doubly linked list and searches its skip list index in O(log n)'
+    __slots__ = ('_key', '_list', )
+
+    def __init__(self: Self[_T], _iterable: Iterable[_T] = (), *, key: Callable[[_T], Any] | None = None) -> None:
+        self._key = _identity if key is None else key
+        self._list: DoublyLinkedList[_T] = DoublyLinkedList(sorted(_iterable, key=key), indexed=True)
+
+    def __repr__(self: Self[_T]) -> str:
+        return f'{type(self).__name__}({list(self._list.values())!r})'
+
+    def __reduce__(self: Self[_T]) -> tuple[Callable[..., Self[_T]], tuple[Any, ...]]:
+        return self._restore, (list(self._list.values()), self.key)
+
+    @classmethod
+    def _restore(cls: type[Self[_T]], _values: Iterable[_T], key: Callable[[_T], Any] | None) -> Self[_T]:
+        'rebuild a list from the flat value sequence written by __reduce__'
+        return cls(_values, key=key)
+
+    def __len__(self: Self[_T]) -> int:
+        return len(self._list)
+
+    def __iter__(self: Self[_T]) -> Iterator[_T]:
+        return self._list.values()
+
+    def __reversed__(self: Self[_T]) -> Iterator[_T]:
+        return self._list.values(True)
+
+    def __getitem__(self: Self[_T], _index: int) -> _T:
+        return self._list[_index].value
+
+    def __contains__(self: Self[_T], _value: Any) -> bool:
+        return self._find(_value) is not None
+
+    @property
+    def key(self: Self[_T]) -> Callable[[_T], Any] | None:
+        '''key function the values are ordered by, None when they are compared directly'''
+        return None if self._key is _identity else self._key
+
+    @property
+    def nodes(self: Self[_T]) -> DoublyLinkedList[_T]:
+        '''underlying doubly linked list, read only, mutating it breaks the order'''
+        return self._list
+
+    def memory_stats(self: Self[_T], deep: bool = False, unique: bool = True) -> MemoryStats:
+        'return the memory stats of the underlying list, its skip list index included'
+        return self._list.memory_stats(deep, unique)
+
+    def _last_before(self: Self[_T], _key: Any, _inclusive: bool) -> tuple[DoublyLinkedNode[_T], int]:
+        'return the last node whose key is below key, or not above it when inclusive, with its position'
+        key = self._key
+        if _inclusive:
+            return self._list._skip.search(lambda _n: not _key < key(_n.value))
+        return self._list._skip.search(lambda _n: key(_n.value) < _key)
+
+    def _find(self: Self[_T], _value: Any) -> DoublyLinkedNode[_T] | None:
+        key = self._key(_value)
+        node, _ = self._last_before(key, False)
+        node = node._next
+        while node is not self._list.tail and not key < self._key(node.value):
+            if node.value is _value or node.value == _value:
+                return node
+            node = node._next
+        return None
+
+    def find(self: Self[_T], _value: _T) -> DoublyLinkedNode[_T]:
+        'return the first node holding value, in O(log n)'
+        node = self._find(_value)
+        if node is None:
+            raise ValueError(f'{_value!r} is not in list')
+        return node
+
+    def add(self: Self[_T], _value: _T) -> DoublyLinkedNode[_T]:
+        'insert value after every value with an equal key and return its node, in O(log n)'
+        node, _ = self._last_before(self._key(_value), True)
+        return self._list.insert_after(node, _value)
+
+    def update(self: Self[_T], _values: Iterable[_T]) -> None:
+        'add every value of the iterable'
+        for value in _values:
+            self.add(value)
+
+    def discard(self: Self[_T], _value: _T) -> None:
+        'remove the first occurrence of value if present, in O(log n)'
+        node = self._find(_value)
+        if node is not None:
+            self._list.remove_node(node)
+
+    def remove(self: Self[_T], _value: _T) -> None:
+        'remove the first occurrence of value, raise ValueError if absent'
+        self._list.remove_node(self.find(_value))
+
+    def remove_node(self: Self[_T], _node: DoublyLinkedNode[_T]) -> None:
+        'unlink a node returned by add or find, O(1) relinking plus the expected O(log n) index upkeep'
+        self._list.remove_node(_node)
+
+    def bisect_left(self: Self[_T], _key: Any) -> int:
+        'return the index of the first value whose key is not below key, in O(log n)'
+        return self._last_before(_key, False)[1]
+
+    def bisect_right(self: Self[_T], _key: Any) -> int:
+        'return the index after the last value whose key is not above key, in O(log n)'
+        return self._last_before(_key, True)[1]
+
+    def irange(self: Self[_T], minimum: Any = None, maximum: Any = None, inclusive: tuple[bool, bool] = (True, True), reverse: bool = False) -> Iterator[_T]:
+        'iterate values whose keys lie between minimum and maximum, None leaves a side open, finding the start in O(log n)'
+        key, head, tail = self._key, self._list.head, self._list.tail
+        if reverse:
+            node = tail._prev if maximum is None else self._last_before(maximum, inclusive[1])[0]
+            while node is not head:
+                if minimum is not None and (key(node.value) < minimum if inclusive[0] else not minimum < key(node.value)):
+                    return
+                prev = node._prev
+                yield node.value
+                node = prev
+        else:
+            node = head._next if minimum is None else self._last_before(minimum, not inclusive[0])[0]._next
+            while node is not tail:
+                if maximum is not None and (maximum < key(node.value) if inclusive[1] else not key(node.value) < maximum):
+                    return
+                _next = node._next
+                yield node.value
+                node = _next
+
+    def pop_min(self: Self[_T]) -> _T:
+        'remove and return the smallest value, in O(1) plus the index upkeep'
+        return self._list.popleft().value
+
+    def pop_max(self: Self[_T]) -> _T:
+        'remove and return the largest value, in O(1) plus the index upkeep'
+        return self._list.pop().value
+
+    def clear(self: Self[_T]) -> None:
+        'remove every value'
+        self._list.clear()
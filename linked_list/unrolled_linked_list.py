@@ -0,0 +1,272 @@
+'''unrolled linked list module'''
+from __future__ import annotations
+import sys
+from array import array
+from typing import Any, Callable, Generic, TypeVar, Iterable, Iterator, MutableSequence, overload, Self
+from .memory import MemoryStats, PayloadCounter
+
+_T = TypeVar('_T')
+
+
+class Node(Generic[_T]):
+    'unrolled linked node class, holds a chunk of values'
+    __slots__ = ('values', 'next', )
+    values: MutableSequence[_T]
+    next: Node[_T] | None
+
+    def __init__(self: Self[_T], _values: MutableSequence[_T], _next: Node[_T] | None = None) -> None:
+        self.values = _values
+        self.next = _next
+
+    def __repr__(self: Self[_T]) -> str:
+        return f'{type(self).__name__}({list(self.values)!r})'
+
+
+class List(MutableSequence[_T], Generic[_T]):
+    'unrolled linked list class, each node stores up to capacity values in a list or a typed array'
+    __slots__ = ('head', 'tail', 'capacity', 'typecode', '_len', '_version', )
+    debug = False
+
+    @overload
+    def __init__(self: Self[_T], *, capacity: int = ..., typecode: str | None = ...) -> None: ...
+    @overload
+    def __init__(self: Self[_T], __i: Iterable[_T], *, capacity: int = ..., typecode: str | None = ...) -> None: ...
+
+    def __init__(self: Self[_T], _iterable: Iterable[_T] | None = None, *, capacity: int = 64, typecode: str | None = None) -> None:
+        if capacity < 2:
+            raise ValueError('capacity must be at least 2')
+        self.capacity = capacity
+        self.typecode = typecode
+        self._len = 0
+        self._version = 0
+        self.head: Node[None] = Node(self._chunk())
+        self.tail: Node[_T] | Node[None] = self.head
+        if isinstance(_iterable, Iterable):
+            for _v in _iterable:
+                self.append(_v)
+
+    def __reduce__(self: Self[_T]) -> tuple[Callable[..., Self[_T]], tuple[Any, ...]]:
+        return self._restore, (list(self.values()), self.capacity, self.typecode)
+
+    @classmethod
+    def _restore(cls: type[Self[_T]], _values: Iterable[_T], capacity: int, typecode: str | None) -> Self[_T]:
+        'rebuild a list from the flat value sequence written by __reduce__'
+        return cls(_values, capacity=capacity, typecode=typecode)
+
+    def _chunk(self: Self[_T], _values: Iterable[_T] = ()) -> MutableSequence[_T]:
+        return list(_values) if self.typecode is None else array(self.typecode, _values)
+
+    def __repr__(self: Self[_T]) -> str:
+        return repr(list(self))
+
+    def __iter__(self: Self[_T]) -> Iterator[_T]:
+        return self.values()
+
+    def __reversed__(self: Self[_T]) -> Iterator[_T]:
+        return self.values(True)
+
+    def values(self: Self[_T], _reverse: bool = False) -> Iterator[_T]:
+        'iterate over values chunk by chunk'
+        version = self._version
+        if _reverse:
+            for node in reversed(list(self.nodes())):
+                for _v in reversed(node.values):
+                    yield _v
+                    if self._version != version:
+                        raise RuntimeError('list mutated during iteration')
+            return
+        node = self.head.next
+        while node is not None:
+            for _v in node.values:
+                yield _v
+                if self._version != version:
+                    raise RuntimeError('list mutated during iteration')
+            node = node.next
+
+    def nodes(self: Self[_T]) -> Iterator[Node[_T]]:
+        'iterate over chunk nodes'
+        node = self.head.next
+        while node is not None:
+            yield node
+            node = node.next
+
+    def __sizeof__(self: Self[_T]) -> int:
+        return sys.getsizeof(self.head) + sum([sys.getsizeof(_n) + sys.getsizeof(_n.values) for _n in self.nodes()])
+
+    def memory_stats(self: Self[_T], deep: bool = False, unique: bool = True) -> MemoryStats:
+        'return chunk node, sentinel and payload bytes from one pass over the chunks, typed chunks hold their payload inline in the node bytes'
+        payload = PayloadCounter(deep, unique)
+        count = node_bytes = 0
+        for node in self.nodes():
+            count += 1
+            node_bytes += sys.getsizeof(node) + sys.getsizeof(node.values)
+            if self.typecode is None:
+                for value in node.values:
+                    payload.add(value)
+        return MemoryStats(count, node_bytes, sys.getsizeof(self.head) + sys.getsizeof(self.head.values), 0, payload.bytes)
+
+    def __len__(self: Self[_T]) -> int:
+        if self.debug and self._len != self._count():
+            raise AssertionError(f'cached length {self._len} does not match value count {self._count()}')
+        return self._len
+
+    def _count(self: Self[_T]) -> int:
+        'count values by walking the whole chain'
+        return sum([len(_n.values) for _n in self.nodes()])
+
+    def _locate(self: Self[_T], _index: int) -> tuple[Node[_T] | Node[None], Node[_T], int]:
+        'return previous node, node and offset holding index, 0 <= index < len'
+        start = self._len - len(self.tail.values)
+        if start <= _index:
+            return self.head if self.tail is self.head.next else None, self.tail, _index - start
+        prev, node = self.head, self.head.next
+        while len(node.values) <= _index:
+            _index -= len(node.values)
+            prev, node = node, node.next
+        return prev, node, _index
+
+    def _position(self: Self[_T], _index: int) -> int:
+        if _index < 0:
+            _index += self._len
+        if not 0 <= _index < self._len:
+            raise IndexError('list index out of range')
+        return _index
+
+    def index(self: Self[_T], _value: _T, _start: int = 0, _stop: int | None = None) -> int:
+        'return first index of value, searching chunk by chunk and skipping whole chunks before start'
+        start, stop, _ = slice(_start, _stop).indices(self._len)
+        base = 0
+        for node in self.nodes():
+            if stop <= base:
+                break
+            _len = len(node.values)
+            if start < base + _len:
+                try:
+                    return base + node.values.index(_value, max(start - base, 0), min(stop - base, _len))
+                except ValueError:
+                    pass
+            base += _len
+        raise ValueError(f'{_value!r} is not in list')
+
+    def count(self: Self[_T], _value: Any) -> int:
+        'return number of occurrences of value, counting chunk by chunk'
+        return sum([_n.values.count(_value) for _n in self.nodes()])
+
+    @overload
+    def __getitem__(self: Self[_T], __i: int) -> _T: ...
+    @overload
+    def __getitem__(self: Self[_T], __s: slice) -> Self[_T]: ...
+
+    def __getitem__(self: Self[_T], _index: int | slice) -> _T | Self[_T]:
+        if isinstance(_index, int):
+            _, node, offset = self._locate(self._position(_index))
+            return node.values[offset]
+        elif isinstance(_index, slice):
+            return type(self)(list(self)[_index], capacity=self.capacity, typecode=self.typecode)
+        else:
+            raise TypeError(f'index must be integers or slices, not {type(_index)}')
+
+    @overload
+    def __setitem__(self: Self[_T], __i: int, __v: _T) -> None: ...
+    @overload
+    def __setitem__(self: Self[_T], __s: slice, __o: Iterable[_T]) -> None: ...
+
+    def __setitem__(self: Self[_T], _index: int | slice, _value: _T | Iterable[_T]) -> None:
+        if isinstance(_index, int):
+            _, node, offset = self._locate(self._position(_index))
+            node.values[offset] = _value
+        elif isinstance(_index, slice):
+            if not isinstance(_value, Iterable):
+                raise TypeError('can only assign an iterable')
+            values = list(self)
+            values[_index] = _value
+            self._rebuild(values)
+        else:
+            raise TypeError(f'index must be integers or slices, not {type(_index)}')
+
+    @overload
+    def __delitem__(self: Self[_T], __i: int) -> None: ...
+    @overload
+    def __delitem__(self: Self[_T], __s: slice) -> None: ...
+
+    def __delitem__(self: Self[_T], _index: int | slice) -> None:
+        if isinstance(_index, int):
+            prev, node, offset = self._locate(self._position(_index))
+            del node.values[offset]
+            self._len -= 1
+            self._version += 1
+            if not node.values:
+                if prev is None:
+                    prev = self.head
+                    while prev.next is not node:
+                        prev = prev.next
+                prev.next = node.next
+                if node is self.tail:
+                    self.tail = prev
+            elif len(node.values) < self.capacity // 2 and node.next is not None \
+                    and len(node.values) + len(node.next.values) <= self.capacity:
+                node.values.extend(node.next.values)
+                if node.next is self.tail:
+                    self.tail = node
+                node.next = node.next.next
+        elif isinstance(_index, slice):
+            values = list(self)
+            del values[_index]
+            self._rebuild(values)
+        else:
+            raise TypeError(f'index must be integers or slices, not {type(_index)}')
+
+    def _rebuild(self: Self[_T], _values: Iterable[_T]) -> None:
+        self.clear()
+        for _v in _values:
+            self.append(_v)
+
+    def insert(self: Self[_T], _index: int, _value: _T) -> None:
+        'insert value before index'
+        _index = max(_index + self._len, 0) if _index < 0 else min(_index, self._len)
+        if _index == self._len:
+            self.append(_value)
+            return
+        _, node, offset = self._locate(_index)
+        if len(node.values) >= self.capacity:
+            half = len(node.values) // 2
+            node.next = Node(self._chunk(node.values[half:]), node.next)
+            del node.values[half:]
+            if node is self.tail:
+                self.tail = node.next
+            if half < offset:
+                node, offset = node.next, offset - half
+        node.values.insert(offset, _value)
+        self._len += 1
+        self._version += 1
+
+    def append(self: Self[_T], _value: _T) -> None:
+        'append value to the end of the sequence'
+        if self.tail is self.head or len(self.tail.values) >= self.capacity:
+            self.tail.next = Node(self._chunk())
+            self.tail = self.tail.next
+        self.tail.values.append(_value)
+        self._len += 1
+        self._version += 1
+
+    def clear(self: Self[_T]) -> None:
+        'remove all values'
+        self.head.next = None
+        self.tail = self.head
+        self._len = 0
+        self._version += 1
+
+    def reverse(self: Self[_T]) -> None:
+        'reverse the list'
+        self._version += 1
+        prev = None
+        node = self.head.next
+        if node is not None:
+            self.tail = node
+        while node is not None:
+            node.values.reverse()
+            _next = node.next
+            node.next = prev
+            prev = node
+            node = _next
+        self.head.next = prev
@@ -0,0 +1,57 @@
+'''value index module'''
+from __future__ import annotations
+import sys
+from typing import Any, Iterable
+
+
+class ValueIndex:
+    'value index class, maps every hashable value of a node chain to the nodes holding it'
+    __slots__ = ('nodes', 'stale', )
+
+    def __init__(self) -> None:
+        self.nodes: dict[Any, dict[int, Any]] = {}
+        self.stale = True
+
+    def __sizeof__(self) -> int:
+        return object.__sizeof__(self) + sys.getsizeof(self.nodes) + sum([sys.getsizeof(_b) for _b in self.nodes.values()])
+
+    def invalidate(self) -> None:
+        'drop every entry, the index is rebuilt on the next lookup'
+        self.nodes = {}
+        self.stale = True
+
+    def build(self, _nodes: Iterable[Any]) -> None:
+        'index every node of the chain in one pass'
+        self.nodes = {}
+        self.stale = False
+        for node in _nodes:
+            self.add(node)
+
+    def add(self, _node: Any) -> None:
+        'index a node that was just linked or given a new value'
+        if self.stale:
+            return
+        try:
+            self.nodes.setdefault(_node.value, {})[id(_node)] = _node
+        except TypeError:
+            pass
+
+    def discard(self, _node: Any) -> None:
+        'forget a node that is about to be unlinked or given a new value'
+        if self.stale:
+            return
+        try:
+            bucket = self.nodes.get(_node.value)
+        except TypeError:
+            return
+        if bucket is not None:
+            bucket.pop(id(_node), None)
+            if not bucket:
+                del self.nodes[_node.value]
+
+    def get(self, _value: Any) -> dict[int, Any] | None:
+        'return the nodes holding value keyed by their id, or None when value is unhashable'
+        try:
+            return self.nodes.get(_value, {})
+        except TypeError:
+            return None
@@ -0,0 +1,84 @@
+'''value proxy module'''
+from __future__ import annotations
+import operator
+from typing import Any, Callable
+
+
+def _unwrap(_other: Any) -> Any:
+    return _other.value if isinstance(_other, ValueProxy) else _other
+
+
+def _forward(func: Callable) -> Callable:
+    def wrapper(self: ValueProxy, *args: Any) -> Any:
+        return func(self.value, *[_unwrap(_arg) for _arg in args])
+    return wrapper
+
+
+def _reflect(func: Callable) -> Callable:
+    def wrapper(self: ValueProxy, _other: Any) -> Any:
+        return func(_unwrap(_other), self.value)
+    return wrapper
+
+
+class ValueProxy:
+    'value proxy class, forwards comparison and arithmetic to the value attribute'
+    __slots__ = ()
+    value: Any
+
+    __lt__ = _forward(operator.lt)
+    __le__ = _forward(operator.le)
+    __eq__ = _forward(operator.eq)
+    __ne__ = _forward(operator.ne)
+    __gt__ = _forward(operator.gt)
+    __ge__ = _forward(operator.ge)
+    __hash__ = None
+
+    __add__ = _forward(operator.add)
+    __sub__ = _forward(operator.sub)
+    __mul__ = _forward(operator.mul)
+    __matmul__ = _forward(operator.matmul)
+    __truediv__ = _forward(operator.truediv)
+    __floordiv__ = _forward(operator.floordiv)
+    __mod__ = _forward(operator.mod)
+    __divmod__ = _forward(divmod)
+    __pow__ = _forward(pow)
+    __lshift__ = _forward(operator.lshift)
+    __rshift__ = _forward(operator.rshift)
+    __and__ = _forward(operator.and_)
+    __xor__ = _forward(operator.xor)
+    __or__ = _forward(operator.or_)
+
+    __radd__ = _reflect(operator.add)
+    __rsub__ = _reflect(operator.sub)
+    __rmul__ = _reflect(operator.mul)
+    __rmatmul__ = _reflect(operator.matmul)
+    __rtruediv__ = _reflect(operator.truediv)
+    __rfloordiv__ = _reflect(operator.floordiv)
+    __rmod__ = _reflect(operator.mod)
+    __rdivmod__ = _reflect(divmod)
+    __rpow__ = _reflect(pow)
+    __rlshift__ = _reflect(operator.lshift)
+    __rrshift__ = _reflect(operator.rshift)
+    __rand__ = _reflect(operator.and_)
+    __rxor__ = _reflect(operator.xor)
+    __ror__ = _reflect(operator.or_)
+
+    __neg__ = _forward(operator.neg)
+    __pos__ = _forward(operator.pos)
+    __abs__ = _forward(abs)
+    __invert__ = _forward(operator.invert)
+    __round__ = _forward(round)
+    __int__ = _forward(int)
+    __float__ = _forward(float)
+    __complex__ = _forward(complex)
+    __index__ = _forward(operator.index)
+    __bool__ = _forward(bool)
+
+    __len__ = _forward(len)
+    __iter__ = _forward(iter)
+    __contains__ = _forward(operator.contains)
+    __getitem__ = _forward(operator.getitem)
+
+    __repr__ = _forward(repr)
+    __str__ = _forward(str)
+    __format__ = _forward(format)
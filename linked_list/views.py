@@ -0,0 +1,144 @@
+'''linked list views module'''
+from __future__ import annotations
+from typing import Any, Generic, TypeVar, Iterable, Iterator, MutableSequence, overload, Self
+
+_T = TypeVar('_T')
+
+
+class ReversedView(MutableSequence[Any], Generic[_T]):
+    'reversed view class, presents a doubly linked list back to front without copying it'
+    __slots__ = ('_list', )
+
+    def __init__(self: Self[_T], _list: MutableSequence[Any]) -> None:
+        self._list = _list
+
+    def __repr__(self: Self[_T]) -> str:
+        return repr(list(self._list.values(True)))
+
+    def __len__(self: Self[_T]) -> int:
+        return len(self._list)
+
+    def __iter__(self: Self[_T]) -> Iterator[Any]:
+        return reversed(self._list)
+
+    def __reversed__(self: Self[_T]) -> Iterator[Any]:
+        return iter(self._list)
+
+    def values(self: Self[_T], _reverse: bool = False) -> Iterator[_T]:
+        'iterate over node values instead of nodes'
+        return self._list.values(not _reverse)
+
+    def _mirror(self: Self[_T], _index: int | slice) -> int | slice:
+        if isinstance(_index, int):
+            return -1 - _index
+        elif isinstance(_index, slice):
+            _n = len(self._list)
+            _range = range(_n)[_index]
+            if not _range:
+                return slice(0, 0)
+            start, last = _n - 1 - _range[0], _n - 1 - _range[-1]
+            stop = last - _range.step
+            return slice(start, stop if stop >= 0 else None, -_range.step)
+        else:
+            raise TypeError(f'index must be integers or slices, not {type(_index)}')
+
+    @overload
+    def __getitem__(self: Self[_T], __i: int) -> Any: ...
+    @overload
+    def __getitem__(self: Self[_T], __s: slice) -> MutableSequence[Any]: ...
+
+    def __getitem__(self: Self[_T], _index: int | slice) -> Any:
+        return self._list[self._mirror(_index)]
+
+    @overload
+    def __setitem__(self: Self[_T], __i: int, __v: _T) -> None: ...
+    @overload
+    def __setitem__(self: Self[_T], __s: slice, __o: Iterable[_T]) -> None: ...
+
+    def __setitem__(self: Self[_T], _index: int | slice, _value: _T | Iterable[_T]) -> None:
+        if isinstance(_index, slice) and _index.step in (None, 1):
+            if not isinstance(_value, Iterable):
+                raise TypeError('can only assign an iterable')
+            _n = len(self._list)
+            start, stop, _ = _index.indices(_n)
+            self._list[_n - max(start, stop):_n - start] = list(_value)[::-1]
+        else:
+            self._list[self._mirror(_index)] = _value
+
+    def __delitem__(self: Self[_T], _index: int | slice) -> None:
+        del self._list[self._mirror(_index)]
+
+    def insert(self: Self[_T], _index: int, _value: _T) -> None:
+        'insert value before index'
+        _n = len(self._list)
+        if _index < 0:
+            _index = max(_index + _n, 0)
+        self._list.insert(_n - min(_index, _n), _value)
+
+    def reverse(self: Self[_T]) -> None:
+        'reverse the underlying list'
+        self._list.reverse()
+
+
+class NodeView(Generic[_T]):
+    'node view class, a lazy window of consecutive nodes bounded by its first and last node'
+    __slots__ = ('_list', '_first', '_last', '_len', '_version', )
+
+    def __init__(self: Self[_T], _list: MutableSequence[Any], _first: Any, _last: Any, _len: int) -> None:
+        self._list = _list
+        self._first = _first
+        self._last = _last
+        self._len = _len
+        self._version = _list._version
+
+    def _check(self: Self[_T]) -> None:
+        if self._list._version != self._version:
+            raise RuntimeError('list mutated after the view was created')
+
+    def __repr__(self: Self[_T]) -> str:
+        return f'{type(self).__name__}({self.to_list()!r})'
+
+    def __len__(self: Self[_T]) -> int:
+        self._check()
+        return self._len
+
+    def __iter__(self: Self[_T]) -> Iterator[Any]:
+        return self._iter()
+
+    def __reversed__(self: Self[_T]) -> Iterator[Any]:
+        return self._iter(_reverse=True)
+
+    def values(self: Self[_T], _reverse: bool = False) -> Iterator[_T]:
+        'iterate over node values instead of nodes'
+        return self._iter(_reverse, True)
+
+    def _iter(self: Self[_T], _reverse: bool = False, _values: bool = False) -> Iterator[Any]:
+        self._check()
+        if _reverse and not hasattr(self._last, 'prev'):
+            nodes = list(self._iter())
+            for node in reversed(nodes):
+                yield node.value if _values else node
+                self._check()
+            return
+        node = self._last if _reverse else self._first
+        for _i in range(self._len):
+            if _i:
+                node = node.prev if _reverse else node.next
+            yield node.value if _values else node
+            self._check()
+
+    @property
+    def first(self: Self[_T]) -> Any:
+        '''first node of the view, None when empty'''
+        self._check()
+        return self._first
+
+    @property
+    def last(self: Self[_T]) -> Any:
+        '''last node of the view, None when empty'''
+        self._check()
+        return self._last
+
+    def to_list(self: Self[_T]) -> list[_T]:
+        'copy the values of the view into a list'
+        return list(self.values())